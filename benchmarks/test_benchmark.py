@@ -252,3 +252,882 @@ def test_table_render_styled_cells(benchmark):
 def test_table_calculate_max_widths(benchmark):
     """Benchmark the column-width computation step in isolation."""
     benchmark(TablePromptResponse._calculate_max_widths, _LARGE_TABLE_DATA)
+
+
+# ---------------------------------------------------------------------------
+# MarkupCache  — repeated templates served from the compiled-markup LRU
+# ---------------------------------------------------------------------------
+
+
+def test_parse_markup_complex_cached(benchmark):
+    """Same complex markup parsed repeatedly; every call after the first is a cache hit."""
+    parse_style_markup(MARKUP_COMPLEX)
+    benchmark(parse_style_markup, MARKUP_COMPLEX)
+
+
+def test_parse_markup_complex_uncached(benchmark):
+    """Same complex markup with the cache disabled, for comparison."""
+    from wexample_prompt.common.markup_cache import MarkupCache
+
+    cache = MarkupCache.shared()
+    cache.enabled = False
+    try:
+        benchmark(parse_style_markup, MARKUP_COMPLEX)
+    finally:
+        cache.enabled = True
+
+
+# ---------------------------------------------------------------------------
+# MarkupTemplate  — per-call slot fill instead of parsing a fresh f-string
+# ---------------------------------------------------------------------------
+
+_ROWS_TEMPLATE_SKELETON = "@color:cyan{%s} processed @bold{%d} rows"
+
+
+def test_template_fill_varying_values(benchmark):
+    """Bind changing values into a pre-parsed template and build segments."""
+    from itertools import count
+
+    from wexample_prompt.common.markup_template import MarkupTemplate
+
+    template = MarkupTemplate(skeleton=_ROWS_TEMPLATE_SKELETON)
+    counter = count()
+    benchmark(lambda: parse_style_markup(template.bind("table", next(counter))))
+
+
+def test_fstring_parse_varying_values(benchmark):
+    """Same output built from f-strings; every call is a cache miss."""
+    from itertools import count
+
+    counter = count()
+    benchmark(
+        lambda: parse_style_markup(
+            f"@color:cyan{{table}} processed @bold{{{next(counter)}}} rows"
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Markup engines  — single-pass tokenizer vs regex + recursion, large inputs
+# ---------------------------------------------------------------------------
+
+_MARKUP_10KB = (MARKUP_COMPLEX + "\n") * (10_000 // (len(MARKUP_COMPLEX) + 1))
+_MARKUP_1MB = (MARKUP_LONG + "\n") * (1_000_000 // (len(MARKUP_LONG) + 1))
+
+
+@pytest.fixture(params=["tokenizer", "regex"])
+def markup_engine(request):
+    from wexample_prompt.common.style_markup_parser import set_style_markup_engine
+    from wexample_prompt.enums.style_markup_engine import StyleMarkupEngine
+
+    previous = set_style_markup_engine(StyleMarkupEngine(request.param))
+    yield request.param
+    set_style_markup_engine(previous)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [MARKUP_SIMPLE, MARKUP_COMPLEX, MARKUP_LONG],
+    ids=["simple", "complex", "long"],
+)
+def test_engine_parse_markup(benchmark, markup_engine, text):
+    """Engine cost on the standard markup cases, bypassing the compiled cache."""
+    from wexample_prompt.common.style_markup_parser import _parse_style_markup_uncached
+
+    benchmark(_parse_style_markup_uncached, text, None, ())
+
+
+def test_engine_parse_markup_10kb(benchmark, markup_engine):
+    """~10 KB multi-line markup document (too large for the compiled cache)."""
+    benchmark(parse_style_markup, _MARKUP_10KB)
+
+
+def test_engine_parse_markup_1mb(benchmark, markup_engine):
+    """~1 MB markup document."""
+    benchmark.pedantic(parse_style_markup, args=(_MARKUP_1MB,), rounds=3, iterations=1)
+
+
+# ---------------------------------------------------------------------------
+# Plain-text fast path  — markup-free vs markup input through each factory
+# ---------------------------------------------------------------------------
+
+_PLAIN_ITEMS = [f"item number {i} with plain text" for i in range(20)]
+_MARKUP_ITEMS = [f"item @color:cyan{{number {i}}} with markup" for i in range(20)]
+_PLAIN_TABLE_DATA = [[f"item {r}", f"{r * 10}", f"desc {r}"] for r in range(10)]
+_PLAIN_TREE = {f"key {i}": {f"child {j}": f"value {j}" for j in range(3)} for i in range(5)}
+_MARKUP_TREE = {
+    f"@bold{{key {i}}}": {f"child {j}": f"@red{{value {j}}}" for j in range(3)}
+    for i in range(5)
+}
+
+
+@pytest.mark.parametrize("text", [PLAIN_TEXT, MARKUP_SIMPLE], ids=["plain", "markup"])
+def test_split_line_create_from_string(benchmark, text):
+    """create_from_string on markup-free vs markup text."""
+    benchmark(PromptResponseLine.create_from_string, text)
+
+
+@pytest.mark.parametrize("text", [PLAIN_TEXT, MARKUP_SIMPLE], ids=["plain", "markup"])
+def test_split_flatten_style_markup(benchmark, text):
+    """flatten_style_markup on markup-free vs markup text."""
+    benchmark(flatten_style_markup, text, joiner=None)
+
+
+@pytest.mark.parametrize(
+    "rows", [_PLAIN_TABLE_DATA, _STYLED_TABLE_DATA], ids=["plain", "markup"]
+)
+def test_split_table_render(benchmark, rows):
+    """Full table render (widths recomputed) with plain vs styled cells."""
+
+    def build_and_render():
+        return TablePromptResponse.create_table(data=rows).render(CTX_WIDE)
+
+    benchmark(build_and_render)
+
+
+@pytest.mark.parametrize("items", [_PLAIN_ITEMS, _MARKUP_ITEMS], ids=["plain", "markup"])
+def test_split_list_create(benchmark, items):
+    """ListPromptResponse.create_list with plain vs markup items."""
+    from wexample_prompt.responses.data.list_prompt_response import ListPromptResponse
+
+    benchmark(ListPromptResponse.create_list, items)
+
+
+@pytest.mark.parametrize("data", [_PLAIN_TREE, _MARKUP_TREE], ids=["plain", "markup"])
+def test_split_tree_render(benchmark, data):
+    """TreePromptResponse render (rebuilds lines) with plain vs markup keys/values."""
+    from wexample_prompt.responses.data.tree_prompt_response import TreePromptResponse
+
+    response = TreePromptResponse.create_tree(data=data)
+    benchmark(response.render, CTX_WIDE)
+
+
+# ---------------------------------------------------------------------------
+# Interned styles  — shared SegmentStyle prefix vs rebuilding it per segment
+# ---------------------------------------------------------------------------
+
+_STYLED_LINE_MARKUP = " ".join(
+    f"@color:{color}+bold+underline{{cell {i}}}" for i, color in enumerate(
+        ["red", "green", "blue", "yellow", "cyan"] * 20
+    )
+)
+
+
+def test_style_build_prefix(benchmark):
+    """ColorManager.build_prefix for a color + two styles (interned lookup)."""
+    styles = [TextStyle.BOLD, TextStyle.UNDERLINE]
+    benchmark(ColorManager.build_prefix, color=TerminalColor.RED, styles=styles)
+
+
+def test_style_render_styled_line(benchmark):
+    """Render a 100-segment line where every segment carries color + styles."""
+    line = PromptResponseLine.create_from_string(_STYLED_LINE_MARKUP)[0]
+    benchmark(line.render, CTX_WIDE)
+
+
+def test_style_parse_styled_line(benchmark):
+    """Parse 100 styled directives (segments share style tuples, no copies)."""
+    from wexample_prompt.common.style_markup_parser import _parse_style_markup_uncached
+
+    benchmark(_parse_style_markup_uncached, _STYLED_LINE_MARKUP, None, ())
+
+
+# ---------------------------------------------------------------------------
+# Slotted segments/lines  — 1M constructions, time and tracemalloc memory,
+# against an attrs BaseClass equivalent of the previous classes
+# ---------------------------------------------------------------------------
+
+_MILLION = 1_000_000
+
+
+def _make_attrs_reference_classes():
+    from wexample_helpers.classes.base_class import BaseClass
+    from wexample_helpers.classes.field import public_field
+    from wexample_helpers.decorator.base_class import base_class
+
+    @base_class
+    class AttrsSegment(BaseClass):
+        color: TerminalColor | None = public_field(default=None, description="")
+        styles: tuple = public_field(factory=tuple, converter=tuple, description="")
+        text: str = public_field(description="")
+
+        def __attrs_post_init__(self) -> None:
+            if "\n" in self.text:
+                raise ValueError("Segment should not contain line breaks")
+
+    @base_class
+    class AttrsLine(BaseClass):
+        segments: list = public_field(factory=list, description="")
+
+    return AttrsSegment, AttrsLine
+
+
+_ATTRS_SEGMENT, _ATTRS_LINE = _make_attrs_reference_classes()
+_SEGMENT_CLASSES = {
+    "slots": (PromptResponseSegment, PromptResponseLine),
+    "attrs": (_ATTRS_SEGMENT, _ATTRS_LINE),
+}
+
+
+def _build_million(segment_cls, line_cls) -> list:
+    styles = (TextStyle.BOLD,)
+    red = TerminalColor.RED
+    # 1M segments grouped in 4-segment lines.
+    return [
+        line_cls(
+            segments=[
+                segment_cls(text="cell", color=red, styles=styles),
+                segment_cls(text=" | "),
+                segment_cls(text="value", color=red),
+                segment_cls(text=" "),
+            ]
+        )
+        for _ in range(_MILLION // 4)
+    ]
+
+
+@pytest.mark.parametrize("kind", ["slots", "attrs"])
+def test_segments_construct_1m(benchmark, kind):
+    """Construction time for 1M segments (250k lines)."""
+    import tracemalloc
+
+    segment_cls, line_cls = _SEGMENT_CLASSES[kind]
+
+    tracemalloc.start()
+    try:
+        lines = _build_million(segment_cls, line_cls)
+        benchmark.extra_info["traced_bytes"] = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del lines
+
+    benchmark.pedantic(
+        _build_million, args=(segment_cls, line_cls), rounds=3, iterations=1
+    )
+
+
+# ---------------------------------------------------------------------------
+# Render cache  — re-rendering an unchanged response with the same context
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(params=[True, False], ids=["cached", "uncached"])
+def render_cache_enabled(request):
+    from wexample_prompt.common.render_cache import RenderCache
+
+    cache = RenderCache.shared()
+    previous = cache.enabled
+    cache.enabled = request.param
+    yield request.param
+    cache.enabled = previous
+
+
+def test_render_cache_rerender(benchmark, render_cache_enabled):
+    """Render the same 50-line styled response again and again."""
+    from wexample_prompt.responses.messages.info_prompt_response import (
+        InfoPromptResponse,
+    )
+
+    response = InfoPromptResponse.create_info(
+        message="\n".join(f"row {i}: {MARKUP_SIMPLE}" for i in range(50))
+    )
+    benchmark(response.render, CTX_WIDE)
+
+
+# ---------------------------------------------------------------------------
+# Cached context  — per-line indentation work on a nested, colored context
+# ---------------------------------------------------------------------------
+
+_CTX_NESTED = PromptContext(
+    parent_context=PromptContext(
+        parent_context=PromptContext(indentation_text_color=TerminalColor.BLUE),
+        indentation=None,
+        indentation_character=None,
+    ),
+    indentation=None,
+    indentation_character=None,
+    colorized=True,
+    formatting=True,
+    width=120,
+)
+
+
+def test_context_render_indentation(benchmark):
+    """Colored indentation of a context nested two levels deep."""
+    benchmark(_CTX_NESTED.render_indentation)
+
+
+def test_context_line_render_nested(benchmark):
+    """Render a short line in the nested context (indentation + content width)."""
+    line = PromptResponseLine.create_from_string(MARKUP_SIMPLE)[0]
+    benchmark(line.render, _CTX_NESTED)
+
+
+# ---------------------------------------------------------------------------
+# Context interning  — 100k io.info() calls with and without shared contexts
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("intern_contexts", [True, False], ids=["interned", "fresh"])
+def test_io_info_100k(benchmark, intern_contexts):
+    """100k io.info() calls into a buffer output handler."""
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    def run():
+        io = IoManager(
+            output=PromptBufferOutputHandler(), intern_contexts=intern_contexts
+        )
+        for i in range(100_000):
+            io.info("processed item")
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+# ---------------------------------------------------------------------------
+# Buffered stdout  — 10k log lines written to a real file descriptor
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("buffered", [True, False], ids=["buffered", "direct"])
+def test_stdout_10k_lines(benchmark, monkeypatch, buffered):
+    """10k io.log() calls with stdout pointing at /dev/null (one syscall per flush)."""
+    import os
+    import sys
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffered_stdout_output_handler import (
+        PromptBufferedStdoutOutputHandler,
+    )
+    from wexample_prompt.output.prompt_stdout_output_handler import (
+        PromptStdoutOutputHandler,
+    )
+
+    devnull = open(os.devnull, "w")
+    monkeypatch.setattr(sys, "stdout", devnull)
+    output = (
+        PromptBufferedStdoutOutputHandler()
+        if buffered
+        else PromptStdoutOutputHandler()
+    )
+    io = IoManager(output=output)
+
+    def run():
+        for i in range(10_000):
+            io.log("streamed log line")
+        io.flush()
+
+    try:
+        benchmark.pedantic(run, rounds=3, iterations=1)
+    finally:
+        devnull.close()
+
+
+# ---------------------------------------------------------------------------
+# TTY-aware output  — per-line cost when piped (plain) versus on a terminal
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("colorized", [True, False], ids=["tty", "piped"])
+def test_tty_aware_io_info_line(benchmark, colorized):
+    """One styled io.info() line, as resolved for a terminal or for a pipe."""
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler(), colorized=colorized)
+
+    def run():
+        io.info(MARKUP_SIMPLE)
+        io.output.clear()
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("colorized", [True, False], ids=["tty", "piped"])
+def test_tty_aware_line_render(benchmark, colorized):
+    """Render a styled 100-segment line with a colorized or plain context."""
+    line = PromptResponseLine.create_from_string(_STYLED_LINE_MARKUP)[0]
+    benchmark(line.render, PromptContext(colorized=colorized, width=2000))
+
+
+# ---------------------------------------------------------------------------
+# Async output  — caller-side cost of 1k io.log() against a slow writer
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("asynchronous", [True, False], ids=["async", "sync"])
+def test_async_output_caller_latency(benchmark, asynchronous):
+    """1k io.log() calls while each write takes 0.2ms; async drains outside the timing."""
+    import time
+
+    from wexample_helpers.decorator.base_class import base_class
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    @base_class
+    class SlowBufferOutputHandler(PromptBufferOutputHandler):
+        def print(self, response, context=None):
+            time.sleep(0.0002)
+            return super().print(response=response, context=context)
+
+    slow = SlowBufferOutputHandler()
+    output = AsyncPromptOutputHandler(handler=slow) if asynchronous else slow
+    io = IoManager(output=output)
+
+    def setup():
+        output.flush()
+
+    def run():
+        for i in range(1_000):
+            io.log("streamed log line")
+
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
+    output.flush()
+    if asynchronous:
+        output.close()
+
+
+# ---------------------------------------------------------------------------
+# Verbosity pre-check  — filtered-out io.debug() calls
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_filtered_debug_call(benchmark, lazy):
+    """io.debug() above the context verbosity: returned, never rendered.
+
+    A lazy message is not evaluated, the eager one is built in full.
+    """
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+    state = {"rows": list(range(200))}
+
+    if lazy:
+        benchmark(
+            lambda: io.debug(lambda: repr(state), verbosity=VerbosityLevel.MAXIMUM)
+        )
+    else:
+        benchmark(lambda: io.debug(repr(state), verbosity=VerbosityLevel.MAXIMUM))
+
+
+# ---------------------------------------------------------------------------
+# Prompt trace  — encode / decode / replay a 100k-response capture
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def trace_100k():
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    responses = []
+    for i in range(100_000):
+        response = LogPromptResponse.create_log(
+            message=f"step {i}: @color:cyan{{worker}} finished @bold{{ok}}"
+        )
+        response.created_at = float(i)
+        responses.append(response)
+    return responses
+
+
+@pytest.fixture(scope="module")
+def trace_100k_encoded(trace_100k):
+    import io
+
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+
+    stream = io.StringIO()
+    PromptTraceWriter(stream=stream).write_all(trace_100k)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("codec", ["trace", "pickle"])
+def test_trace_encode_100k(benchmark, trace_100k, codec):
+    """Serialize 100k recorded responses (compact JSONL trace vs pickle)."""
+    import io
+    import pickle
+
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+
+    def run():
+        if codec == "pickle":
+            return len(pickle.dumps(trace_100k))
+        stream = io.StringIO()
+        PromptTraceWriter(stream=stream).write_all(trace_100k)
+        return len(stream.getvalue())
+
+    size = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["bytes"] = size
+
+
+@pytest.mark.parametrize("codec", ["trace", "pickle"])
+def test_trace_decode_100k(benchmark, trace_100k, trace_100k_encoded, codec):
+    """Deserialize 100k recorded responses (streamed JSONL trace vs pickle)."""
+    import io
+    import pickle
+
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+
+    pickled = pickle.dumps(trace_100k)
+
+    def run():
+        if codec == "pickle":
+            return len(pickle.loads(pickled))
+        return sum(1 for _ in PromptTraceReader(stream=io.StringIO(trace_100k_encoded)))
+
+    assert benchmark.pedantic(run, rounds=3, iterations=1) == 100_000
+
+
+def test_trace_replay_100k(benchmark, trace_100k_encoded):
+    """Decode and re-render a 100k-response trace at width 60."""
+    import io
+
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.common.prompt_trace_replayer import PromptTraceReplayer
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    def run():
+        output = PromptBufferOutputHandler()
+        return PromptTraceReplayer(output=output, width=60, colorized=True).replay(
+            PromptTraceReader(stream=io.StringIO(trace_100k_encoded))
+        )
+
+    assert benchmark.pedantic(run, rounds=3, iterations=1) == 100_000
+
+
+# ---------------------------------------------------------------------------
+# Queue output  — worker processes forwarding records to a parent aggregator
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("batch_size", [1, 256])
+def test_queue_forward_10k(benchmark, batch_size):
+    """Send 10k worker log lines through a multiprocessing queue, one message
+    per record vs batched, until a reader thread has received them all."""
+    import multiprocessing
+    import threading
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    def run():
+        channel = multiprocessing.Queue()
+        received = []
+
+        def read():
+            while (message := channel.get()) is not None:
+                received.append(message)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        handler = QueueOutputHandler(
+            queue=channel, batch_size=batch_size, flush_interval=None
+        )
+        io = IoManager(output=handler)
+        for index in range(10_000):
+            io.log(f"worker message {index}")
+        handler.close()
+        channel.put(None)
+        reader.join()
+        channel.close()
+        return len(received)
+
+    benchmark.extra_info["messages"] = benchmark.pedantic(
+        run, rounds=3, iterations=1
+    )
+
+
+def test_queue_aggregate_10k(benchmark):
+    """Decode and render 10k forwarded records in the parent, with a prefix."""
+    import queue
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    handler = QueueOutputHandler(queue=channel, worker="w1", flush_interval=None)
+    worker_io = IoManager(output=handler)
+    for index in range(10_000):
+        worker_io.log(f"worker message {index}")
+    handler.close()
+    messages = []
+    while not channel.empty():
+        messages.append(channel.get())
+
+    def run():
+        aggregator = PromptQueueAggregator(
+            io=IoManager(output=PromptBufferOutputHandler(), colorized=True),
+            queue=channel,
+            prefix=True,
+        )
+        return sum(aggregator.dispatch(message) for message in messages)
+
+    assert benchmark.pedantic(run, rounds=3, iterations=1) == 10_000
+
+
+# ---------------------------------------------------------------------------
+# Live region  — many progress bars updated concurrently
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("mode", ["direct", "region"])
+def test_live_region_8_bars_1k_updates(benchmark, mode):
+    """Advance 8 progress bars 1000 times each; direct handle prints vs one
+    LiveRegion repainting at 20 fps."""
+    import contextlib
+    import io as text_io
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    def run():
+        stream = text_io.StringIO()
+        io = IoManager(colorized=True)
+        with contextlib.redirect_stdout(stream):
+            if mode == "direct":
+                handles = [
+                    io.progress(total=1000, label=f"task {index}").get_handle()
+                    for index in range(8)
+                ]
+                for _ in range(1000):
+                    for handle in handles:
+                        handle.advance(1)
+            else:
+                with io.live_region(stream=stream, interactive=True) as region:
+                    handles = [
+                        region.progress(total=1000, label=f"task {index}").get_handle()
+                        for index in range(8)
+                    ]
+                    for _ in range(1000):
+                        for handle in handles:
+                            handle.advance(1)
+        return len(stream.getvalue())
+
+    benchmark.extra_info["bytes"] = benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+# ---------------------------------------------------------------------------
+# Frame scheduler  — many concurrent spinners
+# ---------------------------------------------------------------------------
+
+
+def test_frame_scheduler_32_spinners(benchmark):
+    """Run 32 spinners for 0.5s; all of them are driven by one scheduler
+    thread (one thread per spinner before)."""
+    import contextlib
+    import io as text_io
+    import threading
+    import time
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    def run():
+        io = IoManager(colorized=False)
+        with contextlib.redirect_stdout(text_io.StringIO()):
+            spinners = [io.spinner(label=f"task {index}") for index in range(32)]
+            # Threads animating the spinners (the scheduler one).
+            threads = len(
+                [thread for thread in threading.enumerate() if thread.daemon]
+            )
+            time.sleep(0.5)
+            for spinner in spinners:
+                spinner.stop()
+        return threads
+
+    benchmark.extra_info["threads"] = benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+# ---------------------------------------------------------------------------
+# Frame diff  — bytes written per interactive frame
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("mode", ["repaint", "diff"])
+def test_choice_100_choices_200_keypresses(benchmark, monkeypatch, mode):
+    """Move the selection of a 100-choice prompt 200 times; full repaint of
+    every frame vs rewriting only the changed rows."""
+    import contextlib
+    import io as text_io
+
+    import readchar
+
+    from wexample_prompt.responses.interactive.choice_prompt_response import (
+        ChoicePromptResponse,
+    )
+
+    if mode == "repaint":
+        print_frame = ChoicePromptResponse._print_frame
+
+        def repaint(self, frames, context):
+            self._partial_clear(frames.rows)
+            frames.reset()
+            return print_frame(self, frames, context=context)
+
+        monkeypatch.setattr(ChoicePromptResponse, "_print_frame", repaint)
+
+    def run():
+        keys = iter([readchar.key.DOWN] * 200 + [readchar.key.ENTER])
+        response = ChoicePromptResponse.create_choice(
+            question="Pick one", choices=[f"choice {index}" for index in range(100)]
+        )
+        response._read_key = lambda: next(keys)
+        stream = text_io.StringIO()
+        with contextlib.redirect_stdout(stream):
+            response.render()
+        return len(stream.getvalue().encode()) // 201
+
+    benchmark.extra_info["bytes_per_frame"] = benchmark.pedantic(
+        run, rounds=3, iterations=1
+    )
+
+
+# ---------------------------------------------------------------------------
+# Choice viewport  — keypress-to-paint latency on huge option lists
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("count", [100, 10_000, 1_000_000])
+def test_choice_keypress_latency(benchmark, count):
+    """Press DOWN 100 times in a 20-row viewport; the latency per keypress
+    stays flat whatever the number of choices."""
+    import contextlib
+    import io as text_io
+    import time
+
+    import readchar
+
+    from wexample_prompt.responses.interactive.choice_prompt_response import (
+        ChoicePromptResponse,
+    )
+
+    response = ChoicePromptResponse.create_choice(
+        question="Pick one",
+        choices=[f"choice [bold]{index}[/bold]" for index in range(count)],
+        viewport_height=20,
+    )
+
+    def run():
+        keys = iter([readchar.key.DOWN] * 100 + [readchar.key.ENTER])
+        response._read_key = lambda: next(keys)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(text_io.StringIO()):
+            response.render()
+        return (time.perf_counter() - start) / 101 * 1e6
+
+    benchmark.extra_info["us_per_keypress"] = round(
+        benchmark.pedantic(run, rounds=3, iterations=1), 1
+    )
+
+
+# ---------------------------------------------------------------------------
+# Choice filter  — per-keystroke fuzzy matching on huge option lists
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+def test_choice_filter_keystroke_latency(benchmark, count):
+    """Type "module 4242" one character at a time; each keystroke only rescans
+    the titles the previous query matched."""
+    import time
+
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    titles = [f"src/module {index}/file_{index % 97}.py" for index in range(count)]
+    query = "module 4242"
+
+    def run():
+        choice_filter = ChoiceFilter(titles=titles)
+        choice_filter.match("")  # build the search keys once
+        start = time.perf_counter()
+        for end in range(1, len(query) + 1):
+            result = choice_filter.match(query[:end])
+        elapsed = time.perf_counter() - start
+        assert titles[result.indices[0]].startswith("src/module 4242/")
+        return elapsed / len(query) * 1e3
+
+    benchmark.extra_info["ms_per_keystroke"] = round(
+        benchmark.pedantic(run, rounds=3, iterations=1), 2
+    )
+
+    choice_filter = ChoiceFilter(titles=titles)
+    choice_filter.match("")
+    start = time.perf_counter()
+    choice_filter.match(query)
+    benchmark.extra_info["full_scan_ms"] = round(
+        (time.perf_counter() - start) * 1e3, 2
+    )
+
+
+# ---------------------------------------------------------------------------
+# File picker  — listing a 100k-entry directory
+# ---------------------------------------------------------------------------
+
+
+def test_file_picker_100k_entries(benchmark, tmp_path):
+    """Read a 100k-entry directory with os.scandir: first screenful, full
+    listing, then the cached listing once the directory has settled; compared
+    with the former os.listdir plus one os.path.isdir per entry."""
+    import os
+    import time
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+
+    for index in range(100_000):
+        open(tmp_path / f"file_{index}.txt", "w").close()
+    for index in range(100):
+        os.mkdir(tmp_path / f"dir_{index}")
+    path = str(tmp_path)
+
+    def listdir():
+        start = time.perf_counter()
+        dirs = [
+            name
+            for name in os.listdir(path)
+            if os.path.isdir(os.path.join(path, name))
+        ]
+        assert len(dirs) == 100
+        return time.perf_counter() - start
+
+    def run():
+        cache = DirectoryListingCache()
+        first = []
+        start = time.perf_counter()
+        listing = cache.read(
+            path,
+            on_batch=lambda dirs, files: first or first.append(time.perf_counter()),
+        )
+        assert len(listing.dirs) == 100
+        return first[0] - start, time.perf_counter() - start
+
+    first_batch, full = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["listdir_isdir_ms"] = round(listdir() * 1e3, 1)
+    benchmark.extra_info["scandir_first_batch_ms"] = round(first_batch * 1e3, 2)
+    benchmark.extra_info["scandir_full_ms"] = round(full * 1e3, 1)
+
+    os.utime(path, ns=(0, 1_000_000_000))
+    cache = DirectoryListingCache()
+    cache.read(path)
+    start = time.perf_counter()
+    assert cache.get(path) is not None
+    benchmark.extra_info["cached_ms"] = round((time.perf_counter() - start) * 1e3, 3)
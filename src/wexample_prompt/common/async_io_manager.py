@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.enums.terminal_color import TerminalColor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from wexample_helpers.const.types import Kwargs
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.abstract_prompt_output_handler import (
+        AbstractPromptOutputHandler,
+    )
+    from wexample_prompt.responses.interactive.pending_prompt_response import (
+        PendingPromptResponse,
+    )
+    from wexample_prompt.responses.interactive.screen_prompt_response import (
+        ScreenPromptResponse,
+    )
+
+
+@base_class
+class AsyncIoManager(BaseClass):
+    """Asyncio facade of an IoManager, reached with `io.aio`.
+
+    Every io method is available as a coroutine (`await io.aio.info(...)`):
+    the response is built and printed as usual, then the output transport is
+    drained. `pending()` and `screen()` run their refresh loops with
+    `asyncio.sleep` / events instead of blocking sleeps, so one loop can
+    drive many live widgets.
+
+    Writes go through the io output as it is. To write through a
+    non-blocking transport, give the io a `PromptAsyncioOutputHandler`, or
+    use `async with io.aio:`, which switches the default stdout handler to
+    one for the block and puts the previous handler back when it ends.
+    """
+
+    io: IoManager = public_field(description="The io manager the calls go to")
+    _previous_output: AbstractPromptOutputHandler | None = private_field(
+        default=None,
+        description="Output replaced by `async with`, restored when the block ends",
+    )
+
+    async def __aenter__(self) -> AsyncIoManager:
+        from wexample_prompt.output.prompt_asyncio_output_handler import (
+            PromptAsyncioOutputHandler,
+        )
+        from wexample_prompt.output.prompt_stdout_output_handler import (
+            PromptStdoutOutputHandler,
+        )
+
+        if type(self.io.output) is PromptStdoutOutputHandler:
+            self._previous_output = self.io.output
+            self.io.output = PromptAsyncioOutputHandler()
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+        if self._previous_output is not None:
+            self.io.output = self._previous_output
+            self._previous_output = None
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.io, name, None) if not name.startswith("_") else None
+        if attr is None or not callable(attr):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        async def wrapper(*args, **kwargs):
+            await self.connect()
+            result = attr(*args, **kwargs)
+            await self.drain()
+            return result
+
+        return wrapper
+
+    async def close(self) -> None:
+        """Drain and close the output transport; later writes are direct again."""
+        await self.drain()
+        close = getattr(self.io.output, "close", None)
+        if close is not None:
+            close()
+
+    async def connect(self) -> None:
+        """Open the non-blocking transport of the output handler, when it has one."""
+        connect = getattr(self.io.output, "connect", None)
+        if connect is not None:
+            await connect()
+
+    async def drain(self) -> None:
+        """Wait for the output transport to accept more data, yielding to the loop."""
+        import asyncio
+
+        drain = getattr(self.io.output, "drain", None)
+        if drain is not None:
+            await drain()
+        else:
+            await asyncio.sleep(0)
+
+    async def pending(
+        self,
+        *,
+        callback: Callable[[], Any],
+        label: str = "Waiting...",
+        interval: float = 2.0,
+        max_lines: int = 5,
+        output_color: TerminalColor | None = TerminalColor.LIGHT_BLACK,
+        reset_on_finish: bool = False,
+        verbosity: VerbosityLevel | None = None,
+        context: PromptContext | None = None,
+        **kwargs: Kwargs,
+    ) -> PendingPromptResponse:
+        """Awaitable `io.pending()`; the callback may be a coroutine function."""
+        from wexample_prompt.responses.interactive.pending_prompt_response import (
+            PendingPromptResponse,
+        )
+
+        response = PendingPromptResponse.create_pending(
+            callback=callback,
+            label=label,
+            interval=interval,
+            max_lines=max_lines,
+            output_color=output_color,
+            reset_on_finish=reset_on_finish,
+            verbosity=(
+                verbosity
+                if verbosity is not None
+                else self.io.default_response_verbosity
+            ),
+        )
+
+        return await self._run_live(
+            response=response,
+            context=PendingPromptResponse.rebuild_context_for_kwargs(
+                context=context,
+                parent_kwargs=kwargs,
+            ),
+        )
+
+    async def screen(
+        self,
+        *,
+        callback: Callable[[ScreenPromptResponse], Any],
+        height: int = 30,
+        verbosity: VerbosityLevel | None = None,
+        reset_on_finish: bool = False,
+        context: PromptContext | None = None,
+        **kwargs: Kwargs,
+    ) -> ScreenPromptResponse:
+        """Awaitable `io.screen()`; the callback may be a coroutine function."""
+        from wexample_prompt.responses.interactive.screen_prompt_response import (
+            ScreenPromptResponse,
+        )
+
+        response = ScreenPromptResponse.create_screen(
+            callback=callback,
+            height=height,
+            verbosity=(
+                verbosity
+                if verbosity is not None
+                else self.io.default_response_verbosity
+            ),
+            reset_on_finish=reset_on_finish,
+        )
+
+        return await self._run_live(
+            response=response,
+            context=ScreenPromptResponse.rebuild_context_for_kwargs(
+                context=context,
+                parent_kwargs=kwargs,
+            ),
+        )
+
+    async def write(self, text: str) -> None:
+        """Write raw text (eg. a frame with cursor moves) and drain."""
+        import sys
+
+        await self.connect()
+        write = getattr(self.io.output, "write", None)
+        if write is not None:
+            write(text)
+        else:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        await self.drain()
+
+    async def _run_live(
+        self,
+        response: PendingPromptResponse | ScreenPromptResponse,
+        context: PromptContext | None,
+    ) -> Any:
+        if not self.io.is_enabled(verbosity=response.verbosity, context=context):
+            # Filtered out like io.print_response() does.
+            return response
+
+        response.synchronized_output = self.io.synchronized_output
+        if self.io.record_response(response):
+            await response.render_async(
+                write=self.write, context=self.io.create_context(context=context)
+            )
+        return response
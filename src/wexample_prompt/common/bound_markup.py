@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+
+class BoundMarkup(str):
+    """Markup string produced by MarkupTemplate.bind().
+
+    Its value is the fully formatted markup, so it can be used anywhere a
+    message string is expected. When it reaches the markup parser untouched,
+    segments are filled from the template slots instead of being re-parsed.
+    Any string operation (concatenation, f-string) returns a plain str that
+    goes through the regular parser.
+    """
+
+    template: MarkupTemplate
+    values: tuple[str, ...]
+
+    def to_segment_lines(
+        self,
+        default_color: TerminalColor | None = None,
+        base_styles: Iterable[TextStyle] | None = None,
+    ) -> list[list[PromptResponseSegment]]:
+        from wexample_prompt.common.style_markup_parser import parse_style_markup
+
+        lines = self.template.fill(
+            self.values, default_color=default_color, base_styles=base_styles
+        )
+        if lines is None:
+            return parse_style_markup(
+                str(self), default_color=default_color, base_styles=base_styles
+            )
+        return lines
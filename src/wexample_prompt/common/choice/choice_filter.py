@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.choice.choice_filter_result import ChoiceFilterResult
+
+
+@base_class
+class ChoiceFilter(BaseClass):
+    """Fuzzy filter over choice titles, fast enough to run on every keystroke.
+
+    Titles are folded once (markup stripped, lowercase, accents removed) into
+    search keys. A query matches a key containing its characters in order;
+    contiguous matches rank first, then matches starting a word, then the
+    most compact ones, keeping only the best `limit` in a bounded heap.
+
+    When a query extends the previous one, only the titles it matched are
+    scanned again. `submit()` runs the match on a worker thread and drops it
+    as soon as a newer query arrives, so typing never waits for a scan;
+    `on_result` then receives the result of the latest query only.
+    """
+
+    CANCEL_CHECK_INTERVAL: ClassVar[int] = 4096
+    DEFAULT_LIMIT: ClassVar[int] = 1000
+    WORD_SEPARATORS: ClassVar[str] = " -_./\\:"
+    # Score tiers: any contiguous match outranks any scattered one.
+    _TIER: ClassVar[int] = 1 << 40
+
+    limit: int = public_field(
+        default=DEFAULT_LIMIT,
+        description="Maximum number of ranked matches returned for a query",
+    )
+    on_result: Callable[[ChoiceFilterResult], object] | None = public_field(
+        default=None,
+        description="Called on the worker thread with the result of each submitted "
+        "query that was not superseded",
+    )
+    titles: Sequence[str] = public_field(
+        description="Titles to filter, style markup allowed"
+    )
+    _closed: bool = private_field(default=False, description="Set by close()")
+    _condition: Any = private_field(
+        factory=threading.Condition,
+        description="Guards the pending query and wakes the worker",
+    )
+    _generation: int = private_field(
+        default=0, description="Bumped by each submit(); older scans stop early"
+    )
+    _keys: list[str] | None = private_field(
+        default=None, description="Folded search key of each title, built once"
+    )
+    _matched: tuple[str, list[int]] | None = private_field(
+        default=None,
+        description="Last completed query (folded) and every title it matched, "
+        "reused when the next query extends it",
+    )
+    _pending: str | None = private_field(
+        default=None, description="Query waiting for the worker"
+    )
+    _thread: Any = private_field(default=None, description="The worker thread")
+
+    def close(self) -> None:
+        """Stop the worker thread; a scan in progress is dropped."""
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._condition.notify()
+
+    def match(self, query: str) -> ChoiceFilterResult:
+        """Rank the titles matching `query`, on the calling thread."""
+        return self._match(query, generation=None)
+
+    def submit(self, query: str) -> None:
+        """Match `query` on the worker thread, superseding any previous query."""
+        with self._condition:
+            self._generation += 1
+            self._pending = query
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.__class__.__name__}-worker",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    @staticmethod
+    def _fold(text: str) -> str:
+        if text.isascii():
+            return text.lower()
+
+        import unicodedata
+
+        return "".join(
+            char
+            for char in unicodedata.normalize("NFKD", text)
+            if not unicodedata.combining(char)
+        ).lower()
+
+    def _get_keys(self) -> list[str]:
+        if self._keys is None:
+            from wexample_prompt.common.style_markup_parser import (
+                flatten_style_markup,
+                is_plain_text,
+            )
+
+            fold = self._fold
+            keys = []
+            for title in self.titles:
+                title = str(title)
+                if not is_plain_text(title):
+                    title = "".join(
+                        segment.text
+                        for segment in flatten_style_markup(title, joiner=None)
+                    )
+                keys.append(fold(title))
+            self._keys = keys
+        return self._keys
+
+    def _match(self, query: str, generation: int | None) -> ChoiceFilterResult | None:
+        import heapq
+        import re
+
+        from wexample_prompt.common.choice.choice_filter_result import (
+            ChoiceFilterResult,
+        )
+
+        keys = self._get_keys()
+        needle = self._fold(query).strip()
+        if not needle:
+            return ChoiceFilterResult(
+                indices=range(len(keys)), query=query, total=len(keys)
+            )
+
+        previous = self._matched
+        if previous is not None and needle.startswith(previous[0]):
+            # Titles not matching the shorter query can't match this one.
+            candidates: Sequence[int] = previous[1]
+        else:
+            candidates = range(len(keys))
+
+        # "a[^b]*b[^c]*c" finds the same in-order match as "a.*?b.*?c" but
+        # never backtracks into a run, which made rejecting a title costly.
+        chars = [re.escape(char) for char in needle]
+        scattered = re.compile(
+            chars[0] + "".join(f"[^{char}]*{char}" for char in chars[1:])
+        ).search
+        separators = self.WORD_SEPARATORS
+        tier = self._TIER
+        check_interval = self.CANCEL_CHECK_INTERVAL
+        limit = self.limit
+        heap: list[tuple[int, int]] = []
+        matched: list[int] = []
+        for count, index in enumerate(candidates):
+            if (
+                generation is not None
+                and count % check_interval == 0
+                and generation != self._generation
+            ):
+                # A newer query was submitted.
+                return None
+
+            key = keys[index]
+            # Most titles don't match: rejecting them takes a single call.
+            found = scattered(key)
+            if found is None:
+                continue
+            position = key.find(needle)
+            if position >= 0:
+                at_word_start = position == 0 or key[position - 1] in separators
+                score = (3 if at_word_start else 2) * tier - position - len(key)
+            else:
+                start, end = found.span()
+                score = -(end - start) * 64 - start - len(key)
+
+            matched.append(index)
+            # Ties go to the first title.
+            entry = (score, -index)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        self._matched = (needle, matched)
+        return ChoiceFilterResult(
+            indices=[-index for _score, index in sorted(heap, reverse=True)],
+            query=query,
+            total=len(matched),
+        )
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while self._pending is None and not self._closed:
+                    condition.wait()
+                if self._closed:
+                    self._thread = None
+                    return
+                query = self._pending
+                generation = self._generation
+                self._pending = None
+
+            result = self._match(query, generation=generation)
+            on_result = self.on_result
+            if (
+                result is not None
+                and on_result is not None
+                and generation == self._generation
+            ):
+                try:
+                    on_result(result)
+                except Exception:
+                    # A failing callback must not stop the filtering.
+                    pass
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class ChoiceFilterResult(BaseClass):
+    indices: Sequence[int] = public_field(
+        description="Indices of the best matching titles, best first (every title, "
+        "in order, for an empty query)"
+    )
+    query: str = public_field(description="The query as submitted")
+    total: int = public_field(
+        description="Number of matching titles, including those beyond the limit"
+    )
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, ClassVar
 
-from colorama import Style, init
+from colorama import Style
+
+try:
+    from colorama import just_fix_windows_console as _init_console
+except ImportError:  # colorama < 0.4.6
+    from colorama import init as _init_console
 
 from wexample_prompt.enums.terminal_bg_color import TerminalBgColor
 from wexample_prompt.enums.terminal_color import TerminalColor
@@ -16,8 +21,10 @@ if TYPE_CHECKING:
 class ColorManager:
     """Manages color application and terminal capabilities."""
 
-    # Initialize colorama when class is loaded
-    init()
+    # Enable ANSI support on Windows consoles when class is loaded. Unlike
+    # colorama's init(), this doesn't wrap sys.stdout: stripping styles for
+    # pipes is decided by IoManager (see terminal_supports_color).
+    _init_console()
     # Built once on first use to avoid reconstructing the dict on every call.
     _STYLE_CODES: ClassVar[dict | None] = None
 
@@ -29,14 +36,9 @@ class ColorManager:
         styles: list[TextStyle] | None = None,
     ) -> str:
         """Build ANSI prefix combining color and a list of TextStyle entries."""
-        prefix = ""
-        if color:
-            prefix += str(color)
-        if bg:
-            prefix += str(bg)
-        if styles:
-            prefix += "".join(cls.get_style_ansi(s) for s in styles)
-        return prefix
+        from wexample_prompt.common.segment_style import SegmentStyle
+
+        return SegmentStyle.get(color, bg, styles).prefix
 
     @classmethod
     def colorize(
@@ -50,13 +52,7 @@ class ColorManager:
         # Backward compatibility: if caller passes single style via `style`
         # (which historically reused TerminalColor entries BOLD/DIM),
         # we still honor it. New code should use `styles` and/or `bg`.
-        prefix = ""
-        if color:
-            prefix += str(color)
-        if bg:
-            prefix += str(bg)
-        if styles:
-            prefix += "".join(cls.get_style_ansi(s) for s in styles)
+        prefix = cls.build_prefix(color=color, bg=bg, styles=styles)
         if style:
             prefix += str(style)
 
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    CompiledSegment = tuple[str, TerminalColor | None, tuple[TextStyle, ...]]
+
+
+@base_class
+class CompiledMarkup(BaseClass):
+    """Immutable snapshot of a `parse_style_markup` result.
+
+    Segments are stored as plain tuples so the cached value can never be
+    mutated by a caller; `to_segments()` hands out fresh segment objects.
+    """
+
+    lines: tuple[tuple[CompiledSegment, ...], ...] = public_field(
+        description="Parsed lines, each one a tuple of (text, color, styles) entries",
+    )
+
+    @classmethod
+    def create_from_lines(
+        cls, lines: list[list[PromptResponseSegment]]
+    ) -> CompiledMarkup:
+        return cls(
+            lines=tuple(
+                tuple((seg.text, seg.color, seg.styles) for seg in line)
+                for line in lines
+            )
+        )
+
+    def to_segments(self) -> list[list[PromptResponseSegment]]:
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+
+        return [
+            [
+                PromptResponseSegment(text=text, color=color, styles=styles)
+                for text, color, styles in line
+            ]
+            for line in self.lines
+        ]
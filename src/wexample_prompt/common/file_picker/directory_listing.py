@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class DirectoryListing(BaseClass):
+    dirs: list[str] = public_field(
+        factory=list, description="Names of the subdirectories, in directory order"
+    )
+    files: list[str] = public_field(
+        factory=list,
+        description="Names of the other entries, in directory order",
+    )
+    mtime_ns: int | None = public_field(
+        default=None,
+        description="Modification time of the directory when it was read, None if "
+        "it could not be read",
+    )
+    path: str = public_field(description="Absolute path of the directory")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.file_picker.directory_listing import DirectoryListing
+
+
+@base_class
+class DirectoryListingCache(BaseClass):
+    """Bounded LRU cache of directory listings, shared through
+    DirectoryListingCache.shared().
+
+    Directories are read with os.scandir, whose entries already know their
+    type: telling subdirectories from files needs no stat per entry (except
+    for symlinks, followed like os.path.isdir does). A cached listing is
+    reused while the mtime of its directory is unchanged, which adding,
+    removing or renaming an entry updates: checking it costs one stat.
+
+    `prefetch()` reads directories on a background thread, so the next
+    picker opened on one of them finds it cached.
+    """
+
+    BATCH_SIZE: ClassVar[int] = 256
+    DEFAULT_MAX_SIZE: ClassVar[int] = 64
+    # A directory changed this recently may change again within the same
+    # mtime tick: its listing is not cached.
+    RACY_INTERVAL_NS: ClassVar[int] = 1_000_000_000
+    _shared_instance: ClassVar[DirectoryListingCache | None] = None
+
+    max_size: int = public_field(
+        default=DEFAULT_MAX_SIZE,
+        description="Maximum number of listings kept before evicting the least recently used",
+    )
+    _condition: Any = private_field(
+        factory=threading.Condition,
+        description="Guards the listings and the prefetch queue",
+    )
+    _listings: OrderedDict = private_field(
+        factory=OrderedDict,
+        description="Listings indexed by absolute directory path, in LRU order",
+    )
+    _prefetch_queue: deque = private_field(
+        factory=deque, description="Directories waiting for the prefetch thread"
+    )
+    _thread: Any = private_field(default=None, description="The prefetch thread")
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared instance (useful for tests)."""
+        cls._shared_instance = None
+
+    @classmethod
+    def shared(cls) -> DirectoryListingCache:
+        """Return the process-wide cache used by FilePickerPromptResponse."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def clear(self) -> None:
+        """Drop every listing and pending prefetch."""
+        with self._condition:
+            self._listings.clear()
+            self._prefetch_queue.clear()
+
+    def get(self, path: str) -> DirectoryListing | None:
+        """Return the listing of `path` if cached and still current."""
+        import os
+
+        path = os.path.abspath(path)
+        with self._condition:
+            listing = self._listings.get(path)
+        if listing is None:
+            return None
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        with self._condition:
+            if mtime_ns != listing.mtime_ns:
+                self._listings.pop(path, None)
+                return None
+            if path in self._listings:
+                self._listings.move_to_end(path)
+        return listing
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """Read `paths` in the background, replacing any pending prefetch."""
+        import os
+
+        with self._condition:
+            self._prefetch_queue.clear()
+            self._prefetch_queue.extend(os.path.abspath(path) for path in paths)
+            if self._prefetch_queue and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.__class__.__name__}-prefetch",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def read(
+        self,
+        path: str,
+        on_batch: Callable[[list[str], list[str]], object] | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> DirectoryListing | None:
+        """Return the listing of `path`, from the cache or read now.
+
+        While reading, `on_batch(dirs, files)` receives the entries found so
+        far, at doubling intervals. Returns None when `cancelled()` becomes
+        true before the end; a directory that can't be read lists nothing.
+        """
+        import os
+        import time
+
+        from wexample_prompt.common.file_picker.directory_listing import (
+            DirectoryListing,
+        )
+
+        listing = self.get(path)
+        if listing is not None:
+            return listing
+
+        path = os.path.abspath(path)
+        dirs: list[str] = []
+        files: list[str] = []
+        try:
+            started_ns = time.time_ns()
+            mtime_ns = os.stat(path).st_mtime_ns
+            next_batch = self.BATCH_SIZE
+            with os.scandir(path) as entries:
+                for count, entry in enumerate(entries, start=1):
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry.name)
+                    if count == next_batch:
+                        if cancelled is not None and cancelled():
+                            return None
+                        if on_batch is not None:
+                            on_batch(dirs, files)
+                        next_batch *= 2
+        except OSError:
+            return DirectoryListing(path=path)
+
+        listing = DirectoryListing(dirs=dirs, files=files, mtime_ns=mtime_ns, path=path)
+        if started_ns - mtime_ns >= self.RACY_INTERVAL_NS:
+            self._store(listing)
+        return listing
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._prefetch_queue:
+                    self._thread = None
+                    return
+                path = self._prefetch_queue.popleft()
+            try:
+                self.read(path)
+            except Exception:
+                # Prefetching is best effort.
+                pass
+
+    def _store(self, listing: DirectoryListing) -> None:
+        with self._condition:
+            self._listings[listing.path] = listing
+            self._listings.move_to_end(listing.path)
+            while len(self._listings) > max(0, self.max_size):
+                self._listings.popitem(last=False)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class FrameDiffRenderer(BaseClass):
+    """Turn successive frames of an interactive response into minimal updates.
+
+    The last frame is kept as its lines and the terminal rows each one takes.
+    `diff()` compares a new frame with it and returns the escape sequence
+    rewriting only the lines that changed: unchanged lines are skipped with
+    cursor moves, a changed line taking the same rows is overwritten in place,
+    and from the first line whose height changed the rest of the frame is
+    erased and written again.
+
+    Like the full repaint it replaces, it assumes the cursor sits below the
+    frame between two calls and that nothing else wrote to the terminal
+    meanwhile (call `reset()` otherwise).
+    """
+
+    _bytes_written: int = private_field(
+        default=0, description="Length of every sequence returned so far"
+    )
+    _columns: int = private_field(
+        default=0, description="Terminal width the current frame was laid out for"
+    )
+    _frame_count: int = private_field(default=0, description="Frames diffed so far")
+    _line_rows: list[int] = private_field(
+        factory=list, description="Terminal rows taken by each line on screen"
+    )
+    _lines: list[str] = private_field(
+        factory=list, description="Lines of the frame currently on screen"
+    )
+    _widths: dict[str, int] = private_field(
+        factory=dict,
+        description="Display width of each line on screen, reused by the next frame",
+    )
+
+    @property
+    def bytes_written(self) -> int:
+        return self._bytes_written
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def rows(self) -> int:
+        return sum(self._line_rows)
+
+    def clear(self) -> str:
+        """Return the sequence erasing the frame on screen, and forget it."""
+        rows = self.rows
+        self.reset()
+        sequence = f"\033[{rows}F\033[J" if rows > 0 else ""
+        self._bytes_written += len(sequence)
+        return sequence
+
+    def diff(self, rendered: str | None, columns: int) -> str:
+        """Return the sequence turning the frame on screen into `rendered`."""
+        from wexample_helpers.helper.ansi import ansi_display_width
+
+        columns = max(1, columns)
+        lines = [] if rendered is None else rendered.split("\n")
+        # Most lines come back unchanged: only new ones are measured.
+        known_widths = self._widths
+        widths = []
+        for line in lines:
+            width = known_widths.get(line)
+            if width is None:
+                width = ansi_display_width(line)
+            widths.append(width)
+        line_rows = [max(1, -(-width // columns)) for width in widths]
+
+        previous_lines = self._lines
+        previous_rows = self._line_rows
+        if columns != self._columns:
+            # Wrapping changed: nothing on screen can be kept.
+            previous_lines = previous_rows = []
+
+        parts: list[str] = []
+        # The cursor is below the previous frame, at the start of the row.
+        cursor = sum(self._line_rows)
+        at_line_start = True
+        row = 0
+        index = 0
+        for index, line in enumerate(lines):
+            rows = line_rows[index]
+            if index >= len(previous_lines) or previous_rows[index] != rows:
+                break
+            if previous_lines[index] != line:
+                parts.append(self._move(cursor, row, at_line_start))
+                # Clear the row before writing: clearing after a line filling
+                # the whole width would erase its last cell on most terminals.
+                parts.append(f"\033[K{line}")
+                if rows > 1 and widths[index] % columns:
+                    parts.append("\033[K")
+                cursor = row + rows - 1
+                at_line_start = False
+            row += rows
+        else:
+            index = len(lines)
+
+        if index < len(lines) or row < cursor or not at_line_start:
+            parts.append(self._move(cursor, row, at_line_start))
+        if row < sum(self._line_rows):
+            # Erase what the new frame does not overwrite.
+            parts.append("\033[J")
+        if index < len(lines):
+            parts.append("\n".join(lines[index:]) + "\n")
+
+        self._columns = columns
+        self._line_rows = line_rows
+        self._lines = lines
+        self._widths = dict(zip(lines, widths))
+        self._frame_count += 1
+        sequence = "".join(parts)
+        self._bytes_written += len(sequence)
+        return sequence
+
+    def reset(self) -> None:
+        """Forget the frame on screen: the next one is written in full."""
+        self._columns = 0
+        self._line_rows = []
+        self._lines = []
+        self._widths = {}
+
+    @staticmethod
+    def _move(cursor: int, row: int, at_line_start: bool) -> str:
+        if row < cursor:
+            return f"\033[{cursor - row}F"
+        if row > cursor:
+            return f"\033[{row - cursor}E"
+        return "" if at_line_start else "\r"
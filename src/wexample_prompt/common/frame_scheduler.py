@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.frame_subscription import FrameSubscription
+
+
+@base_class
+class FrameScheduler(BaseClass):
+    """Process-wide frame clock driving every animated response.
+
+    Spinners and live regions subscribe here instead of running a thread
+    each: a single daemon thread wakes when a subscription is due (dirty or
+    animated, and its interval elapsed), calls the due callbacks and sleeps
+    until the next one. Nothing runs while no subscription needs a frame,
+    and the thread exits once the last subscription is cancelled.
+
+    `clock` is the monotonic time snapped to frame boundaries, so animations
+    reading it (SpinnerPool) advance in step with each other.
+    """
+
+    DEFAULT_FPS: ClassVar[float] = 20.0
+    _shared_instance: ClassVar[FrameScheduler | None] = None
+
+    fps: float = public_field(
+        default=DEFAULT_FPS,
+        description="Maximum frames per second; subscriptions may ask for fewer",
+    )
+    _condition: Any = private_field(
+        factory=threading.Condition,
+        description="Guards the subscriptions and wakes the scheduler thread",
+    )
+    _frame_count: int = private_field(
+        default=0, description="Ticks that called at least one subscription"
+    )
+    _subscriptions: list[FrameSubscription] = private_field(
+        factory=list, description="Active subscriptions, in subscription order"
+    )
+    _thread: Any = private_field(default=None, description="The scheduler thread")
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared instance (useful for tests)."""
+        cls._shared_instance = None
+
+    @classmethod
+    def shared(cls) -> FrameScheduler:
+        """Return the scheduler shared by every live widget of the process."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    @property
+    def clock(self) -> float:
+        frame_duration = 1.0 / self.fps
+        return (time.monotonic() // frame_duration) * frame_duration
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def subscription_count(self) -> int:
+        return len(self._subscriptions)
+
+    def get_frame_delay(self, interval: float) -> float:
+        """Seconds until the first frame boundary at least `interval` away.
+
+        Loops calling user code on their own thread (pending responses)
+        sleep this long between redraws instead of subscribing, so they keep
+        their callbacks on the caller thread but redraw in step with the
+        scheduler frames.
+        """
+        import math
+
+        frame_duration = 1.0 / self.fps
+        now = time.monotonic()
+        due = math.ceil((now + interval) / frame_duration) * frame_duration
+        return max(0.0, due - now)
+
+    def subscribe(
+        self,
+        callback: Callable[[], object],
+        *,
+        animated: bool = False,
+        interval: float | None = None,
+    ) -> FrameSubscription:
+        """Call `callback` on the scheduler thread for each frame it needs.
+
+        `interval` is the minimum time between two calls (one frame at the
+        scheduler `fps` when None or shorter).
+        """
+        from wexample_prompt.common.frame_subscription import FrameSubscription
+
+        subscription = FrameSubscription(
+            scheduler=self,
+            callback=callback,
+            interval=max(interval or 0.0, 1.0 / self.fps),
+            animated=animated,
+        )
+        with self._condition:
+            self._subscriptions.append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.__class__.__name__}-frames",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription) -> None:
+        with self._condition:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+                self._condition.notify()
+
+    def wake(self) -> None:
+        """Re-evaluate the next due frame (a subscription became dirty)."""
+        with self._condition:
+            self._condition.notify()
+
+    def _run(self) -> None:
+        condition = self._condition
+        monotonic = time.monotonic
+        while True:
+            with condition:
+                while True:
+                    subscriptions = self._subscriptions
+                    if not subscriptions:
+                        self._thread = None
+                        return
+
+                    due = None
+                    for subscription in subscriptions:
+                        if subscription.dirty or subscription.animated:
+                            if due is None or subscription.next_due < due:
+                                due = subscription.next_due
+                    now = monotonic()
+                    if due is None:
+                        condition.wait()
+                    elif due > now:
+                        condition.wait(due - now)
+                    else:
+                        break
+
+                ready = [
+                    subscription
+                    for subscription in subscriptions
+                    if (subscription.dirty or subscription.animated)
+                    and subscription.next_due <= now
+                ]
+                self._frame_count += 1
+
+            for subscription in ready:
+                subscription.dirty = False
+                subscription.next_due = now + subscription.interval
+                try:
+                    subscription.callback()
+                except Exception:
+                    # A failing widget must not stop the frames of the others.
+                    pass
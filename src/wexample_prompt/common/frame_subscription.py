@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+
+class FrameSubscription:
+    """Registration of one animated widget on the FrameScheduler.
+
+    `callback` runs on the scheduler thread when the subscription is dirty
+    (see `mark_dirty()`) or `animated`, at most once per `interval`: any
+    number of updates between two frames are drawn by a single call.
+
+    Plain ``__slots__`` class, as `mark_dirty()` runs on every widget update.
+    """
+
+    __slots__ = ("animated", "callback", "dirty", "interval", "next_due", "scheduler")
+
+    animated: bool
+    callback: Callable[[], object]
+    dirty: bool
+    interval: float
+    next_due: float
+    scheduler: FrameScheduler
+
+    def __init__(
+        self,
+        *,
+        scheduler: FrameScheduler,
+        callback: Callable[[], object],
+        interval: float,
+        animated: bool = False,
+    ) -> None:
+        self.animated = animated
+        self.callback = callback
+        self.dirty = False
+        self.interval = interval
+        # Due right away: the first frame is drawn on the next tick.
+        self.next_due = 0.0
+        self.scheduler = scheduler
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(callback={self.callback!r}, "
+            f"interval={self.interval!r}, animated={self.animated!r})"
+        )
+
+    def cancel(self) -> None:
+        """Stop receiving frames; a frame being drawn still completes."""
+        self.scheduler.unsubscribe(self)
+
+    def mark_dirty(self) -> None:
+        """Ask for a frame; calls made before it is drawn are coalesced."""
+        if self.dirty:
+            return
+        self.dirty = True
+        self.scheduler.wake()
+
+    def set_animated(self, animated: bool) -> None:
+        if animated != self.animated:
+            self.animated = animated
+            self.scheduler.wake()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.base_class import BaseClass
 from wexample_helpers.classes.field import public_field
@@ -105,7 +106,13 @@ from wexample_prompt.mixin.response.titles.title_prompt_response_manager_mixin i
 from wexample_prompt.mixin.with_indentation import WithIndentation
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from wexample_prompt.common.async_io_manager import AsyncIoManager
+    from wexample_prompt.common.live.live_region import LiveRegion
     from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_recorder import PromptRecorder
+    from wexample_prompt.const.types import LineMessage
     from wexample_prompt.enums.verbosity_level import VerbosityLevel
     from wexample_prompt.output.abstract_prompt_output_handler import (
         AbstractPromptOutputHandler,
@@ -157,6 +164,17 @@ class IoManager(
     WithIndentation,
     BaseClass,
 ):
+    CONTEXT_CACHE_MAX_SIZE: ClassVar[int] = 256
+    colorized: bool | None = public_field(
+        default=None,
+        description="Whether printed responses may be styled; None detects it once at "
+        "init from the output handler (TTY, NO_COLOR, FORCE_COLOR)",
+    )
+    concurrent: bool = public_field(
+        default=False,
+        description="Scope the recorder stack to the current thread or asyncio task "
+        "(contextvars), so workers sharing this io only capture their own emissions",
+    )
     default_context_verbosity: VerbosityLevel = public_field(
         default=VerbosityLevel.DEFAULT,
         description="The overall verbosity level used in contexts.",
@@ -165,18 +183,65 @@ class IoManager(
         default=VerbosityLevel.DEFAULT,
         description="The default verbosity for every generated message.",
     )
+    intern_contexts: bool = public_field(
+        default=True,
+        description="Reuse one shared context per distinct create_context() input "
+        "instead of building a new one for every printed response",
+    )
     output: AbstractPromptOutputHandler = public_field(
         default=None,
         description="Manages what to do with the generated output (print, or store), "
         "by default print to stdout",
     )
-    _recorder_stack: list[list[AbstractPromptResponse]] = private_field(
-        factory=list,
-        description="LIFO stack of capture buffers for prompt_trace. Each "
-        "execute_kernel_command (and each QueuedCollectionResponse step) pushes a "
-        "fresh buffer here; every print_response appends to the top buffer (so "
-        "nested sub-commands capture only their own emissions, not the parent's). "
-        "Empty when no command is executing — capture is then a no-op.",
+    recorder_max_bytes: int | None = public_field(
+        default=None,
+        description="Estimated size of full responses each capture keeps before "
+        "compacting older ones to plain-text records; None keeps everything",
+    )
+    recorder_max_entries: int | None = public_field(
+        default=None,
+        description="Number of full responses each capture keeps before compacting "
+        "older ones to plain-text records; None keeps everything",
+    )
+    recorder_spill: bool = public_field(
+        default=False,
+        description="Write compacted records of bounded captures to a temporary "
+        "JSONL file instead of keeping them in memory",
+    )
+    synchronized_output: bool | None = public_field(
+        default=None,
+        description="Whether interactive frames are wrapped in synchronized-update "
+        "sequences (DEC mode 2026); None detects it once at init from the output "
+        "handler",
+    )
+    _aio: AsyncIoManager | None = private_field(
+        default=None, description="The asyncio facade, built on first access to `aio`"
+    )
+    _context_cache: dict = private_field(
+        factory=dict,
+        description="Contexts built by create_context(), indexed by the given context "
+        "(None for the default one). Valid while _context_cache_state holds.",
+    )
+    _context_cache_state: tuple | None = private_field(
+        default=None,
+        description="(colorized, indentation, indentation_length, "
+        "default_context_verbosity, terminal_width) the cached contexts were built "
+        "for; any change drops them.",
+    )
+    _recorder_stack_var: Any = private_field(
+        default=None,
+        description="ContextVar holding the (immutable) recorder stack of the current "
+        "thread or task, used instead of _recorder_stack in concurrent mode",
+    )
+    _recorder_stack: list[list[AbstractPromptResponse] | PromptRecorder] = (
+        private_field(
+            factory=list,
+            description="LIFO stack of capture buffers for prompt_trace. Each "
+            "execute_kernel_command (and each QueuedCollectionResponse step) pushes a "
+            "fresh buffer here; every print_response appends to the top buffer (so "
+            "nested sub-commands capture only their own emissions, not the parent's). "
+            "Empty when no command is executing — capture is then a no-op.",
+        )
     )
     _resize_callbacks: list = private_field(
         factory=list,
@@ -184,6 +249,11 @@ class IoManager(
         "width cache. Single source of truth for terminal resize — interactive "
         "widgets register here instead of installing their own SIGWINCH handlers.",
     )
+    _resize_lock: Any = private_field(
+        factory=threading.RLock,
+        description="Guards _resize_callbacks; reentrant as SIGWINCH may interrupt "
+        "a subscribe() on the main thread",
+    )
     _terminal_width: int = private_field(
         default=None, description="The terminal with cached value."
     )
@@ -196,6 +266,16 @@ class IoManager(
 
     def __attrs_post_init__(self) -> None:
         self._init_output()
+        if self.colorized is None:
+            self.colorized = self.output.supports_color()
+        if self.synchronized_output is None:
+            self.synchronized_output = self.output.supports_synchronized_output()
+        if self.concurrent:
+            import contextvars
+
+            self._recorder_stack_var = contextvars.ContextVar(
+                f"io_manager_recorder_stack_{id(self)}", default=()
+            )
         # Note: SIGWINCH listening is OPT-IN — call `enable_resize_listening()`
         # explicitly from the owner (typically the kernel) so only the
         # "primary" IoManager wires the signal. Auto-installing here would
@@ -309,6 +389,15 @@ class IoManager(
             InputPromptResponse,
         ]
 
+    @property
+    def aio(self) -> AsyncIoManager:
+        """Awaitable variants of the io methods, for use inside an event loop."""
+        if self._aio is None:
+            from wexample_prompt.common.async_io_manager import AsyncIoManager
+
+            self._aio = AsyncIoManager(io=self)
+        return self._aio
+
     @property
     def terminal_width(self) -> int:
         if self._terminal_width is None:
@@ -316,36 +405,55 @@ class IoManager(
         return self._terminal_width
 
     def create_context(self, context: PromptContext | None = None) -> PromptContext:
-        from wexample_prompt.common.prompt_context import PromptContext
-
-        base_context = PromptContext.create_if_none(context=context)
-        context_kwargs = PromptContext.create_kwargs_from_context(context=base_context)
+        """Resolve the context used to print a response.
 
-        base_indentation_length = (
-            context_kwargs.get("indentation_length") or self.indentation_length
-        )
-        base_indentation = context_kwargs.get("indentation", 0)
-        total_indentation = base_indentation + self.indentation
-
-        context_kwargs["colorized"] = base_context.colorized
-        context_kwargs["formatting"] = base_context.formatting
-        context_kwargs["indentation"] = total_indentation
-        context_kwargs["indentation_length"] = base_indentation_length
-        verbosity = context_kwargs.get("verbosity")
-        context_kwargs["verbosity"] = (
-            verbosity if verbosity is not None else self.default_context_verbosity
+        Identical inputs share one interned context while the io indentation,
+        verbosity and terminal width stay the same.
+        """
+        if not self.intern_contexts:
+            return self._create_context(context=context)
+
+        state = (
+            self.colorized,
+            self.indentation,
+            self.indentation_length,
+            self.default_context_verbosity,
+            self.terminal_width,
         )
+        if state != self._context_cache_state:
+            self._context_cache = {}
+            self._context_cache_state = state
+
+        cache = self._context_cache
+        resolved = cache.get(context)
+        if resolved is None:
+            resolved = self._create_context(context=context)
+            if len(cache) >= self.CONTEXT_CACHE_MAX_SIZE:
+                cache.clear()
+            cache[context] = resolved
+        return resolved
+
+    def create_response(
+        self,
+        factory: Callable[[LineMessage], AbstractPromptResponse],
+        message: LineMessage,
+        verbosity: VerbosityLevel | None = None,
+        context: PromptContext | None = None,
+    ) -> AbstractPromptResponse:
+        """Build a response from `message` with `factory(message)`.
 
-        width = context_kwargs.get("width")
-        if width is None:
-            context_kwargs["width"] = self.terminal_width - (
-                total_indentation * base_indentation_length
-            )
+        When the call is filtered out (see is_enabled()), a lazy message is
+        not evaluated: the returned response is built from an empty message
+        and builds the actual one on first render.
+        """
+        if callable(message) and not self.is_enabled(
+            verbosity=verbosity, context=context
+        ):
+            response = factory("")
+            response.defer(lambda: factory(message))
+            return response
 
-        return PromptContext.create_from_parent_context_and_kwargs(
-            parent_context=base_context.parent_context,
-            kwargs=context_kwargs,
-        )
+        return factory(message)
 
     def enable_resize_listening(self) -> bool:
         """Wire SIGWINCH so this IoManager refreshes the width cache and
@@ -381,8 +489,59 @@ class IoManager(
     ) -> None:
         self.output.erase(response=response)
 
-    def pop_recorder(self) -> list[AbstractPromptResponse]:
-        """Close the top capture buffer and return its contents."""
+    def flush(self) -> Any:
+        """Write out whatever the output handler keeps buffered."""
+        return self.output.flush()
+
+    def is_enabled(
+        self,
+        verbosity: VerbosityLevel | None = None,
+        context: PromptContext | None = None,
+    ) -> bool:
+        """Whether a response of this verbosity would be rendered or recorded.
+
+        `print_response()` checks it first, so a filtered out response is
+        returned without creating a context, rendering or writing anything.
+        Callers may also check it to skip expensive work of their own.
+        """
+        if self._get_recorder_stack():
+            # The recorder captures every response, even QUIET ones.
+            return True
+
+        if verbosity is None:
+            verbosity = self.default_response_verbosity
+        if verbosity is None:
+            return True
+        if verbosity == VerbosityLevel.QUIET:
+            return False
+
+        context_verbosity = context.verbosity if context is not None else None
+        if context_verbosity is None:
+            context_verbosity = self.default_context_verbosity
+        return context_verbosity is None or verbosity <= context_verbosity
+
+    def live_region(self, **kwargs: Any) -> LiveRegion:
+        """Create a LiveRegion stacking live widgets below this io output.
+
+        Use it as a context manager; keyword arguments are LiveRegion fields.
+        """
+        from wexample_prompt.common.live.live_region import LiveRegion
+
+        return LiveRegion(io=self, **kwargs)
+
+    def pop_recorder(self) -> list[AbstractPromptResponse] | PromptRecorder:
+        """Close the top capture buffer and return it.
+
+        A bounded PromptRecorder is returned as is: iterating it reads the
+        compacted and spilled records back lazily.
+        """
+        if self.concurrent:
+            stack = self._recorder_stack_var.get()
+            if not stack:
+                raise IndexError("pop from empty recorder stack")
+            self._recorder_stack_var.set(stack[:-1])
+            return stack[-1]
+
         return self._recorder_stack.pop()
 
     def print_response(
@@ -412,17 +571,13 @@ class IoManager(
             # return contract (`io.code()` returns CodePromptResponse, etc.).
             return response
 
-        # Stamp emission time once, regardless of verbosity — the recorder
-        # captures even QUIET responses so consumers (agent IA, MCP) see the
-        # full chronology, not just what the CLI happened to render.
-        if response.created_at is None:
-            response.created_at = time.time()
-
-        if self._recorder_stack:
-            self._recorder_stack[-1].append(response)
+        if not self.is_enabled(verbosity=response.verbosity, context=context):
+            # Filtered out and not captured: skip building a context and
+            # rendering nothing. The caller still gets the response back.
+            return response
 
-        # Quiet mode: capture above, but skip the CLI render.
-        if response.verbosity == VerbosityLevel.QUIET:
+        # Quiet mode: captured, but the CLI render is skipped.
+        if not self.record_response(response):
             return response
 
         self.output.print(
@@ -431,16 +586,55 @@ class IoManager(
 
         return response
 
-    def push_recorder(self) -> list[AbstractPromptResponse]:
-        """Open a fresh capture buffer at the top of the stack and return it."""
-        buf: list[AbstractPromptResponse] = []
-        self._recorder_stack.append(buf)
+    def push_recorder(self) -> list[AbstractPromptResponse] | PromptRecorder:
+        """Open a fresh capture buffer at the top of the stack and return it.
+
+        The buffer is a plain list, or a bounded PromptRecorder when a
+        recorder ceiling or spilling is configured.
+        """
+        if (
+            self.recorder_max_entries is None
+            and self.recorder_max_bytes is None
+            and not self.recorder_spill
+        ):
+            buf: list[AbstractPromptResponse] = []
+        else:
+            from wexample_prompt.common.prompt_recorder import PromptRecorder
+
+            buf = PromptRecorder(
+                max_bytes=self.recorder_max_bytes,
+                max_entries=self.recorder_max_entries,
+                spill=self.recorder_spill,
+            )
+        if self.concurrent:
+            # A new tuple: tasks that copied the current context keep theirs.
+            self._recorder_stack_var.set((*self._recorder_stack_var.get(), buf))
+        else:
+            self._recorder_stack.append(buf)
         return buf
 
+    def record_response(self, response: AbstractPromptResponse) -> bool:
+        """Stamp and capture a response about to be printed.
+
+        Returns False when the response is QUIET and must not be rendered.
+        """
+        # Stamp emission time once, regardless of verbosity — the recorder
+        # captures even QUIET responses so consumers (agent IA, MCP) see the
+        # full chronology, not just what the CLI happened to render.
+        if response.created_at is None:
+            response.created_at = time.time()
+
+        stack = self._get_recorder_stack()
+        if stack:
+            stack[-1].append(response)
+
+        return response.verbosity != VerbosityLevel.QUIET
+
     def reload_terminal_width(self) -> int:
         import shutil
 
         self._terminal_width = shutil.get_terminal_size().columns
+        self._context_cache_state = None
         return self._terminal_width
 
     def subscribe_resize(self, callback) -> callable:
@@ -453,16 +647,57 @@ class IoManager(
         Returns an `unsubscribe()` function — call it to detach the
         callback (e.g. in a widget's `finally`).
         """
-        self._resize_callbacks.append(callback)
+        with self._resize_lock:
+            self._resize_callbacks.append(callback)
 
         def unsubscribe() -> None:
-            try:
-                self._resize_callbacks.remove(callback)
-            except ValueError:
-                pass
+            with self._resize_lock:
+                try:
+                    self._resize_callbacks.remove(callback)
+                except ValueError:
+                    pass
 
         return unsubscribe
 
+    def _create_context(self, context: PromptContext | None = None) -> PromptContext:
+        from wexample_prompt.common.prompt_context import PromptContext
+
+        base_context = PromptContext.create_if_none(context=context)
+        context_kwargs = PromptContext.create_kwargs_from_context(context=base_context)
+
+        base_indentation_length = (
+            context_kwargs.get("indentation_length") or self.indentation_length
+        )
+        base_indentation = context_kwargs.get("indentation", 0)
+        total_indentation = base_indentation + self.indentation
+
+        context_kwargs["colorized"] = base_context.colorized and self.colorized
+        context_kwargs["formatting"] = base_context.formatting
+        context_kwargs["indentation"] = total_indentation
+        context_kwargs["indentation_length"] = base_indentation_length
+        verbosity = context_kwargs.get("verbosity")
+        context_kwargs["verbosity"] = (
+            verbosity if verbosity is not None else self.default_context_verbosity
+        )
+
+        width = context_kwargs.get("width")
+        if width is None:
+            context_kwargs["width"] = self.terminal_width - (
+                total_indentation * base_indentation_length
+            )
+
+        return PromptContext.create_from_parent_context_and_kwargs(
+            parent_context=base_context.parent_context,
+            kwargs=context_kwargs,
+        )
+
+    def _get_recorder_stack(
+        self,
+    ) -> Sequence[list[AbstractPromptResponse] | PromptRecorder]:
+        if self.concurrent:
+            return self._recorder_stack_var.get()
+        return self._recorder_stack
+
     def _init_output(self) -> None:
         from wexample_prompt.output.prompt_stdout_output_handler import (
             PromptStdoutOutputHandler,
@@ -476,7 +711,9 @@ class IoManager(
         self.reload_terminal_width()
         # Iterate over a copy: callbacks may unsubscribe themselves and
         # mutate the list mid-iteration.
-        for cb in list(self._resize_callbacks):
+        with self._resize_lock:
+            callbacks = list(self._resize_callbacks)
+        for cb in callbacks:
             try:
                 cb()
             except Exception:  # noqa: BLE001
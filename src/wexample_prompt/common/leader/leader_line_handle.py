@@ -52,8 +52,11 @@ class LeaderLineHandle(BaseClass):
     def render(self) -> str | None:
         # Re-render in place. The response toggles `_redraw_in_place` so
         # `render()` knows to emit `CSI 1A + CSI 2K + \r` before the new
-        # frame — same trick as the progress widget.
-        self.response._redraw_in_place = True
+        # frame — same trick as the progress widget. Piped output can't be
+        # redrawn: the new frame is then printed on its own line.
+        self.response._redraw_in_place = (
+            self.output is None or self.output.supports_cursor_control()
+        )
         try:
             if self.output is not None:
                 return self.output.print(self.response, context=self.context)
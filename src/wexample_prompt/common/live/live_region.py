@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from wexample_prompt.common.frame_subscription import FrameSubscription
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.live.live_slot import LiveSlot
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.output.live_region_output_handler import (
+        LiveRegionOutputHandler,
+    )
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+    from wexample_prompt.responses.interactive.leader_line_prompt_response import (
+        LeaderLinePromptResponse,
+    )
+    from wexample_prompt.responses.interactive.progress_prompt_response import (
+        ProgressPromptResponse,
+    )
+    from wexample_prompt.responses.interactive.spinner_prompt_response import (
+        SpinnerPromptResponse,
+    )
+
+
+@base_class
+class LiveRegion(BaseClass):
+    """The bottom rows of the terminal, shared by live widgets.
+
+    Progress bars, leader lines and spinners register a LiveSlot each; the
+    region stacks them in registration order. While the region runs (see
+    `start()`, or use it as a context manager), the io prints through a
+    LiveRegionOutputHandler: regular responses are printed above the region
+    and widget updates only mark it dirty.
+
+    The shared FrameScheduler repaints the region at most once per
+    `frame_interval`, and only when dirty or animated: the previous region
+    is erased, pending output is written above it and the slots are drawn
+    again, in a single write. Terminal writes are therefore capped
+    whatever the number of widgets and updates.
+
+    Output the io handler kept buffered is flushed before each frame. When
+    the stream is not a terminal, nothing is redrawn: output goes through
+    the io handler as it comes and the slots are printed through it once,
+    when the region stops.
+    """
+
+    DEFAULT_FRAME_INTERVAL: ClassVar[float] = 1 / 20
+
+    frame_interval: float = public_field(
+        default=DEFAULT_FRAME_INTERVAL,
+        description="Minimum seconds between two frames",
+    )
+    interactive: bool | None = public_field(
+        default=None,
+        description="Redraw the region in place; None when the stream is a terminal",
+    )
+    io: IoManager = public_field(description="The io manager printing above the region")
+    stream: Any = public_field(
+        default=None,
+        description="Text stream written to; None resolves sys.stdout at write time",
+    )
+    _above: list[str] = private_field(
+        factory=list, description="Output waiting to be written above the region"
+    )
+    _closed: bool = private_field(
+        default=True, description="Whether the region is stopped (or never ran)"
+    )
+    _frame_count: int = private_field(default=0, description="Frames painted so far")
+    _lock: Any = private_field(
+        factory=threading.RLock, description="Guards the slots and the pending output"
+    )
+    _output: LiveRegionOutputHandler | None = private_field(
+        default=None, description="Handler installed on the io while running"
+    )
+    _previous_output: Any = private_field(
+        default=None, description="Handler of the io before start()"
+    )
+    _rows: int = private_field(
+        default=0, description="Terminal rows of the region currently on screen"
+    )
+    _slots: list[LiveSlot] = private_field(
+        factory=list, description="Registered slots, drawn top to bottom"
+    )
+    _subscription: FrameSubscription | None = private_field(
+        default=None, description="Frame scheduler subscription while running"
+    )
+    _suspended: int = private_field(
+        default=0,
+        description="Nesting of suspend(): the region stays erased while positive",
+    )
+
+    def __attrs_post_init__(self) -> None:
+        from wexample_prompt.output.live_region_output_handler import (
+            LiveRegionOutputHandler,
+        )
+
+        if self.interactive is None:
+            isatty = getattr(self._get_stream(), "isatty", None)
+            self.interactive = bool(isatty and isatty())
+        self._output = LiveRegionOutputHandler(region=self, handler=self.io.output)
+
+    def __enter__(self) -> LiveRegion:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def slots(self) -> list[LiveSlot]:
+        return list(self._slots)
+
+    def add(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> LiveSlot:
+        """Draw a response (eg. a progress bar) in a new slot at the bottom.
+
+        Printing the response again, as its handle does on update, only
+        refreshes the slot.
+        """
+
+        def render(frame_context: PromptContext) -> str | None:
+            return response.render(
+                context=frame_context if context is None else context
+            )
+
+        slot = self._add_slot(renderer=render, response=response)
+        handle = getattr(response, "_handle", None)
+        if handle is not None and hasattr(handle, "output"):
+            handle.output = self._output
+        return slot
+
+    def add_spinner(self, response: SpinnerPromptResponse) -> LiveSlot:
+        """Animate a spinner response in a new slot, instead of its own line."""
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
+        from wexample_prompt.common.spinner_pool import Spinner
+
+        spinner = Spinner(interval=response.interval)
+        scheduler = FrameScheduler.shared()
+
+        def render(frame_context: PromptContext) -> str:
+            return f"{spinner.next(now=scheduler.clock)} {response.label}"
+
+        slot = self._add_slot(renderer=render, response=response, animated=True)
+        response._live_slot = slot
+        return slot
+
+    def get_slot(self, response: AbstractPromptResponse) -> LiveSlot | None:
+        for slot in self._slots:
+            if slot.response is response:
+                return slot
+        return None
+
+    def leader_line(self, message: str, **kwargs: Any) -> LeaderLinePromptResponse:
+        """Create a leader line drawn in a new slot; update it through its handle."""
+        response = self.io.leader_line(message, print_response=False, **kwargs)
+        self.add(response)
+        return response
+
+    def paint(self) -> None:
+        """Write pending output and redraw the region now."""
+        with self._lock:
+            frame = self._build_frame()
+            if frame:
+                self._write(frame)
+            self._frame_count += 1
+
+    def print(self, text: str) -> None:
+        """Write `text` (a line, without trailing newline) above the region."""
+        if not self.interactive or self._closed:
+            self._print_through_output(text)
+            return
+        with self._lock:
+            self._above.append(text + "\n")
+        self.refresh()
+
+    def progress(self, **kwargs: Any) -> ProgressPromptResponse:
+        """Create a progress bar drawn in a new slot; update it through its handle."""
+        response = self.io.progress(print_response=False, **kwargs)
+        self.add(response)
+        return response
+
+    def refresh(self) -> None:
+        """Ask for a repaint on the next frame tick."""
+        subscription = self._subscription
+        if subscription is not None:
+            subscription.mark_dirty()
+
+    def remove(self, slot: LiveSlot, keep: bool = False) -> None:
+        """Release the rows of `slot`; with `keep`, print its last content above."""
+        with self._lock:
+            if slot not in self._slots:
+                return
+            if keep:
+                text = slot.render(self.io.create_context())
+                if text:
+                    self._above.append(text + "\n")
+            self._slots.remove(slot)
+            if getattr(slot.response, "_live_slot", None) is slot:
+                slot.response._live_slot = None
+            self._update_animated()
+        self.refresh()
+
+    def spinner(self, label: str = "Thinking…", interval: float = 0.1) -> LiveSlot:
+        """Create a spinner animated in a new slot; remove the slot to stop it."""
+        from wexample_prompt.responses.interactive.spinner_prompt_response import (
+            SpinnerPromptResponse,
+        )
+
+        return self.add_spinner(
+            SpinnerPromptResponse.create_spinner(label=label, interval=interval)
+        )
+
+    def start(self) -> LiveRegion:
+        """Route the io output through the region and subscribe to frame ticks."""
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+        with self._lock:
+            if not self._closed:
+                return self
+            self._closed = False
+            self._previous_output = self.io.output
+            self._output.handler = self._previous_output
+            self.io.output = self._output
+            if self.interactive:
+                self._subscription = FrameScheduler.shared().subscribe(
+                    self._on_frame,
+                    animated=any(slot.animated for slot in self._slots),
+                    interval=self.frame_interval,
+                )
+        return self
+
+    def stop(self) -> None:
+        """Paint a last frame, leave it on screen and give the io its output back."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            subscription = self._subscription
+            self._subscription = None
+        if subscription is not None:
+            subscription.cancel()
+
+        with self._lock:
+            # Animations have no meaningful last frame.
+            for slot in [slot for slot in self._slots if slot.animated]:
+                self.remove(slot)
+            self._paint_last_frame()
+            self.io.output = self._previous_output
+            self._previous_output = None
+
+    @contextlib.contextmanager
+    def suspend(self) -> Iterator[LiveRegion]:
+        """Erase the region while something else draws (eg. a prompt)."""
+        with self._lock:
+            self._suspended += 1
+            frame = self._build_frame()
+            if frame:
+                self._write(frame)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._suspended -= 1
+            self.refresh()
+
+    def _add_slot(self, **kwargs: Any) -> LiveSlot:
+        from wexample_prompt.common.live.live_slot import LiveSlot
+
+        slot = LiveSlot(region=self, **kwargs)
+        with self._lock:
+            self._slots.append(slot)
+            self._update_animated()
+        self.refresh()
+        return slot
+
+    def _build_frame(self) -> str:
+        from wexample_helpers.helper.ansi import ansi_display_width
+
+        parts: list[str] = []
+        if self._rows:
+            # Back to the first row of the region, then erase down.
+            parts.append(f"\x1b[{self._rows}F\x1b[J")
+        parts.extend(self._above)
+        self._above.clear()
+
+        rows = 0
+        if self.interactive and not self._suspended and not self._closed:
+            context = self.io.create_context()
+            columns = max(1, self.io.terminal_width)
+            for slot in self._slots:
+                text = slot.render(context)
+                if not text:
+                    continue
+                for line in text.split("\n"):
+                    parts.append(line + "\n")
+                    rows += max(1, -(-ansi_display_width(line) // columns))
+        self._rows = rows
+        return "".join(parts)
+
+    def _get_stream(self) -> Any:
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _paint_last_frame(self) -> None:
+        # The region is closed: the frame only erases it and writes the
+        # pending output, the slots are then written as regular rows.
+        context = self.io.create_context()
+        frame = self._build_frame()
+        for slot in self._slots:
+            text = slot.render(context)
+            if not text:
+                continue
+            if self.interactive:
+                frame += text + "\n"
+            else:
+                self._print_through_output(text)
+        if frame:
+            self._write(frame)
+
+    def _on_frame(self) -> None:
+        # A tick may still be delivered while stop() cancels the subscription.
+        if not self._closed:
+            self.paint()
+
+    def _print_through_output(self, text: str) -> None:
+        # Not redrawing: the io handler writes the text in order with the
+        # rest of the output.
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+        handler = self._previous_output
+        if handler is None:
+            handler = self.io.output
+        response = LogPromptResponse(
+            lines=[
+                PromptResponseLine(segments=[PromptResponseSegment(text=line)])
+                for line in text.split("\n")
+            ]
+        )
+        handler.print_rendered(response=response, rendered=text)
+
+    def _update_animated(self) -> None:
+        subscription = self._subscription
+        if subscription is not None:
+            subscription.set_animated(any(slot.animated for slot in self._slots))
+
+    def _write(self, text: str) -> None:
+        from wexample_prompt.output.prompt_stdout_output_handler import (
+            PromptStdoutOutputHandler,
+        )
+
+        handler = self._previous_output
+        if handler is not None:
+            # Output the handler still buffers was printed before this frame.
+            handler.flush()
+        stream = self._get_stream()
+        with PromptStdoutOutputHandler.WRITE_LOCK:
+            stream.write(text)
+            stream.flush()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.live.live_region import LiveRegion
+    from wexample_prompt.common.prompt_context import PromptContext
+
+
+@base_class
+class LiveSlot(BaseClass):
+    """Rows of a LiveRegion owned by one live widget.
+
+    `renderer` is called on the region frame thread with the frame context
+    and returns the slot text (None or "" hides the slot). Widgets call
+    `refresh()` after changing their state; the region repaints on its
+    next frame tick, however many refreshes happened in between.
+    """
+
+    animated: bool = public_field(
+        default=False,
+        description="Repaint on every frame tick, without waiting for refresh()",
+    )
+    region: LiveRegion = public_field(description="The region the slot belongs to")
+    renderer: Callable[[PromptContext], str | None] = public_field(
+        description="Returns the slot text for the given context"
+    )
+    response: Any = public_field(
+        default=None,
+        description="Response drawn by the slot; its output prints only refresh it",
+    )
+
+    def refresh(self) -> None:
+        self.region.refresh()
+
+    def remove(self, keep: bool = False) -> None:
+        """Release the rows; with `keep`, print the last content above the region."""
+        self.region.remove(self, keep=keep)
+
+    def render(self, context: PromptContext) -> str | None:
+        return self.renderer(context)
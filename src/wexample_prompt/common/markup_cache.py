@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from wexample_prompt.common.compiled_markup import CompiledMarkup
+
+
+@base_class
+class MarkupCache(BaseClass):
+    """Bounded LRU cache of compiled markup, shared through MarkupCache.shared().
+
+    Thread-safe: workers emitting the same templates from several threads
+    hit the same entries.
+    """
+
+    DEFAULT_MAX_SIZE: ClassVar[int] = 1024
+    DEFAULT_MAX_TEXT_LENGTH: ClassVar[int] = 4096
+    _shared_instance: ClassVar[MarkupCache | None] = None
+
+    enabled: bool = public_field(
+        default=True,
+        description="When False, every lookup misses and nothing is stored",
+    )
+    max_size: int = public_field(
+        default=DEFAULT_MAX_SIZE,
+        description="Maximum number of compiled entries kept before evicting the least recently used",
+    )
+    max_text_length: int = public_field(
+        default=DEFAULT_MAX_TEXT_LENGTH,
+        description="Texts longer than this are never cached, so one huge dump cannot pin memory",
+    )
+    _entries: OrderedDict = private_field(
+        factory=OrderedDict,
+        description="Compiled markup indexed by (text, default_color, base_styles), in LRU order",
+    )
+    _evictions: int = private_field(
+        default=0, description="Number of entries dropped to respect max_size"
+    )
+    _hits: int = private_field(default=0, description="Number of successful lookups")
+    _lock: Any = private_field(
+        factory=threading.Lock, description="Guards entries and counters"
+    )
+    _misses: int = private_field(default=0, description="Number of failed lookups")
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared instance (useful for tests)."""
+        cls._shared_instance = None
+
+    @classmethod
+    def shared(cls) -> MarkupCache:
+        """Return the process-wide cache used by parse_style_markup."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def accepts(self, text: str) -> bool:
+        return self.enabled and len(text) <= self.max_text_length
+
+    def clear(self) -> None:
+        """Drop every entry and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._evictions = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, key: Hashable) -> CompiledMarkup | None:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return compiled
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "evictions": self._evictions,
+                "hits": self._hits,
+                "max_size": self.max_size,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+    def store(self, key: Hashable, compiled: CompiledMarkup) -> None:
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(0, self.max_size):
+                self._entries.popitem(last=False)
+                self._evictions += 1
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.bound_markup import BoundMarkup
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    # One compiled segment: text pieces (str literal or int slot index) + style.
+    TemplateSegment = tuple[
+        tuple[str | int, ...], TerminalColor | None, tuple[TextStyle, ...]
+    ]
+
+# printf-style placeholders, as accepted by the % operator (mapping keys excluded).
+_PLACEHOLDER_PATTERN = re.compile(r"%(?:%|[-+ #0]*\d*(?:\.\d+)?[sdiouxXeEfFgGcr])")
+# Directives that transform their content (clickable paths, timestamps): a
+# value bound inside them can't be spliced after parsing.
+_FORMATTER_DIRECTIVE_PATTERN = re.compile(r"@(?:path|time)(?::[^\{\}]+)?\{", re.I)
+# Values holding one of these chars could change the markup structure once
+# formatted, so they are routed through the full parser.
+_STRUCTURAL_CHARS = frozenset("@{}\n")
+# Literal text ending inside a directive header (`@`, its name or its args):
+# a slot right after it would be part of the header once formatted.
+_OPEN_HEADER_PATTERN = re.compile(r"@[^\s@{}:]*(?::[^{}]*)?\Z")
+_SLOT_BASE = 0xE000
+_SLOT_MAX = 0xF8FF
+_SLOT_PATTERN = re.compile(f"([{chr(_SLOT_BASE)}-{chr(_SLOT_MAX)}])")
+
+
+@base_class
+class MarkupTemplate(BaseClass):
+    """A markup skeleton with printf-style slots, parsed once and filled per call.
+
+    ``MarkupTemplate(skeleton="@color:cyan{%s} processed @bold{%d} rows")``
+    can be bound with ``template.bind(name, count)`` (or ``template % (name, count)``).
+    The result is a string usable as any ``message``; the markup parser then
+    fills the pre-parsed segments instead of scanning the text again.
+
+    Placeholders inside directive parameters (eg ``@time:%H:%M{}``) are left
+    untouched.
+    """
+
+    skeleton: str = public_field(description="The markup text holding placeholders")
+    _chunks: tuple[str, ...] = private_field(
+        factory=tuple,
+        description="Literal skeleton parts surrounding the placeholders (one more than slots)",
+    )
+    _compiled: dict = private_field(
+        factory=dict,
+        description="Parsed slot layout indexed by (default_color, base_styles)",
+    )
+    _formats: tuple[str, ...] = private_field(
+        factory=tuple, description="One %-format string per slot, eg '%s' or '%.2f'"
+    )
+    _splicable: bool = private_field(
+        default=True,
+        description="False when the skeleton uses formatter directives or has slots in "
+        "directive headers, so values must be re-parsed",
+    )
+
+    def __attrs_post_init__(self) -> None:
+        from wexample_prompt.common.style_markup_parser import _STYLE_DIRECTIVE_PATTERN
+
+        header_spans = [
+            (match.start(), match.end())
+            for match in _STYLE_DIRECTIVE_PATTERN.finditer(self.skeleton)
+        ]
+
+        chunks: list[str] = []
+        formats: list[str] = []
+        literal: list[str] = []
+        index = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(self.skeleton):
+            start = match.start()
+            if any(begin <= start < end for begin, end in header_spans):
+                continue
+
+            literal.append(self.skeleton[index:start])
+            index = match.end()
+            if match.group() == "%%":
+                literal.append("%")
+                continue
+
+            chunks.append("".join(literal))
+            literal = []
+            formats.append(match.group())
+
+        literal.append(self.skeleton[index:])
+        chunks.append("".join(literal))
+
+        if len(formats) > _SLOT_MAX - _SLOT_BASE:
+            raise ValueError("Too many placeholders in markup template.")
+        if _SLOT_PATTERN.search(self.skeleton):
+            raise ValueError(
+                "Markup template skeleton must not contain private-use characters."
+            )
+
+        self._chunks = tuple(chunks)
+        self._formats = tuple(formats)
+        slot_in_header = any(
+            _OPEN_HEADER_PATTERN.search(chunk) for chunk in chunks[:-1]
+        )
+        self._splicable = (
+            not slot_in_header
+            and _FORMATTER_DIRECTIVE_PATTERN.search(self.skeleton) is None
+        )
+
+    def __mod__(self, values: Any) -> BoundMarkup:
+        return self.bind(*(values if isinstance(values, tuple) else (values,)))
+
+    @property
+    def slots_count(self) -> int:
+        return len(self._formats)
+
+    def bind(self, *values: Any) -> BoundMarkup:
+        """Format the values into their slots and return the bound markup string."""
+        from wexample_prompt.common.bound_markup import BoundMarkup
+
+        if len(values) != len(self._formats):
+            raise TypeError(
+                f"Markup template expects {len(self._formats)} values, got {len(values)}."
+            )
+
+        formatted = tuple(fmt % (value,) for fmt, value in zip(self._formats, values))
+        parts = [self._chunks[0]]
+        for value, chunk in zip(formatted, self._chunks[1:]):
+            parts.append(value)
+            parts.append(chunk)
+
+        bound = BoundMarkup("".join(parts))
+        bound.template = self
+        bound.values = formatted
+        return bound
+
+    def fill(
+        self,
+        values: tuple[str, ...],
+        default_color: TerminalColor | None = None,
+        base_styles: Iterable[TextStyle] | None = None,
+    ) -> list[list[PromptResponseSegment]] | None:
+        """Build segments from already formatted slot values.
+
+        Returns None when the values can't be spliced safely (they carry
+        markup characters or empty a whole line, or the skeleton uses
+        formatter directives or slots in directive headers); the caller then
+        falls back to parsing the bound string.
+        """
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+
+        if not self._splicable:
+            return None
+        for value in values:
+            if not _STRUCTURAL_CHARS.isdisjoint(value):
+                return None
+
+        base_styles = tuple(base_styles) if base_styles else ()
+        layout = self._get_layout(default_color, base_styles)
+
+        lines = []
+        for line in layout:
+            segments = []
+            for pieces, color, styles in line:
+                text = "".join(
+                    piece if piece.__class__ is str else values[piece]
+                    for piece in pieces
+                )
+                # The parser emits no segment for empty content; an empty
+                # literal is the placeholder of an empty line.
+                if text or not pieces:
+                    segments.append(
+                        PromptResponseSegment(text=text, color=color, styles=styles)
+                    )
+            if not segments:
+                # Emptied by the values: the parser decides what the line
+                # becomes (dropped, or a placeholder in the enclosing style).
+                return None
+            lines.append(segments)
+        return lines
+
+    def _get_layout(
+        self,
+        default_color: TerminalColor | None,
+        base_styles: tuple[TextStyle, ...],
+    ) -> tuple[tuple[TemplateSegment, ...], ...]:
+        from wexample_prompt.common.style_markup_parser import (
+            _parse_style_markup_uncached,
+        )
+
+        key = (default_color, base_styles)
+        layout = self._compiled.get(key)
+        if layout is not None:
+            return layout
+
+        # Parse once with a private-use char standing for each slot, then
+        # split segments around those chars.
+        sentinel_parts = [self._chunks[0]]
+        for slot_index, chunk in enumerate(self._chunks[1:]):
+            sentinel_parts.append(chr(_SLOT_BASE + slot_index))
+            sentinel_parts.append(chunk)
+
+        parsed = _parse_style_markup_uncached(
+            "".join(sentinel_parts), default_color, base_styles
+        )
+
+        layout = tuple(
+            tuple(
+                (
+                    tuple(
+                        (
+                            ord(piece) - _SLOT_BASE
+                            if _SLOT_PATTERN.fullmatch(piece)
+                            else piece
+                        )
+                        for piece in _SLOT_PATTERN.split(seg.text)
+                        if piece
+                    ),
+                    seg.color,
+                    seg.styles,
+                )
+                for seg in line
+            )
+            for line in parsed
+        )
+        self._compiled[key] = layout
+        return layout
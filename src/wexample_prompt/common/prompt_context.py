@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, ClassVar
 
+import attrs
 from wexample_helpers.classes.base_class import BaseClass
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_prompt.enums.indentation_style import IndentationStyle
@@ -18,57 +20,159 @@ if TYPE_CHECKING:
     from wexample_prompt.enums.terminal_color import TerminalColor
     from wexample_prompt.enums.verbosity_level import VerbosityLevel
 
+# Public fields can't be reassigned once built: derived values are cached.
+_FROZEN = attrs.setters.frozen
+
 
 @base_class
 class PromptContext(BaseClass):
-    """Context for rendering responses, including terminal information."""
+    """Context for rendering responses, including terminal information.
+
+    A context is immutable once built (use `clone()` to derive a new one) and
+    hashable, so the values resolved through the parent chain and the
+    rendered indentation are computed at most once per instance.
+    """
 
     DEFAULT_COLORIZED: ClassVar[bool] = True
     DEFAULT_VERBOSITY: ClassVar[VerbosityLevel] = VerbosityLevel.DEFAULT
     DEFAULT_WIDTH: ClassVar[int] = 80
+    _default_instance: ClassVar[PromptContext | None] = None
     bordered: bool = public_field(
+        on_setattr=_FROZEN,
         default=True,
         description="Whether child responses should draw their own container borders. Set False by a wrapping response (e.g. frame) to avoid double-bordering.",
     )
     colorized: bool | None = public_field(
-        default=True, description="Allow to return avoid coloration special characters"
+        on_setattr=_FROZEN,
+        default=True,
+        description="Allow to return avoid coloration special characters",
     )
     formatting: bool | None = public_field(
+        on_setattr=_FROZEN,
         default=False,
         description="Format lines on rendering, should be disabled when passing raw text",
     )
     indentation: int | None = public_field(
-        default=0, description="Base indentation level"
+        on_setattr=_FROZEN, default=0, description="Base indentation level"
     )
     indentation_bg_color: TerminalBgColor | None = public_field(
-        default=None, description="Background color of the indentation area"
+        on_setattr=_FROZEN,
+        default=None,
+        description="Background color of the indentation area",
     )
     indentation_character: str | None = public_field(
-        default=" ", description="The character used for indentation"
+        on_setattr=_FROZEN,
+        default=" ",
+        description="The character used for indentation",
     )
     indentation_length: int | None = public_field(
+        on_setattr=_FROZEN,
         default=2,
         description="Number of characters to repeat for one indentation (repeat mode)",
     )
     indentation_style: IndentationStyle | None = public_field(
-        default=IndentationStyle.REPEAT, description="Style of indentation rendering"
+        on_setattr=_FROZEN,
+        default=IndentationStyle.REPEAT,
+        description="Style of indentation rendering",
     )
     indentation_text_color: TerminalColor | None = public_field(
-        default=None, description="Text color of the indentation characters"
+        on_setattr=_FROZEN,
+        default=None,
+        description="Text color of the indentation characters",
     )
     parent_context: PromptContext | None = public_field(
-        default=None, description="A parent context"
+        on_setattr=_FROZEN, default=None, description="A parent context"
     )
     # None means "not explicitly set" — the IoManager will apply its own default_context_verbosity.
     # Use an explicit VerbosityLevel only when you want to override the io-level setting.
     verbosity: VerbosityLevel | None = public_field(
+        on_setattr=_FROZEN,
         default=None,
         description="The context verbosity, saying which response to render or not",
     )
     width: int | None = public_field(
+        on_setattr=_FROZEN,
         default=None,
         description="Context with, basically the terminal with including indentation",
     )
+    _content_width: int | None = private_field(
+        eq=False,
+        repr=False,
+        default=None,
+        description="Cached result of get_content_width()",
+    )
+    _fingerprint: tuple | None = private_field(
+        eq=False,
+        repr=False,
+        default=None,
+        description="Cached result of get_fingerprint()",
+    )
+    _indentation_visible_width: int | None = private_field(
+        eq=False,
+        repr=False,
+        default=None,
+        description="Cached visible width of the indentation text",
+    )
+    _rendered_indentation: str | None = private_field(
+        eq=False,
+        repr=False,
+        default=None,
+        description="Cached result of render_indentation()",
+    )
+    _rendered_indentation_text: str | None = private_field(
+        eq=False,
+        repr=False,
+        default=None,
+        description="Cached result of render_indentation_text()",
+    )
+    _resolved: tuple = private_field(
+        eq=False,
+        repr=False,
+        factory=tuple,
+        description="Indentation level, character, style, text and bg colors resolved through the parent chain",
+    )
+
+    def __attrs_post_init__(self) -> None:
+        parent = self.parent_context
+        level = self.indentation
+        if level is None:
+            level = 1 if parent else 0
+
+        if parent:
+            (
+                _,
+                parent_character,
+                parent_style,
+                parent_text_color,
+                parent_bg_color,
+            ) = parent._resolved
+        else:
+            parent_character = " "
+            parent_style = IndentationStyle.REPEAT
+            parent_text_color = parent_bg_color = None
+
+        self._resolved = (
+            level,
+            (
+                parent_character
+                if self.indentation_character is None
+                else self.indentation_character
+            ),
+            parent_style if self.indentation_style is None else self.indentation_style,
+            (
+                parent_text_color
+                if self.indentation_text_color is None
+                else self.indentation_text_color
+            ),
+            (
+                parent_bg_color
+                if self.indentation_bg_color is None
+                else self.indentation_bg_color
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.get_fingerprint())
 
     @classmethod
     def create_from_kwargs(cls, kwargs: Kwargs) -> PromptContext:
@@ -93,12 +197,14 @@ class PromptContext(BaseClass):
         Creating a context allows to execute render without any extra information,
         but manager parameters like terminal width are not available in this case.
         """
-        return context or PromptContext()
+        return context or cls.get_default()
 
     @classmethod
     def create_kwargs_from_context(cls, context: PromptContext) -> Kwargs:
         return {
             "bordered": context.bordered,
+            "colorized": context.colorized,
+            "formatting": context.formatting,
             "indentation": context.indentation,
             "indentation_character": context.indentation_character,
             "indentation_text_color": context.indentation_text_color,
@@ -109,9 +215,20 @@ class PromptContext(BaseClass):
             "width": context.width,
         }
 
+    @classmethod
+    def get_default(cls) -> PromptContext:
+        """Shared context with default values (contexts are immutable)."""
+        if cls._default_instance is None:
+            cls._default_instance = PromptContext()
+        return cls._default_instance
+
     def calc_indentation_char_length(self) -> int:
         return self.get_indentation() * self.indentation_length
 
+    def clone(self, **overrides) -> PromptContext:
+        """Return a new context with some fields replaced (contexts are immutable)."""
+        return attrs.evolve(self, **overrides)
+
     def get_available_width(self, width: int | None = None, minimum: int = 0) -> int:
         """Compute the remaining visible width once indentation is applied.
 
@@ -128,76 +245,65 @@ class PromptContext(BaseClass):
 
         return max(minimum, target_width - self.get_indentation_visible_width())
 
-    def get_indentation(self) -> int:
-        if self.indentation is None:
-            if self.parent_context:
-                return 1
-            else:
-                return 0
+    def get_content_width(self) -> int | None:
+        """Visible width left for content on each line, or None when no width is set."""
+        if not self.width:
+            return None
+        if self._content_width is None:
+            self._content_width = self.get_available_width(self.width, minimum=0)
+        return self._content_width
 
-        return self.indentation
+    def get_fingerprint(self) -> tuple:
+        """Hashable summary of every value that affects rendering.
 
-    def get_indentation_bg_color(self) -> TerminalBgColor | None:
-        if self.indentation_bg_color is None:
-            if self.parent_context:
-                return self.parent_context.get_indentation_bg_color()
-            else:
-                return None
+        Indentation settings are resolved through the parent chain, so two
+        contexts with the same fingerprint render any line identically.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = (
+                self.width,
+                self.indentation_length,
+                *self._resolved,
+                self.colorized,
+                self.formatting,
+                self.verbosity,
+                self.bordered,
+            )
+        return self._fingerprint
+
+    def get_indentation(self) -> int:
+        return self._resolved[0]
 
-        return self.indentation_bg_color
+    def get_indentation_bg_color(self) -> TerminalBgColor | None:
+        return self._resolved[4]
 
     def get_indentation_character(self) -> str:
-        if self.indentation_character is None:
-            if self.parent_context:
-                return self.parent_context.get_indentation_character()
-            else:
-                return " "
-
-        return self.indentation_character
+        return self._resolved[1]
 
     def get_indentation_style(self) -> IndentationStyle:
-        if self.indentation_style is None:
-            if self.parent_context:
-                return self.parent_context.get_indentation_style()
-            else:
-                return IndentationStyle.REPEAT
-
-        return self.indentation_style
+        return self._resolved[2]
 
     def get_indentation_text_color(self) -> TerminalColor | None:
-        if self.indentation_text_color is None:
-            if self.parent_context:
-                return self.parent_context.get_indentation_text_color()
-            else:
-                return None
-
-        return self.indentation_text_color
+        return self._resolved[3]
 
     def get_indentation_visible_width(self) -> int:
         """Return the visible width of the indentation, ignoring ANSI codes."""
-        from wexample_prompt.helper.terminal import terminal_get_visible_width
+        if self._indentation_visible_width is None:
+            from wexample_prompt.helper.terminal import terminal_get_visible_width
 
-        return terminal_get_visible_width(self.render_indentation_text())
+            self._indentation_visible_width = terminal_get_visible_width(
+                self.render_indentation_text()
+            )
+        return self._indentation_visible_width
 
     def get_width(self) -> int:
         # None width allowed to let know that no fixed width has been specified before using it.
         return self.width or PromptContext.DEFAULT_WIDTH
 
     def render_indentation(self) -> str:
-        from wexample_prompt.common.color_manager import ColorManager
-
-        indentation = self.render_indentation_text()
-
-        indentation_text_color = self.get_indentation_text_color()
-        indentation_bg_color = self.get_indentation_bg_color()
-        if self.colorized and (indentation_text_color or indentation_bg_color):
-            return ColorManager.colorize(
-                text=indentation,
-                color=indentation_text_color,
-                bg=indentation_bg_color,
-            )
-
-        return indentation
+        if self._rendered_indentation is None:
+            self._rendered_indentation = self._render_indentation()
+        return self._rendered_indentation
 
     def render_indentation_part(self) -> str:
         """Render indentation for current level based on style."""
@@ -213,6 +319,27 @@ class PromptContext(BaseClass):
 
     def render_indentation_text(self) -> str:
         """Get the current indentation string."""
+        if self._rendered_indentation_text is None:
+            self._rendered_indentation_text = self._render_indentation_text()
+        return self._rendered_indentation_text
+
+    def _render_indentation(self) -> str:
+        from wexample_prompt.common.color_manager import ColorManager
+
+        indentation = self.render_indentation_text()
+
+        indentation_text_color = self.get_indentation_text_color()
+        indentation_bg_color = self.get_indentation_bg_color()
+        if self.colorized and (indentation_text_color or indentation_bg_color):
+            return ColorManager.colorize(
+                text=indentation,
+                color=indentation_text_color,
+                bg=indentation_bg_color,
+            )
+
+        return indentation
+
+    def _render_indentation_text(self) -> str:
         style = self.get_indentation_style()
         char = self.get_indentation_character()
         level = self.get_indentation()
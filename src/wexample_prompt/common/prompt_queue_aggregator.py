@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class PromptQueueAggregator(BaseClass):
+    """Render the output of worker processes through the parent IoManager.
+
+    Workers print with a QueueOutputHandler; `start()` runs a daemon thread
+    reading their batches from `queue` and printing every record in order
+    through `io`, so live widgets of the parent are not garbled. Each sender
+    gets its own trace decoder, and is dropped when its handler closes.
+
+    With `prefix`, every forwarded response is tagged with its worker name,
+    formatted with `prefix_format` like `WithIoMethods` prefixes. Records are
+    printed whatever the parent verbosity: the workers already filtered them.
+    Batches failing to print are counted in `error_count`, the last exception
+    being kept in `last_error`.
+    """
+
+    io: IoManager = public_field(description="The io manager printing the records")
+    prefix: bool = public_field(
+        default=False, description="Prefix each forwarded response with its worker name"
+    )
+    prefix_format: str = public_field(
+        default="[{prefix}] ",
+        description="Format of the worker prefix, {prefix} being the worker name",
+    )
+    queue: Any = public_field(
+        description="Queue (get) or pipe connection (recv) the worker handlers send to"
+    )
+    _contexts: dict[Any, PromptContext] = private_field(
+        factory=dict, description="Context printing the records of each verbosity"
+    )
+    _errors: int = private_field(
+        default=0, description="Batches that failed to be printed"
+    )
+    _last_error: Exception | None = private_field(
+        default=None, description="The exception of the last failed batch"
+    )
+    _readers: dict[str, PromptTraceReader] = private_field(
+        factory=dict, description="Trace decoder of every sender still open"
+    )
+    _thread: Any = private_field(default=None, description="The reading thread")
+
+    def __enter__(self) -> PromptQueueAggregator:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def error_count(self) -> int:
+        return self._errors
+
+    @property
+    def last_error(self) -> Exception | None:
+        return self._last_error
+
+    def dispatch(self, message: tuple) -> int:
+        """Print the records of one worker batch; return how many were printed."""
+        from wexample_prompt.common.prompt_context import PromptContext
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+
+        sender, worker, chunk = message
+        if chunk is None:
+            self._readers.pop(sender, None)
+            return 0
+
+        reader = self._readers.get(sender)
+        if reader is None:
+            reader = self._readers[sender] = PromptTraceReader()
+
+        prefix = self.prefix_format.format(prefix=worker) if self.prefix else None
+        print_response = self.io.print_response
+        contexts = self._contexts
+        count = 0
+        for record in reader.read(chunk.split("\n")):
+            response: AbstractPromptResponse = record.to_response()
+            if prefix and response.lines:
+                response.lines[0].segments.insert(0, PromptResponseSegment(text=prefix))
+            # The worker context already filtered the records: print each one
+            # at a verbosity showing it.
+            verbosity = response.verbosity
+            context = contexts.get(verbosity)
+            if context is None:
+                context = contexts[verbosity] = PromptContext(verbosity=verbosity)
+            print_response(response=response, context=context)
+            count += 1
+        return count
+
+    def start(self) -> PromptQueueAggregator:
+        """Start the reading thread (no-op if running); return self."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.__class__.__name__}-reader", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Print what was queued before this call, then end the reading thread.
+
+        Only a queue can be stopped this way; with a pipe, close the sending
+        end instead.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        put = getattr(self.queue, "put", None)
+        if put is not None:
+            # Worker batches are tuples: None ends the reading loop.
+            put(None)
+        thread.join(timeout)
+        self._thread = None
+        self.io.flush()
+
+    def _run(self) -> None:
+        receive = getattr(self.queue, "get", None) or self.queue.recv
+        while True:
+            try:
+                message = receive()
+            except (EOFError, OSError):
+                # The pipe was closed.
+                return
+            if message is None:
+                return
+            try:
+                self.dispatch(message)
+            except Exception as error:
+                # A malformed batch must not stop the forwarding of the others:
+                # it is counted and kept for the caller to inspect.
+                self._errors += 1
+                self._last_error = error
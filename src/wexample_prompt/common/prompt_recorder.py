@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import collections
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.recorded_response import RecordedResponse
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class PromptRecorder(BaseClass):
+    """Bounded capture buffer used by IoManager.push_recorder().
+
+    The most recent responses are kept as they are, up to `max_entries`
+    responses or an estimated `max_bytes`. Older ones are compacted into
+    RecordedResponse records (type, timestamp, plain text), kept in memory
+    or, with `spill`, appended to a temporary JSONL file.
+
+    Iterating yields every capture in emission order (spilled records are
+    read back lazily, line by line); `len()` counts all of them.
+    """
+
+    # Rough per-object costs used to estimate the memory held by a response.
+    LINE_OVERHEAD: ClassVar[int] = 120
+    RESPONSE_OVERHEAD: ClassVar[int] = 600
+    SEGMENT_OVERHEAD: ClassVar[int] = 150
+
+    max_bytes: int | None = public_field(
+        default=None,
+        description="Estimated size of the full responses kept before compacting",
+    )
+    max_entries: int | None = public_field(
+        default=None,
+        description="Number of full responses kept before compacting the oldest",
+    )
+    spill: bool = public_field(
+        default=False,
+        description="Append compacted records to a temporary JSONL file instead of memory",
+    )
+    spill_dir: str | None = public_field(
+        default=None,
+        description="Directory of the spill file; None uses the system temp dir",
+    )
+    _compacted: list[RecordedResponse] = private_field(
+        factory=list, description="Compacted records kept in memory (no spill)"
+    )
+    _finalizer: Any = private_field(
+        default=None, description="Removes the spill file when the recorder is dropped"
+    )
+    _live: collections.deque = private_field(
+        factory=collections.deque,
+        description="(response, estimated size) of the full responses, oldest first",
+    )
+    _live_bytes: int = private_field(
+        default=0, description="Estimated size of the full responses"
+    )
+    _spill_file: Any = private_field(
+        default=None, description="Spill file opened for appending"
+    )
+    _spilled_count: int = private_field(
+        default=0, description="Number of records written to the spill file"
+    )
+
+    def __iter__(self) -> Iterator[AbstractPromptResponse | RecordedResponse]:
+        yield from self._iter_spilled()
+        yield from self._compacted
+        # Snapshot: the live deque may rotate while the caller iterates.
+        for response, _size in list(self._live):
+            yield response
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._compacted) + len(self._live)
+
+    @property
+    def compacted_count(self) -> int:
+        return self._spilled_count + len(self._compacted)
+
+    @property
+    def spill_path(self) -> str | None:
+        return None if self._spill_file is None else self._spill_file.name
+
+    def append(self, response: AbstractPromptResponse) -> None:
+        size = 0
+        if self.max_bytes is not None:
+            size = self._estimate_size(response)
+            self._live_bytes += size
+        live = self._live
+        live.append((response, size))
+
+        if (self.max_entries is not None and len(live) > self.max_entries) or (
+            self.max_bytes is not None and self._live_bytes > self.max_bytes
+        ):
+            self._compact()
+
+    def close(self) -> None:
+        """Delete the spill file; spilled records are no longer iterable."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._spill_file = None
+        self._spilled_count = 0
+
+    def _compact(self) -> None:
+        from wexample_prompt.common.recorded_response import RecordedResponse
+
+        live = self._live
+        records = []
+        while live and (
+            (self.max_entries is not None and len(live) > self.max_entries)
+            or (self.max_bytes is not None and self._live_bytes > self.max_bytes)
+        ):
+            response, size = live.popleft()
+            self._live_bytes -= size
+            records.append(RecordedResponse.create_from_response(response))
+
+        if self.spill:
+            self._write_spill(records)
+        else:
+            self._compacted.extend(records)
+
+    def _estimate_size(self, response: AbstractPromptResponse) -> int:
+        size = self.RESPONSE_OVERHEAD + len(response.rendered_content or "")
+        for line in response.lines:
+            size += self.LINE_OVERHEAD
+            for segment in line.segments:
+                size += self.SEGMENT_OVERHEAD + len(segment.text)
+        return size
+
+    def _iter_spilled(self) -> Iterator[RecordedResponse]:
+        import json
+
+        from wexample_prompt.common.recorded_response import RecordedResponse
+
+        if self._spill_file is None:
+            return
+        self._spill_file.flush()
+        remaining = self._spilled_count
+        with open(self._spill_file.name, encoding="utf-8") as spilled:
+            for line in spilled:
+                if remaining <= 0:
+                    break
+                remaining -= 1
+                yield RecordedResponse.from_dict(json.loads(line))
+
+    def _write_spill(self, records: list[RecordedResponse]) -> None:
+        import json
+
+        if self._spill_file is None:
+            import os
+            import tempfile
+            import weakref
+
+            spill_file = tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                prefix="prompt-recorder-",
+                suffix=".jsonl",
+                dir=self.spill_dir,
+                delete=False,
+            )
+            self._spill_file = spill_file
+            self._finalizer = weakref.finalize(
+                self, _remove_spill_file, spill_file, os.remove
+            )
+
+        self._spill_file.write(
+            "".join(json.dumps(record.to_dict()) + "\n" for record in records)
+        )
+        self._spilled_count += len(records)
+
+
+def _remove_spill_file(spill_file: Any, remove: Any) -> None:
+    spill_file.close()
+    try:
+        remove(spill_file.name)
+    except OSError:
+        pass
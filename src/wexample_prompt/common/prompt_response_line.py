@@ -4,10 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from wexample_helpers.classes.base_class import BaseClass
-from wexample_helpers.classes.field import public_field
-from wexample_helpers.decorator.base_class import base_class
-
 if TYPE_CHECKING:
     from wexample_prompt.common.prompt_context import PromptContext
     from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
@@ -15,13 +11,29 @@ if TYPE_CHECKING:
     from wexample_prompt.enums.terminal_color import TerminalColor
 
 
-@base_class
-class PromptResponseLine(BaseClass):
-    """A line of text composed of one or more segments with optional styling and layout."""
+class PromptResponseLine:
+    """A line of text composed of one or more segments with optional styling and layout.
+
+    Like segments, lines are a plain ``__slots__`` class: ``segments`` is the
+    list of text segments that constitute the line.
+    """
+
+    __slots__ = ("segments",)
+
+    segments: list[PromptResponseSegment]
 
-    segments: list[PromptResponseSegment] = public_field(
-        factory=list, description="List of text segments that constitute a line"
-    )
+    def __init__(self, *, segments: list[PromptResponseSegment] | None = None) -> None:
+        self.segments = [] if segments is None else segments
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.segments == other.segments
+
+    __hash__ = None  # Mutable: equal lines may diverge later.
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(segments={self.segments!r})"
 
     @classmethod
     def create_from_string(
@@ -30,45 +42,47 @@ class PromptResponseLine(BaseClass):
         """
         Create a line from a single text string.
         """
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
         from wexample_prompt.common.style_markup_parser import parse_style_markup
 
+        if callable(text):
+            # Lazy message, evaluated when the lines are built.
+            text = text()
         raw_inputs = [text] if isinstance(text, str) else text
-        return [
-            cls(segments=segments)
-            for raw in raw_inputs
-            for segments in parse_style_markup(raw, default_color=color)
-        ]
+        lines: list[PromptResponseLine] = []
+        for raw in raw_inputs:
+            # Fast path: markup-free single line, by far the most common input.
+            if raw and "@" not in raw and "\n" not in raw:
+                lines.append(
+                    cls(segments=[PromptResponseSegment(text=raw, color=color)])
+                )
+                continue
+            lines.extend(
+                cls(segments=segments)
+                for segments in parse_style_markup(raw, default_color=color)
+            )
+        return lines
 
     def render(self, context: PromptContext) -> str:
         """Render the line within the context width, wrapping segments as needed.
         Respect context.formatting: when False, do not reflow/wrap lines.
         """
         indentation = context.render_indentation()
+        max_content_width = context.get_content_width()
         # If formatting is disabled, bypass wrapping logic entirely.
-        if context.formatting is False:
-            return self._render_no_formatting(context, indentation)
-
-        max_content_width = self._compute_max_content_width(context, indentation)
-
-        if not max_content_width:
+        if context.formatting is False or not max_content_width:
+            if not context.colorized:
+                return self._render_plain(indentation)
             return self._render_unbounded(context, indentation)
 
         return self._render_wrapped(context, indentation, max_content_width)
 
-    def _compute_max_content_width(
-        self, context: PromptContext, indentation: str
-    ) -> int | None:
-        """Compute the maximum visible width available for content on a line, or None if unbounded."""
-        if context.width:
-            return context.get_available_width(context.width, minimum=0)
-        return None
-
-    def _render_no_formatting(self, context: PromptContext, indentation: str) -> str:
-        """Render all segments on a single line, without wrapping."""
-        return f"{indentation}{''.join(seg.render(context, line_remaining_width=10**9)[0] for seg in self.segments)}"
+    def _render_plain(self, indentation: str) -> str:
+        """Render without styles nor wrapping: segment texts joined as is."""
+        return indentation + "".join([seg.text for seg in self.segments])
 
     def _render_unbounded(self, context: PromptContext, indentation: str) -> str:
-        """Render without width restriction (no wrapping)."""
+        """Render all segments on a single line, without wrapping."""
         return f"{indentation}{''.join(seg.render(context, line_remaining_width=10**9)[0] for seg in self.segments)}"
 
     def _render_wrapped(
@@ -112,6 +126,10 @@ class PromptResponseLine(BaseClass):
         return "\n".join(lines)
 
     def _visible_len(self, s: str) -> int:
+        if "\x1b" not in s:
+            # Plain text (always the case when rendering uncolorized).
+            return len(s)
+
         from wexample_helpers.helper.ansi import ansi_strip
 
         return len(ansi_strip(s))
@@ -1,39 +1,81 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from wexample_helpers.classes.base_class import BaseClass
-from wexample_helpers.classes.field import public_field
-from wexample_helpers.decorator.base_class import base_class
-
-from wexample_prompt.enums.terminal_color import TerminalColor
-from wexample_prompt.enums.text_style import TextStyle
-
 if TYPE_CHECKING:
     from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.segment_style import SegmentStyle
     from wexample_prompt.enums.terminal_color import TerminalColor
     from wexample_prompt.enums.text_style import TextStyle
 
 
-@base_class
-class PromptResponseSegment(BaseClass):
-    """A segment of text with optional styling."""
+class PromptResponseSegment:
+    """A segment of text with optional styling.
+
+    Segments are created by the million (one per styled run of every line),
+    so this is a plain ``__slots__`` class rather than an attrs ``BaseClass``:
+    no per-instance ``__dict__`` and a hand-written ``__init__``. Attributes:
+
+    - color: the color to apply to segment on rendering, if allowed by context
+    - styles: optional text styles (bold, italic, underline, etc.) to apply
+      when rendering; stored as a tuple so segments can share it, so add a
+      style by assigning a new sequence (``seg.styles = (*seg.styles, BOLD)``)
+      rather than with ``append()``
+    - text: the content of the segment
+    """
 
-    color: TerminalColor | None = public_field(
-        default=None,
-        description="The color to apply to segment on rendering, if allowed by context",
-    )
-    styles: list[TextStyle] = public_field(
-        factory=list,
-        description="Optional text styles (bold, italic, underline, etc.) to apply when rendering",
-    )
-    text: str = public_field(description="The content of the segment")
+    __slots__ = ("_styles", "color", "text")
 
-    def __attrs_post_init__(self) -> None:
-        if "\n" in self.text:
+    color: TerminalColor | None
+    text: str
+
+    def __init__(
+        self,
+        *,
+        text: str,
+        color: TerminalColor | None = None,
+        styles: Iterable[TextStyle] = (),
+    ) -> None:
+        if "\n" in text:
             raise ValueError(
                 "Segment should not contain line breaks; use separate line objects instead"
             )
+        self.color = color
+        self.text = text
+        self._styles = styles if styles.__class__ is tuple else tuple(styles)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.color, self._styles, self.text) == (
+            other.color,
+            other._styles,
+            other.text,
+        )
+
+    __hash__ = None  # Mutable: equal segments may diverge later.
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(color={self.color!r}, "
+            f"styles={self._styles!r}, text={self.text!r})"
+        )
+
+    @property
+    def styles(self) -> tuple[TextStyle, ...]:
+        return self._styles
+
+    @styles.setter
+    def styles(self, styles: Iterable[TextStyle]) -> None:
+        self._styles = styles if styles.__class__ is tuple else tuple(styles)
+
+    @property
+    def style(self) -> SegmentStyle:
+        """The interned style shared by every segment with the same color and styles."""
+        from wexample_prompt.common.segment_style import SegmentStyle
+
+        return SegmentStyle.get(self.color, None, self._styles)
 
     def render(
         self, context: PromptContext, line_remaining_width: int
@@ -44,8 +86,6 @@ class PromptResponseSegment(BaseClass):
         - rendered_fit: the rendered string (possibly colorized) that fits in the remaining width
         - remainder_segment: a new PromptResponseSegment with the leftover RAW text and same color, or None
         """
-        from wexample_prompt.common.color_manager import ColorManager
-
         # Split the RAW text by visible width first (no ANSI involved yet)
         fit_raw, remainder_raw = self._split_by_visible_width(
             self.text, line_remaining_width
@@ -54,15 +94,14 @@ class PromptResponseSegment(BaseClass):
         # Apply styles and color if allowed by context (single reset at the end)
         rendered_fit = fit_raw
         if context.colorized and fit_raw:
-
-            prefix = ColorManager.build_prefix(color=self.color, styles=self.styles)
+            prefix = self.style.prefix
             if prefix:
                 rendered_fit = f"{prefix}{fit_raw}\033[0m"
 
         remainder_seg = None
         if remainder_raw:
             remainder_seg = PromptResponseSegment(
-                text=remainder_raw, color=self.color, styles=list(self.styles)
+                text=remainder_raw, color=self.color, styles=self._styles
             )
         return rendered_fit, remainder_seg
 
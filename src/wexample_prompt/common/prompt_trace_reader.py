@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.common.recorded_response import RecordedResponse
+
+
+@base_class
+class PromptTraceReader(BaseClass):
+    """Decode a trace written by PromptTraceWriter, one response at a time.
+
+    Iterating yields RecordedResponse objects carrying the original type
+    name, timestamp, verbosity and styled lines; the stream is consumed
+    lazily, so a trace of any size can be replayed in constant memory.
+
+    A trace arriving in chunks (eg. from a QueueOutputHandler) is decoded
+    by calling `read()` with each chunk on the same reader, which keeps
+    the styles declared by earlier chunks.
+    """
+
+    stream: Any = public_field(
+        default=None, description="Text stream (or iterable of lines) to read"
+    )
+    _styles: dict[int, tuple] = private_field(
+        factory=dict, description="(color, text styles) of every style id declared"
+    )
+
+    def __iter__(self) -> Iterator[RecordedResponse]:
+        return self.read(self.stream)
+
+    def read(self, lines: Iterable[str]) -> Iterator[RecordedResponse]:
+        """Decode the given trace lines, resolving styles declared so far."""
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+        from wexample_prompt.enums.terminal_color import TerminalColor
+        from wexample_prompt.enums.text_style import TextStyle
+
+        loads = json.loads
+        styles = self._styles
+        for raw in lines:
+            if not raw or raw == "\n":
+                continue
+            record = loads(raw)
+
+            if record.__class__ is dict:
+                if (
+                    record.get("format") != PromptTraceWriter.FORMAT_NAME
+                    or record.get("version") != PromptTraceWriter.FORMAT_VERSION
+                ):
+                    raise ValueError(f"Unsupported prompt trace header: {record}")
+                continue
+
+            kind = record[0]
+            if kind == "s":
+                _, style_id, color, text_styles = record
+                styles[style_id] = (
+                    TerminalColor[color] if color else None,
+                    tuple(TextStyle[name] for name in text_styles),
+                )
+            elif kind == "r":
+                _, response_type, created_at, verbosity, payload = record
+                lines = []
+                for flat in payload:
+                    segments = []
+                    for index in range(0, len(flat), 2):
+                        color, text_styles = styles[flat[index + 1]]
+                        segments.append(
+                            PromptResponseSegment(
+                                text=flat[index], color=color, styles=text_styles
+                            )
+                        )
+                    lines.append(PromptResponseLine(segments=segments))
+                yield RecordedResponse(
+                    response_type=response_type,
+                    lines=lines,
+                    created_at=created_at,
+                    verbosity=verbosity,
+                )
+            else:
+                raise ValueError(f"Unknown prompt trace record kind: {kind!r}")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.recorded_response import RecordedResponse
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.abstract_prompt_output_handler import (
+        AbstractPromptOutputHandler,
+    )
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class PromptTraceReplayer(BaseClass):
+    """Re-render a recorded trace through an output handler.
+
+    Entries may be live responses (a popped recorder), compacted records or
+    records decoded by PromptTraceReader; lines are wrapped again for the
+    replay `width`, so a trace captured on one terminal reads well on another.
+    """
+
+    colorized: bool | None = public_field(
+        default=None,
+        description="Whether to style the output; None asks the output handler",
+    )
+    output: AbstractPromptOutputHandler = public_field(
+        description="Where replayed responses are printed"
+    )
+    verbosity: VerbosityLevel | None = public_field(
+        default=None,
+        description="Replay context verbosity; None replays every response",
+    )
+    width: int | None = public_field(
+        default=None, description="Replay width; None uses the terminal width"
+    )
+
+    def replay(
+        self, entries: Iterable[AbstractPromptResponse | RecordedResponse]
+    ) -> int:
+        """Print every entry in order; return how many were printed."""
+        import shutil
+
+        from wexample_prompt.common.prompt_context import PromptContext
+        from wexample_prompt.common.recorded_response import RecordedResponse
+
+        context = PromptContext(
+            colorized=(
+                self.output.supports_color()
+                if self.colorized is None
+                else self.colorized
+            ),
+            formatting=True,
+            verbosity=self.verbosity,
+            width=self.width or shutil.get_terminal_size().columns,
+        )
+
+        output = self.output
+        count = 0
+        for entry in entries:
+            if entry.__class__ is RecordedResponse:
+                entry = entry.to_response()
+            output.print(response=entry, context=context)
+            count += 1
+        return count
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.common.recorded_response import RecordedResponse
+from wexample_prompt.common.segment_style import SegmentStyle
+
+if TYPE_CHECKING:
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+@base_class
+class PromptTraceWriter(BaseClass):
+    """Stream recorded responses to a compact JSON lines trace.
+
+    Format, one JSON value per line:
+
+    - header: ``{"format": "prompt-trace", "version": 1}``
+    - style: ``["s", id, color_name | null, [text_style_name, ...]]``, written
+      before the first segment using it (styles are interned SegmentStyles)
+    - response: ``["r", type_name, created_at, verbosity, lines]`` where each
+      line is a flat ``[text, style_id, text, style_id, ...]`` list. Responses
+      building their output in ``render()`` (frames, properties...) are
+      stored as their uncolored render, one unstyled segment per line.
+
+    Read it back with PromptTraceReader; nothing but built-in JSON types is
+    stored, so traces can cross process and language boundaries.
+    """
+
+    FORMAT_NAME: ClassVar[str] = "prompt-trace"
+    FORMAT_VERSION: ClassVar[int] = 1
+
+    stream: Any = public_field(description="Text stream the trace lines are written to")
+    _header_written: bool = private_field(
+        default=False, description="Whether the format header was written"
+    )
+    _style_ids: dict = private_field(
+        factory=dict, description="Id of every SegmentStyle already written"
+    )
+
+    def write(self, response: AbstractPromptResponse | RecordedResponse) -> None:
+        self.stream.write(self._encode(response))
+
+    def write_all(
+        self, responses: Iterable[AbstractPromptResponse | RecordedResponse]
+    ) -> int:
+        """Write every response (eg. a popped recorder); return how many were written."""
+        encode = self._encode
+        write = self.stream.write
+        count = 0
+        for response in responses:
+            write(encode(response))
+            count += 1
+        return count
+
+    def _encode(self, response: AbstractPromptResponse | RecordedResponse) -> str:
+        dumps = _dumps
+        chunks: list[str] = []
+        if not self._header_written:
+            chunks.append(
+                dumps({"format": self.FORMAT_NAME, "version": self.FORMAT_VERSION})
+            )
+            self._header_written = True
+
+        style_ids = self._style_ids
+        get_style = SegmentStyle.get
+        if response.__class__ is RecordedResponse:
+            lines = response.lines
+            response_type = response.response_type
+            text = response.text if lines is None else None
+        elif RecordedResponse.lines_describe_output(response):
+            lines = response.lines
+            response_type = response.__class__.__name__
+        else:
+            # Output built by render() (frames, properties, titles...).
+            lines = None
+            response_type = response.__class__.__name__
+            text = RecordedResponse.render_text(response)
+
+        payload = []
+        if lines is None:
+            style_id = style_ids.get(None)
+            if style_id is None:
+                style_id = style_ids[None] = len(style_ids) + 1
+                chunks.append(dumps(["s", style_id, None, []]))
+            payload = [[row, style_id] for row in text.split("\n")]
+        else:
+            for line in lines:
+                flat = []
+                for segment in line.segments:
+                    style = get_style(segment.color, None, segment.styles)
+                    style_id = style_ids.get(style)
+                    if style_id is None:
+                        style_id = style_ids[style] = len(style_ids) + 1
+                        chunks.append(
+                            dumps(
+                                [
+                                    "s",
+                                    style_id,
+                                    style.color.name if style.color else None,
+                                    [text_style.name for text_style in style.styles],
+                                ]
+                            )
+                        )
+                    flat.append(segment.text)
+                    flat.append(style_id)
+                payload.append(flat)
+
+        verbosity = response.verbosity
+        chunks.append(
+            dumps(
+                [
+                    "r",
+                    response_type,
+                    response.created_at,
+                    None if verbosity is None else int(verbosity),
+                    payload,
+                ]
+            )
+        )
+        return "\n".join(chunks) + "\n"
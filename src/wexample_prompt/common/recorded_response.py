@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_response_line import PromptResponseLine
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+class RecordedResponse:
+    """Lightweight record of a captured response: type, timestamp and content.
+
+    A bounded PromptRecorder compacts its oldest responses into these
+    (possibly spilled to disk as JSON lines) so long captures keep no
+    lines, segments or rendered content alive; they then hold plain text.
+    A PromptTraceReader yields them with their styled ``lines`` instead.
+
+    ``render()`` returns the plain text, so trace consumers can treat
+    records like responses; ``to_response()`` rebuilds a printable one.
+    Plain ``__slots__`` class, as many of them may exist at once.
+    """
+
+    __slots__ = ("_text", "created_at", "lines", "response_type", "verbosity")
+
+    created_at: float | None
+    lines: list[PromptResponseLine] | None
+    response_type: str
+    verbosity: int | None
+
+    def __init__(
+        self,
+        *,
+        response_type: str,
+        text: str | None = None,
+        lines: list[PromptResponseLine] | None = None,
+        created_at: float | None = None,
+        verbosity: int | None = None,
+    ) -> None:
+        self._text = text
+        self.created_at = created_at
+        self.lines = lines
+        self.response_type = response_type
+        self.verbosity = verbosity
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(response_type={self.response_type!r}, "
+            f"created_at={self.created_at!r}, text={self.text!r})"
+        )
+
+    @classmethod
+    def create_from_response(cls, response: AbstractPromptResponse) -> RecordedResponse:
+        """Keep the segment texts of each line, without styles or wrapping."""
+        verbosity = response.verbosity
+        return cls(
+            response_type=response.__class__.__name__,
+            text=(
+                cls._lines_to_text(response.lines)
+                if cls.lines_describe_output(response)
+                else cls.render_text(response)
+            ),
+            created_at=response.created_at,
+            verbosity=None if verbosity is None else int(verbosity),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RecordedResponse:
+        return cls(
+            response_type=data["type"],
+            text=data["text"],
+            created_at=data.get("created_at"),
+            verbosity=data.get("verbosity"),
+        )
+
+    @staticmethod
+    def lines_describe_output(response: AbstractPromptResponse) -> bool:
+        """Whether the lines of `response` are what it prints.
+
+        Frames, properties, titles and the other responses overriding
+        `render()` build their output there, from their own fields: their
+        lines may be empty, stale or lack the decorations. Interactive
+        responses keep their lines, rendering them would run the widget.
+        """
+        from wexample_prompt.responses.abstract_prompt_response import (
+            AbstractPromptResponse,
+        )
+        from wexample_prompt.responses.interactive.abstract_interactive_prompt_response import (
+            AbstractInteractivePromptResponse,
+        )
+
+        return response.__class__.render is AbstractPromptResponse.render or (
+            isinstance(response, AbstractInteractivePromptResponse)
+        )
+
+    @staticmethod
+    def render_text(response: AbstractPromptResponse) -> str:
+        """Render `response` without colors nor reflow, at the default width.
+
+        Its rendered content is left as the last real render set it.
+        """
+        from wexample_prompt.common.prompt_context import PromptContext
+
+        rendered_content = response._rendered_content
+        try:
+            return response.render(context=PromptContext(colorized=False)) or ""
+        finally:
+            response._rendered_content = rendered_content
+
+    @staticmethod
+    def _lines_to_text(lines: list[PromptResponseLine]) -> str:
+        return "\n".join(
+            "".join(segment.text for segment in line.segments) for line in lines
+        )
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._lines_to_text(self.lines or [])
+        return self._text
+
+    def render(self, context: PromptContext | None = None) -> str:
+        return self.text
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "type": self.response_type,
+            "created_at": self.created_at,
+            "verbosity": self.verbosity,
+            "text": self.text,
+        }
+
+    def to_response(self) -> AbstractPromptResponse:
+        """Build a response printing these lines (or the plain text) as they are."""
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.enums.verbosity_level import VerbosityLevel
+        from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+        lines = self.lines
+        if lines is None:
+            lines = [
+                PromptResponseLine(
+                    segments=[PromptResponseSegment(text=text)] if text else []
+                )
+                for text in self.text.split("\n")
+            ]
+
+        response = LogPromptResponse(
+            lines=lines,
+            verbosity=(
+                None if self.verbosity is None else VerbosityLevel(self.verbosity)
+            ),
+        )
+        response.created_at = self.created_at
+        return response
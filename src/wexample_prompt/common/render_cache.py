@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class RenderCache(BaseClass):
+    """Global switch and counters for memoized response rendering.
+
+    Rendered strings are stored on each response (so they are released with
+    it), keyed by the context fingerprint; this shared object only decides
+    whether caching is active and counts hits/misses. Bumping the epoch with
+    `invalidate()` makes every stored render stale at once.
+    """
+
+    DEFAULT_MAX_ENTRIES_PER_RESPONSE: ClassVar[int] = 8
+    _shared_instance: ClassVar[RenderCache | None] = None
+
+    enabled: bool = public_field(
+        default=True,
+        description="When False, responses render every time and store nothing",
+    )
+    max_entries_per_response: int = public_field(
+        default=DEFAULT_MAX_ENTRIES_PER_RESPONSE,
+        description="Distinct contexts remembered per response before its entries are dropped",
+    )
+    _epoch: int = private_field(
+        default=0, description="Bumped by invalidate() to expire every stored render"
+    )
+    _hits: int = private_field(
+        default=0, description="Number of renders served from cache"
+    )
+    _lock: Any = private_field(factory=threading.Lock, description="Guards counters")
+    _misses: int = private_field(default=0, description="Number of renders computed")
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared instance (useful for tests)."""
+        cls._shared_instance = None
+
+    @classmethod
+    def shared(cls) -> RenderCache:
+        """Return the process-wide render cache settings used by responses."""
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def invalidate(self) -> None:
+        """Expire every render stored so far and reset counters."""
+        with self._lock:
+            self._epoch += 1
+            self._hits = 0
+            self._misses = 0
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "epoch": self._epoch,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from wexample_prompt.enums.terminal_bg_color import TerminalBgColor
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+
+class SegmentStyle:
+    """Immutable, interned combination of color, background and text styles.
+
+    ``SegmentStyle.get(color, bg, styles)`` always returns the same instance
+    for the same visual result, so segments sharing a style share one object
+    and its ANSI prefix is built only once. Text styles are stored as a
+    bitmask; ``styles`` exposes them as a canonical tuple (enum order).
+    """
+
+    __slots__ = ("bg", "color", "mask", "prefix", "styles")
+
+    # Lookup by raw (color, bg, styles) input, then by canonical value.
+    _BY_INPUT: ClassVar[dict[tuple, SegmentStyle]] = {}
+    _BY_VALUE: ClassVar[dict[tuple, SegmentStyle]] = {}
+    _STYLE_BITS: ClassVar[dict[TextStyle, int] | None] = None
+
+    bg: TerminalBgColor | None
+    color: TerminalColor | None
+    mask: int
+    prefix: str
+    styles: tuple[TextStyle, ...]
+
+    def __init__(
+        self,
+        color: TerminalColor | None,
+        bg: TerminalBgColor | None,
+        mask: int,
+    ) -> None:
+        from wexample_prompt.common.color_manager import ColorManager
+
+        styles = tuple(
+            style for style, bit in self._get_style_bits().items() if mask & bit
+        )
+        prefix = ""
+        if color:
+            prefix += str(color)
+        if bg:
+            prefix += str(bg)
+        prefix += "".join(ColorManager.get_style_ansi(s) for s in styles)
+
+        set_attribute = object.__setattr__
+        set_attribute(self, "bg", bg)
+        set_attribute(self, "color", color)
+        set_attribute(self, "mask", mask)
+        set_attribute(self, "prefix", prefix)
+        set_attribute(self, "styles", styles)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> tuple:
+        return self.__class__.get, (self.color, self.bg, self.styles)
+
+    def __repr__(self) -> str:
+        styles = ", ".join(style.name for style in self.styles)
+        return f"{self.__class__.__name__}(color={self.color}, bg={self.bg}, styles=({styles}))"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    @classmethod
+    def get(
+        cls,
+        color: TerminalColor | None = None,
+        bg: TerminalBgColor | None = None,
+        styles: Iterable[TextStyle] | None = None,
+    ) -> SegmentStyle:
+        """Return the shared instance for this color/background/styles combination."""
+        if styles.__class__ is not tuple:
+            styles = tuple(styles) if styles else ()
+
+        key = (color, bg, styles)
+        instance = cls._BY_INPUT.get(key)
+        if instance is None:
+            bits = cls._get_style_bits()
+            mask = 0
+            for style in styles:
+                mask |= bits.get(style, 0)
+
+            value_key = (color, bg, mask)
+            instance = cls._BY_VALUE.get(value_key)
+            if instance is None:
+                # setdefault keeps a single canonical instance under races.
+                instance = cls._BY_VALUE.setdefault(value_key, cls(color, bg, mask))
+            cls._BY_INPUT[key] = instance
+        return instance
+
+    @classmethod
+    def _get_style_bits(cls) -> dict[TextStyle, int]:
+        if cls._STYLE_BITS is None:
+            from wexample_prompt.enums.text_style import TextStyle
+
+            cls._STYLE_BITS = {
+                style: 1 << index for index, style in enumerate(TextStyle)
+            }
+        return cls._STYLE_BITS
+
+    def has_style(self, style: TextStyle) -> bool:
+        return bool(self.mask & self._get_style_bits().get(style, 0))
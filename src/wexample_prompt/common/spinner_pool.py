@@ -45,11 +45,14 @@ class Spinner(BaseClass):
         self._interval: float = max(0.0, float(self.interval)) or 0.2
         self._last_time: float | None = None
 
-    def next(self) -> str:
+    def next(self, now: float | None = None) -> str:
+        """Return the current frame, advanced by the time elapsed until `now`
+        (a monotonic time, the current one when None)."""
         if not self.frames:
             return ""
 
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
 
         # Initialize last_time on the first call, but do not advance immediately.
         if self._last_time is None:
@@ -88,7 +91,11 @@ class Spinner(BaseClass):
 
 @base_class
 class SpinnerPool(SharedRegistry[Spinner]):
-    """Thread-safe pool for per-key spinners, accessible via SpinnerPool.shared()."""
+    """Thread-safe pool for per-key spinners, accessible via SpinnerPool.shared().
+
+    Spinners advance on the FrameScheduler clock, so every spinner drawn
+    in the same frame shows a frame computed for the same instant.
+    """
 
     _lock: ClassVar[Any] = threading.RLock()
 
@@ -102,8 +109,11 @@ class SpinnerPool(SharedRegistry[Spinner]):
             return sp
 
     def next(self, key: str = "default") -> str:
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+        now = FrameScheduler.shared().clock
         with self._lock:
-            return self.get_or_create(key).next()
+            return self.get_or_create(key).next(now=now)
 
     def reset(self, key: str = "default") -> None:
         with self._lock:
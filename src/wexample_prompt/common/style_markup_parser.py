@@ -4,6 +4,7 @@ import re
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+from wexample_prompt.enums.style_markup_engine import StyleMarkupEngine
 from wexample_prompt.enums.terminal_color import TerminalColor
 
 if TYPE_CHECKING:
@@ -15,7 +16,20 @@ if TYPE_CHECKING:
 _STYLE_DIRECTIVE_PATTERN = re.compile(
     r"@([\w🔴🟥🟠🟧🟡🟨🟢🟩🔵🟦🟣🟪🟤⚫⚪🔷🔹🔶🔸+]+)(?::([^\{\}]+))?\{", re.IGNORECASE
 )
+# Tokenizer alternation: a directive header, or a single brace.
+_MARKUP_TOKEN_PATTERN = re.compile(
+    f"{_STYLE_DIRECTIVE_PATTERN.pattern}|[{{}}]", re.IGNORECASE
+)
 _TOKEN_NORMALIZE_PATTERN = re.compile(r"[^0-9A-Z_]", re.IGNORECASE)
+# Directives whose output depends on when they are parsed (eg ``@time{}`` renders
+# the current clock): texts containing them must never be served from cache.
+_VOLATILE_DIRECTIVE_PATTERN = re.compile(r"@time(?::[^\{\}]+)?\{", re.IGNORECASE)
+# Directives whose content is formatted verbatim instead of being parsed.
+_FORMATTER_DIRECTIVES = frozenset({"path", "time"})
+# Tokenizer frame kinds.
+_FRAME_RAW = 0
+_FRAME_STYLE = 1
+_engine: StyleMarkupEngine = StyleMarkupEngine.TOKENIZER
 _EMOJI_COLOR_MAP: dict[str, TerminalColor] = {
     "🔴": TerminalColor.RED,
     "🟥": TerminalColor.RED,
@@ -63,6 +77,20 @@ def flatten_style_markup(
     """
     from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
 
+    if "@" not in text and "\n" not in text:
+        # Plain single line: at most one segment, whatever the joiner.
+        return (
+            [
+                PromptResponseSegment(
+                    text=text,
+                    color=default_color,
+                    styles=base_styles or (),
+                )
+            ]
+            if text
+            else []
+        )
+
     segments: list[PromptResponseSegment] = []
     parsed_lines = parse_style_markup(
         text=text, default_color=default_color, base_styles=base_styles
@@ -75,6 +103,20 @@ def flatten_style_markup(
     return segments
 
 
+def get_style_markup_engine() -> StyleMarkupEngine:
+    return _engine
+
+
+def is_volatile_markup(text: str) -> bool:
+    """Whether parsing ``text`` twice may give different results (eg ``@time{}``)."""
+    return _VOLATILE_DIRECTIVE_PATTERN.search(text) is not None
+
+
+def is_plain_text(text: str) -> bool:
+    """Whether ``text`` holds no directive at all, so it can skip the parser."""
+    return "@" not in text
+
+
 def markup_to_ansi_string(text: str, *, colorized: bool = True) -> str:
     """Flatten `@color{…}` markup into a single string.
 
@@ -98,6 +140,34 @@ def markup_to_ansi_string(text: str, *, colorized: bool = True) -> str:
     )
 
 
+def parse_plain_text(
+    text: str,
+    default_color: TerminalColor | None = None,
+    base_styles: Iterable[TextStyle] | None = None,
+) -> list[list[PromptResponseSegment]]:
+    """Build segment lines from markup-free text.
+
+    Same output as ``parse_style_markup`` for text where ``is_plain_text``
+    holds, without any scanning: one segment per line, empty lines keep an
+    empty segment and a trailing line break adds no line.
+    """
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+
+    styles = tuple(base_styles) if base_styles else ()
+    if "\n" not in text:
+        if not text:
+            return []
+        return [[PromptResponseSegment(text=text, color=default_color, styles=styles)]]
+
+    parts = text.split("\n")
+    if not parts[-1]:
+        parts.pop()
+    return [
+        [PromptResponseSegment(text=part, color=default_color, styles=styles)]
+        for part in parts
+    ]
+
+
 def parse_style_markup(
     text: str,
     default_color: TerminalColor | None = None,
@@ -118,10 +188,144 @@ def parse_style_markup(
 
     Multiple modifiers can be combined with ``+`` (eg ``@color:blue+bold``).
     Nested directives are supported.
+
+    Markup-free text takes the ``parse_plain_text`` fast path. Other
+    results are memoized in the shared :class:`MarkupCache`; texts using
+    volatile directives (``@time``) are always parsed again. Strings bound from
+    a :class:`MarkupTemplate` are filled from its pre-parsed slots.
     """
+    if "@" not in text:
+        return parse_plain_text(text, default_color, base_styles)
+
+    from wexample_prompt.common.bound_markup import BoundMarkup
+    from wexample_prompt.common.compiled_markup import CompiledMarkup
+    from wexample_prompt.common.markup_cache import MarkupCache
+
+    if isinstance(text, BoundMarkup):
+        return text.to_segment_lines(
+            default_color=default_color, base_styles=base_styles
+        )
+
+    base_styles = tuple(base_styles) if base_styles else ()
+
+    cache = MarkupCache.shared()
+    if not cache.accepts(text) or is_volatile_markup(text):
+        return _parse_style_markup_uncached(text, default_color, base_styles)
+
+    key = (text, default_color, base_styles)
+    compiled = cache.get(key)
+    if compiled is not None:
+        return compiled.to_segments()
+
+    lines = _parse_style_markup_uncached(text, default_color, base_styles)
+    cache.store(key, CompiledMarkup.create_from_lines(lines))
+    return lines
+
+
+def set_style_markup_engine(engine: StyleMarkupEngine) -> StyleMarkupEngine:
+    """Select the implementation behind parse_style_markup; returns the previous one."""
+    global _engine
+
+    previous = _engine
+    _engine = StyleMarkupEngine(engine)
+    return previous
+
+
+def _apply_style_tokens(
+    tokens: str,
+    active_color: TerminalColor | None,
+    active_styles: tuple[TextStyle, ...],
+) -> tuple[TerminalColor | None, tuple[TextStyle, ...]]:
+    from wexample_prompt.enums.text_style import TextStyle
+
+    updated_color = active_color
+    styles_list = active_styles
+
+    for raw_token in tokens.split("+"):
+        token = raw_token.strip()
+        if not token:
+            continue
+
+        if token in _EMOJI_COLOR_MAP:
+            updated_color = _EMOJI_COLOR_MAP[token]
+            continue
+
+        normalized = _TOKEN_NORMALIZE_PATTERN.sub("_", token).upper()
+
+        if normalized in TextStyle.__members__:
+            style = TextStyle[normalized]
+            if style not in styles_list:
+                styles_list = (*styles_list, style)
+            continue
+
+        if normalized in TerminalColor.__members__:
+            updated_color = TerminalColor[normalized]
+            continue
+
+    return updated_color, styles_list
+
+
+def _format_directive(directive_type: str, directive_params: str, content: str) -> str:
+    """Render the content of a ``@path`` or ``@time`` formatter directive."""
+    if directive_type == "path":
+        return _format_path(content, short=(directive_params == "short"))
+    return _format_time(content, directive_params or None)
+
+
+def _format_path(path: str, short: bool = False) -> str:
+    """Format a file path, optionally making it clickable."""
+    try:
+        from wexample_helpers.helper.cli import cli_make_clickable_path
+
+        if short and "/" in path:
+            # Show only filename for short format
+            filename = path.rsplit("/", 1)[-1]
+            return cli_make_clickable_path(path, short_title=filename)
+        return cli_make_clickable_path(path)
+    except ImportError:
+        # Fallback if helper not available
+        return path
+
+
+def _format_time(content: str, fmt: str | None = None) -> str:
+    """Format a timestamp or current time."""
+    from datetime import datetime
+
+    if fmt is None:
+        fmt = "%H:%M:%S"
+
+    # If content is empty, use current time
+    if not content.strip():
+        return datetime.now().strftime(fmt)
+
+    # Try to parse content as timestamp
+    try:
+        # If it's a number, treat as unix timestamp
+        timestamp = float(content)
+        return datetime.fromtimestamp(timestamp).strftime(fmt)
+    except ValueError:
+        # If it's already formatted, return as-is
+        return content
+
+
+def _parse_style_markup_uncached(
+    text: str,
+    default_color: TerminalColor | None,
+    base_styles: Iterable[TextStyle],
+) -> list[list[PromptResponseSegment]]:
+    if _engine is StyleMarkupEngine.REGEX:
+        return _parse_with_regex(text, default_color, base_styles)
+    return _parse_with_tokenizer(text, default_color, base_styles)
+
+
+def _parse_with_regex(
+    text: str,
+    default_color: TerminalColor | None,
+    base_styles: Iterable[TextStyle],
+) -> list[list[PromptResponseSegment]]:
     lines: list[list[PromptResponseSegment]] = []
     current_segments: list[PromptResponseSegment] = []
-    initial_styles = list(base_styles) if base_styles else []
+    initial_styles = tuple(base_styles) if base_styles else ()
 
     def push_text(
         value: str,
@@ -132,7 +336,7 @@ def parse_style_markup(
 
         nonlocal current_segments
 
-        styles_list = list(active_styles)
+        styles_list = tuple(active_styles)
         buffer: list[str] = []
 
         for ch in value:
@@ -143,7 +347,7 @@ def parse_style_markup(
                         PromptResponseSegment(
                             text=segment_text,
                             color=active_color,
-                            styles=list(styles_list),
+                            styles=styles_list,
                         )
                     )
                     buffer = []
@@ -152,7 +356,7 @@ def parse_style_markup(
                         PromptResponseSegment(
                             text="",
                             color=active_color,
-                            styles=list(styles_list),
+                            styles=styles_list,
                         )
                     )
 
@@ -168,42 +372,10 @@ def parse_style_markup(
                 PromptResponseSegment(
                     text=segment_text,
                     color=active_color,
-                    styles=list(styles_list),
+                    styles=styles_list,
                 )
             )
 
-    def apply_tokens(
-        tokens: str, active_color: TerminalColor | None, active_styles: list[TextStyle]
-    ) -> tuple[TerminalColor | None, list[TextStyle]]:
-        from wexample_prompt.enums.terminal_color import TerminalColor
-        from wexample_prompt.enums.text_style import TextStyle
-
-        updated_color = active_color
-        styles_list = list(active_styles)
-
-        for raw_token in tokens.split("+"):
-            token = raw_token.strip()
-            if not token:
-                continue
-
-            if token in _EMOJI_COLOR_MAP:
-                updated_color = _EMOJI_COLOR_MAP[token]
-                continue
-
-            normalized = _TOKEN_NORMALIZE_PATTERN.sub("_", token).upper()
-
-            if normalized in TextStyle.__members__:
-                style = TextStyle[normalized]
-                if style not in styles_list:
-                    styles_list.append(style)
-                continue
-
-            if normalized in TerminalColor.__members__:
-                updated_color = TerminalColor[normalized]
-                continue
-
-        return updated_color, styles_list
-
     def extract_braced_content(source: str, start_index: int) -> tuple[str, int]:
         depth = 0
         i = start_index
@@ -219,44 +391,10 @@ def parse_style_markup(
 
         raise ValueError("Unmatched '{' in style markup.")
 
-    def format_path(path: str, short: bool = False) -> str:
-        """Format a file path, optionally making it clickable."""
-        try:
-            from wexample_helpers.helper.cli import cli_make_clickable_path
-
-            if short and "/" in path:
-                # Show only filename for short format
-                filename = path.rsplit("/", 1)[-1]
-                return cli_make_clickable_path(path, short_title=filename)
-            return cli_make_clickable_path(path)
-        except ImportError:
-            # Fallback if helper not available
-            return path
-
-    def format_time(content: str, fmt: str | None = None) -> str:
-        """Format a timestamp or current time."""
-        from datetime import datetime
-
-        if fmt is None:
-            fmt = "%H:%M:%S"
-
-        # If content is empty, use current time
-        if not content.strip():
-            return datetime.now().strftime(fmt)
-
-        # Try to parse content as timestamp
-        try:
-            # If it's a number, treat as unix timestamp
-            timestamp = float(content)
-            return datetime.fromtimestamp(timestamp).strftime(fmt)
-        except ValueError:
-            # If it's already formatted, return as-is
-            return content
-
     def parse_section(
         section_text: str,
         active_color: TerminalColor | None,
-        active_styles: list[TextStyle],
+        active_styles: tuple[TextStyle, ...],
     ) -> None:
         index = 0
         section_len = len(section_text)
@@ -283,14 +421,8 @@ def parse_style_markup(
                 return
 
             # Handle special formatters (must be explicit directive types)
-            if directive_type == "path":
-                formatted = format_path(content, short=(directive_params == "short"))
-                push_text(formatted, active_color, active_styles)
-                index = next_index
-                continue
-
-            if directive_type == "time":
-                formatted = format_time(content, directive_params or None)
+            if directive_type in _FORMATTER_DIRECTIVES:
+                formatted = _format_directive(directive_type, directive_params, content)
                 push_text(formatted, active_color, active_styles)
                 index = next_index
                 continue
@@ -304,7 +436,7 @@ def parse_style_markup(
                 # For @red{}, @🔵+bold{}, etc., the whole directive_type is the token
                 tokens = directive_type
 
-            child_color, child_styles = apply_tokens(
+            child_color, child_styles = _apply_style_tokens(
                 tokens, active_color, active_styles
             )
             parse_section(content, child_color, child_styles)
@@ -318,3 +450,142 @@ def parse_style_markup(
         lines.append(current_segments)
 
     return lines
+
+
+def _parse_with_tokenizer(
+    text: str,
+    default_color: TerminalColor | None,
+    base_styles: Iterable[TextStyle],
+) -> list[list[PromptResponseSegment]]:
+    """Parse markup in a single left-to-right scan.
+
+    Produces the same output as the regex engine. Nesting is tracked with an
+    explicit stack of frames ``[kind, color, styles, brace_depth, ...]`` so
+    deep input never hits the recursion limit. Braces only count inside
+    directives, as in the regex engine; a directive still open at the end of
+    the input is rolled back and emitted literally.
+    """
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+
+    lines: list[list[PromptResponseSegment]] = []
+    current: list[PromptResponseSegment] = []
+
+    def push_text(
+        value: str, color: TerminalColor | None, styles: tuple[TextStyle, ...]
+    ) -> None:
+        nonlocal current
+
+        start = 0
+        newline = value.find("\n")
+        while newline != -1:
+            if newline > start:
+                current.append(
+                    PromptResponseSegment(
+                        text=value[start:newline], color=color, styles=styles
+                    )
+                )
+            elif not current:
+                current.append(
+                    PromptResponseSegment(text="", color=color, styles=styles)
+                )
+            lines.append(current)
+            current = []
+            start = newline + 1
+            newline = value.find("\n", start)
+
+        if start < len(value):
+            current.append(
+                PromptResponseSegment(
+                    text=value[start:] if start else value,
+                    color=color,
+                    styles=styles,
+                )
+            )
+
+    root = [_FRAME_STYLE, default_color, tuple(base_styles) if base_styles else (), 0]
+    stack: list[list] = [root]
+    frame = root
+    # `index` is where pending text starts, `position` where the scan resumes.
+    index = position = 0
+    search = _MARKUP_TOKEN_PATTERN.search
+
+    while True:
+        match = search(text, position)
+        if match is None:
+            break
+        position = match.end()
+        header = match.group(1)
+
+        if header is None:
+            # Plain braces only matter inside a directive, where they nest.
+            if frame is root:
+                continue
+            if match.group() == "{":
+                frame[3] += 1
+                continue
+            if frame[3]:
+                frame[3] -= 1
+                continue
+
+            # Closing brace of the current directive.
+            start = match.start()
+            stack.pop()
+            parent = stack[-1]
+            if frame[0] == _FRAME_RAW:
+                push_text(
+                    _format_directive(frame[4], frame[5], text[frame[6] : start]),
+                    parent[1],
+                    parent[2],
+                )
+            elif start > index:
+                push_text(text[index:start], frame[1], frame[2])
+            frame = parent
+            index = position
+            continue
+
+        if frame[0] == _FRAME_RAW:
+            # Inside @path/@time: content is kept verbatim, only braces count.
+            frame[3] += 1
+            continue
+
+        start = match.start()
+        if start > index:
+            push_text(text[index:start], frame[1], frame[2])
+
+        directive_type = header.lower()
+        params = match.group(2) or ""
+        rollback = (start, len(lines), current, len(current)) if frame is root else None
+        if directive_type in _FORMATTER_DIRECTIVES:
+            frame = [
+                _FRAME_RAW,
+                None,
+                None,
+                0,
+                directive_type,
+                params,
+                position,
+                rollback,
+            ]
+        else:
+            tokens = params if directive_type == "color" and params else directive_type
+            color, styles = _apply_style_tokens(tokens, frame[1], frame[2])
+            frame = [_FRAME_STYLE, color, styles, 0, rollback]
+        stack.append(frame)
+        index = position
+
+    if len(stack) > 1:
+        # Outermost directive never closed: drop what it emitted and print it
+        # literally, like the regex engine does.
+        opened = stack[1]
+        start, lines_count, segments, segments_count = opened[-1]
+        del lines[lines_count:]
+        del segments[segments_count:]
+        current = segments
+        push_text(text[start:], root[1], root[2])
+    elif index < len(text):
+        push_text(text[index:], root[1], root[2])
+
+    if current:
+        lines.append(current)
+
+    return lines
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Union
 
-LineMessage = Union[str, list[str]]
+# A callable is evaluated only when the response is actually built; a call
+# filtered out by verbosity defers it until the response is rendered.
+LineMessage = Union[str, list[str], Callable[[], Union[str, list[str]]]]
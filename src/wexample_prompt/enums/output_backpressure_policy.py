@@ -0,0 +1,16 @@
+"""Output backpressure policy enumeration."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class OutputBackpressurePolicy(str, Enum):
+    """What an asynchronous output handler does when its queue is full."""
+
+    BLOCK = "block"
+    """Wait on the caller thread until the writer frees a slot (default, lossless)."""
+    DROP_NEWEST = "drop_newest"
+    """Discard the response being printed and count it as dropped."""
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued response to make room and count it as dropped."""
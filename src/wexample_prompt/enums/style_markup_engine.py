@@ -0,0 +1,14 @@
+"""Style markup parsing engine enumeration."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class StyleMarkupEngine(str, Enum):
+    """Implementation used by parse_style_markup."""
+
+    REGEX = "regex"
+    """Original engine: regex search per directive and one recursion per nesting level."""
+    TOKENIZER = "tokenizer"
+    """Single-pass tokenizer with an explicit nesting stack (default)."""
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from typing import TextIO
+
 import wcwidth
 from wexample_helpers.const.terminal import OSC_SEQUENCE_RE
 from wexample_helpers.helper.ansi import ansi_strip
@@ -40,6 +43,74 @@ def terminal_get_visible_width(text: str) -> int:
     return max(0, width)
 
 
+def terminal_supports_color(stream: TextIO | None) -> bool:
+    """Tell whether ANSI styling should be written to `stream`.
+
+    ``FORCE_COLOR`` (any value but ``0``/``false``) forces colors on, a
+    non-empty ``NO_COLOR`` turns them off; otherwise colors are used only
+    when the stream is an interactive terminal that is not ``TERM=dumb``.
+    """
+    force_color = os.environ.get("FORCE_COLOR")
+    if force_color is not None:
+        return force_color.lower() not in ("0", "false")
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("TERM") == "dumb":
+        return False
+
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        # Closed or replaced streams without a usable isatty().
+        return False
+
+
+def terminal_supports_cursor_control(stream: TextIO | None) -> bool:
+    """Tell whether cursor moves and line erases should be written to `stream`.
+
+    Unlike styling, ``NO_COLOR`` keeps them: they only need an interactive
+    terminal that is not ``TERM=dumb``. ``FORCE_COLOR`` forces them on too,
+    as it declares the output a terminal.
+    """
+    force_color = os.environ.get("FORCE_COLOR")
+    if force_color is not None and force_color.lower() not in ("0", "false"):
+        return True
+    if os.environ.get("TERM") == "dumb":
+        return False
+
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        # Closed or replaced streams without a usable isatty().
+        return False
+
+
+def terminal_supports_synchronized_output(stream: TextIO | None) -> bool:
+    """Tell whether `stream` is a terminal known to honor synchronized updates.
+
+    Synchronized output (DEC private mode 2026) makes the terminal hold
+    rendering between the begin and end sequences, so a frame never shows
+    half drawn. Support is inferred from ``TERM`` / ``TERM_PROGRAM``, as
+    querying the terminal would mean reading its reply from stdin.
+    """
+    term = os.environ.get("TERM", "")
+    if term == "dumb":
+        return False
+
+    try:
+        if stream is None or not stream.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+
+    return (
+        term.startswith(("alacritty", "contour", "foot", "wezterm", "xterm-ghostty"))
+        or term == "xterm-kitty"
+        or "KITTY_WINDOW_ID" in os.environ
+        or os.environ.get("TERM_PROGRAM") in ("WezTerm", "ghostty", "iTerm.app")
+    )
+
+
 def terminal_strip_sequences(text: str) -> str:
     """Strip CSI/OSC ANSI escape sequences so width calculations see only visible chars."""
     cleaned = ansi_strip(text)
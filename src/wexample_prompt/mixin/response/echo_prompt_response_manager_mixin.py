@@ -26,17 +26,24 @@ class EchoPromptResponseManagerMixin:
     ) -> EchoPromptResponse:
         from wexample_prompt.responses.echo_prompt_response import EchoPromptResponse
 
-        response = EchoPromptResponse.create_echo(
-            message=message,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = EchoPromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: EchoPromptResponse.create_echo(
+                message=value,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=EchoPromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
@@ -35,6 +35,8 @@ class ChoicePromptResponseManagerMixin:
         reset_on_finish: bool = False,
         predefined_answer: Any = None,
         detail_provider: Any = None,
+        viewport_height: int | None = None,
+        filterable: bool = False,
         **kwargs: Kwargs,
     ) -> ChoicePromptResponse:
         from wexample_prompt.responses.interactive.choice_prompt_response import (
@@ -53,7 +55,10 @@ class ChoicePromptResponseManagerMixin:
             reset_on_finish=reset_on_finish,
             predefined_answer=predefined_answer,
             detail_provider=detail_provider,
+            viewport_height=viewport_height,
+            filterable=filterable,
         )
+        response.synchronized_output = self.synchronized_output
 
         return self.print_response(
             response=response,
@@ -47,6 +47,7 @@ class ConfirmPromptResponseManagerMixin:
             reset_on_finish=reset_on_finish,
             predefined_answer=predefined_answer,
         )
+        response.synchronized_output = self.synchronized_output
 
         return self.print_response(
             response=response,
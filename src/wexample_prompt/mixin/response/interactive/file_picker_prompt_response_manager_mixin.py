@@ -34,6 +34,7 @@ class FilePickerPromptResponseManagerMixin:
         reset_on_finish: bool = False,
         context: PromptContext | None = None,
         predefined_answer: Any = None,
+        filterable: bool = False,
         **kwargs: Kwargs,
     ) -> FilePickerPromptResponse:
         from wexample_prompt.responses.interactive.file_picker_prompt_response import (
@@ -51,7 +52,9 @@ class FilePickerPromptResponseManagerMixin:
             allow_parent_selection=allow_parent_selection,
             reset_on_finish=reset_on_finish,
             predefined_answer=predefined_answer,
+            filterable=filterable,
         )
+        response.synchronized_output = self.synchronized_output
 
         return self.print_response(
             response=response,
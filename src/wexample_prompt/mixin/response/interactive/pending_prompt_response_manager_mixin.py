@@ -42,7 +42,11 @@ class PendingPromptResponseManagerMixin:
             max_lines=max_lines,
             output_color=output_color,
             reset_on_finish=reset_on_finish,
+            verbosity=(
+                verbosity if verbosity is not None else self.default_response_verbosity
+            ),
         )
+        response.synchronized_output = self.synchronized_output
 
         return self.print_response(
             response=response,
@@ -43,6 +43,7 @@ class ScreenPromptResponseManagerMixin:
             ),
             reset_on_finish=reset_on_finish,
         )
+        response.synchronized_output = self.synchronized_output
 
         return self.print_response(
             response=response,
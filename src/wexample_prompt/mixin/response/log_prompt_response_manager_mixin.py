@@ -29,18 +29,25 @@ class LogPromptResponseManagerMixin:
     ) -> AbstractPromptResponse:
         from wexample_prompt.responses.log_prompt_response import LogPromptResponse
 
-        response = LogPromptResponse.create_log(
-            message=message,
-            color=color,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = LogPromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: LogPromptResponse.create_log(
+                message=value,
+                color=color,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=LogPromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
@@ -32,19 +32,26 @@ class DebugPromptResponseManagerMixin:
             DebugPromptResponse,
         )
 
-        response = DebugPromptResponse.create_debug(
-            message=message,
-            color=color,
-            symbol=symbol,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = DebugPromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: DebugPromptResponse.create_debug(
+                message=value,
+                color=color,
+                symbol=symbol,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=DebugPromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
@@ -34,21 +34,28 @@ class ErrorPromptResponseManagerMixin:
             ErrorPromptResponse,
         )
 
-        response = ErrorPromptResponse.create_error(
-            message=message,
-            exception=exception,
-            color=color,
-            symbol=symbol,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = ErrorPromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: ErrorPromptResponse.create_error(
+                message=value,
+                exception=exception,
+                color=color,
+                symbol=symbol,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         printed_response = self.print_response(
             response=response,
-            context=ErrorPromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
 
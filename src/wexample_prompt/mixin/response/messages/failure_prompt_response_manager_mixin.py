@@ -32,19 +32,26 @@ class FailurePromptResponseManagerMixin:
             FailurePromptResponse,
         )
 
-        response = FailurePromptResponse.create_failure(
-            message=message,
-            color=color,
-            symbol=symbol,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = FailurePromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: FailurePromptResponse.create_failure(
+                message=value,
+                color=color,
+                symbol=symbol,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=FailurePromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
@@ -32,19 +32,26 @@ class InfoPromptResponseManagerMixin:
             InfoPromptResponse,
         )
 
-        response = InfoPromptResponse.create_info(
-            message=message,
-            color=color,
-            symbol=symbol,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = InfoPromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: InfoPromptResponse.create_info(
+                message=value,
+                color=color,
+                symbol=symbol,
+                verbosity=verbosity,
             ),
+            message,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=InfoPromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
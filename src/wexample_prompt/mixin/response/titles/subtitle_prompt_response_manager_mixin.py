@@ -36,21 +36,28 @@ class SubtitlePromptResponseManagerMixin:
         # Extract _context_prefix if present (added by apply_prefix_to_kwargs)
         _context_prefix = kwargs.pop("_context_prefix", None)
 
-        response = SubtitlePromptResponse.create_subtitle(
-            text=text,
-            color=color,
-            character=character,
-            width=width,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = SubtitlePromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: SubtitlePromptResponse.create_subtitle(
+                text=value,
+                color=color,
+                character=character,
+                width=width,
+                verbosity=verbosity,
+                _context_prefix=_context_prefix,
             ),
-            _context_prefix=_context_prefix,
+            text,
+            verbosity=verbosity,
+            context=context,
         )
 
         return self.print_response(
             response=response,
-            context=SubtitlePromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
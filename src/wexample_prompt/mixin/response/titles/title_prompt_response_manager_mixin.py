@@ -34,20 +34,27 @@ class TitlePromptResponseManagerMixin:
             TitlePromptResponse,
         )
 
-        response = TitlePromptResponse.create_title(
-            text=text,
-            color=color,
-            character=character,
-            width=width,
-            verbosity=(
-                verbosity if verbosity is not None else self.default_response_verbosity
+        verbosity = (
+            verbosity if verbosity is not None else self.default_response_verbosity
+        )
+        context = TitlePromptResponse.rebuild_context_for_kwargs(
+            context=context, parent_kwargs=kwargs
+        )
+        response = self.create_response(
+            lambda value: TitlePromptResponse.create_title(
+                text=value,
+                color=color,
+                character=character,
+                width=width,
+                verbosity=verbosity,
             ),
+            text,
+            verbosity=verbosity,
+            context=context,
         )
 
         return cast("IoManager", self).print_response(
             response=response,
-            context=TitlePromptResponse.rebuild_context_for_kwargs(
-                context=context, parent_kwargs=kwargs
-            ),
+            context=context,
             frame=frame,
         )
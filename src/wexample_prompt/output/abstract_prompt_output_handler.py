@@ -22,6 +22,21 @@ class AbstractPromptOutputHandler(BaseClass):
     ) -> Any:
         self._raise_not_implemented_error()
 
+    def erase_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+    ) -> Any:
+        """Erase `rendered`, the output `response` had when the erase was
+        requested (for handlers writing on another thread than the caller's).
+
+        The default erases the response as it is now."""
+        return self.erase(response=response)
+
+    def flush(self) -> Any:
+        """Write out anything kept buffered; no-op for unbuffered handlers."""
+        return None
+
     @abstract_method
     def print(
         self,
@@ -29,3 +44,30 @@ class AbstractPromptOutputHandler(BaseClass):
         context: PromptContext | None = None,
     ) -> Any:
         self._raise_not_implemented_error()
+
+    def print_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+        context: PromptContext | None = None,
+    ) -> Any:
+        """Write `rendered`, the output of `response` already rendered by the
+        caller (for handlers writing on another thread than the caller's).
+
+        The default prints the response, its render served from the render
+        cache; handlers writing text override it to write `rendered` as is."""
+        return self.print(response=response, context=context)
+
+    def supports_color(self) -> bool:
+        """Whether rendered output may contain ANSI styling (checked once per IoManager)."""
+        return True
+
+    def supports_cursor_control(self) -> bool:
+        """Whether cursor moves and line erases (to redraw or erase output
+        in place) may be written."""
+        return True
+
+    def supports_synchronized_output(self) -> bool:
+        """Whether interactive frames may be wrapped in synchronized-update
+        sequences (checked once per IoManager)."""
+        return False
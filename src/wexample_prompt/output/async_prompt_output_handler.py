@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import collections
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.enums.output_backpressure_policy import OutputBackpressurePolicy
+from wexample_prompt.output.abstract_prompt_output_handler import (
+    AbstractPromptOutputHandler,
+)
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class AsyncPromptOutputHandler(AbstractPromptOutputHandler):
+    """Wrap another handler and perform its writes on a dedicated thread.
+
+    Responses are rendered on the caller thread (so `print` still returns
+    the rendered text) and their text is queued; a daemon writer thread hands
+    it to the wrapped handler through `print_rendered()`, so a response is
+    never rendered again while the caller may be changing it. A slow
+    terminal or a full pipe only stalls the writer thread.
+
+    The queue is bounded by `max_queue_size`; `policy` decides what happens
+    when it is full, erases being never dropped (see `dropped_count`). Writes
+    failing in the wrapped handler are counted in `error_count`, the last
+    exception being kept in `last_error`. Interactive responses,
+    `flush()` and `close()` drain the queue first, and pending output is
+    drained at interpreter exit.
+    """
+
+    DEFAULT_MAX_QUEUE_SIZE: ClassVar[int] = 1024
+
+    handler: AbstractPromptOutputHandler = public_field(
+        description="The handler performing the actual writes, called from the writer thread"
+    )
+    max_queue_size: int = public_field(
+        default=DEFAULT_MAX_QUEUE_SIZE,
+        description="Number of responses that may wait for the writer thread",
+    )
+    policy: OutputBackpressurePolicy = public_field(
+        default=OutputBackpressurePolicy.BLOCK,
+        converter=OutputBackpressurePolicy,
+        description="What print() does when the queue is full",
+    )
+    _closed: bool = private_field(
+        default=False, description="Set by close(); later writes go straight through"
+    )
+    _condition: Any = private_field(
+        factory=threading.Condition,
+        description="Guards the queue and signals free slots, new items and idleness",
+    )
+    _dropped: int = private_field(
+        default=0, description="Responses discarded by a drop policy"
+    )
+    _errors: int = private_field(
+        default=0, description="Writes the wrapped handler failed"
+    )
+    _last_error: Exception | None = private_field(
+        default=None, description="The exception of the last failed write"
+    )
+    _queue: collections.deque = private_field(
+        factory=collections.deque,
+        description="Pending (operation, response, rendered, context) items, oldest first",
+    )
+    _thread: Any = private_field(default=None, description="The writer thread")
+    _unfinished: int = private_field(
+        default=0, description="Queued items plus the one being written"
+    )
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped
+
+    @property
+    def error_count(self) -> int:
+        return self._errors
+
+    @property
+    def last_error(self) -> Exception | None:
+        return self._last_error
+
+    @property
+    def pending_count(self) -> int:
+        return self._unfinished
+
+    def close(self) -> None:
+        """Drain pending output and stop the writer thread."""
+        import atexit
+
+        atexit.unregister(self.close)
+        self.drain()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.handler.flush()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued item is written; False if `timeout` expired first."""
+        with self._condition:
+            if self._thread is threading.current_thread():
+                return self._unfinished <= 1
+            return self._condition.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def erase(
+        self,
+        response: AbstractPromptResponse,
+    ) -> Any:
+        if self._closed:
+            return self.handler.erase(response=response)
+        # Queued too, so the cursor moves after the lines it erases are written.
+        self._enqueue(("erase", response, response.rendered_content, None))
+
+    def flush(self) -> Any:
+        self.drain()
+        return self.handler.flush()
+
+    def print(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> Any:
+        from wexample_prompt.responses.interactive.abstract_interactive_prompt_response import (
+            AbstractInteractivePromptResponse,
+        )
+
+        if self._closed or isinstance(response, AbstractInteractivePromptResponse):
+            # Interactive responses draw and read the terminal themselves.
+            self.drain()
+            return self.handler.print(response=response, context=context)
+
+        rendered_response = response.render(context=context)
+        self._enqueue(("print", response, rendered_response, context))
+
+        return rendered_response
+
+    def supports_color(self) -> bool:
+        return self.handler.supports_color()
+
+    def supports_cursor_control(self) -> bool:
+        return self.handler.supports_cursor_control()
+
+    def supports_synchronized_output(self) -> bool:
+        return self.handler.supports_synchronized_output()
+
+    def _enqueue(self, item: tuple) -> None:
+        condition = self._condition
+        queue = self._queue
+        with condition:
+            if self._thread is None:
+                self._start()
+
+            if len(queue) >= self.max_queue_size:
+                if (
+                    self.policy is OutputBackpressurePolicy.DROP_NEWEST
+                    and item[0] == "print"
+                ):
+                    self._dropped += 1
+                    return
+                if (
+                    self.policy is OutputBackpressurePolicy.DROP_OLDEST
+                    and self._drop_oldest_print()
+                ):
+                    pass
+                elif self._thread is threading.current_thread():
+                    # Written from the writer itself (eg. by a wrapped handler):
+                    # waiting would never end.
+                    pass
+                else:
+                    condition.wait_for(lambda: len(queue) < self.max_queue_size)
+
+            queue.append(item)
+            self._unfinished += 1
+            condition.notify_all()
+
+    def _drop_oldest_print(self) -> bool:
+        # Erases stay queued: dropping one would leave its lines on screen.
+        queue = self._queue
+        for index, item in enumerate(queue):
+            if item[0] == "print":
+                del queue[index]
+                self._unfinished -= 1
+                self._dropped += 1
+                return True
+        return False
+
+    def _run(self) -> None:
+        condition = self._condition
+        queue = self._queue
+        while True:
+            with condition:
+                condition.wait_for(lambda: queue or self._closed)
+                if not queue:
+                    return
+                operation, response, rendered, context = queue.popleft()
+                # Wake callers blocked on a full queue.
+                condition.notify_all()
+
+            try:
+                if operation == "print":
+                    self.handler.print_rendered(
+                        response=response, rendered=rendered, context=context
+                    )
+                else:
+                    self.handler.erase_rendered(response=response, rendered=rendered)
+            except Exception as error:
+                # A failing write must not stop the writer nor block drain():
+                # it is counted and kept for the caller to inspect.
+                with condition:
+                    self._errors += 1
+                    self._last_error = error
+            finally:
+                with condition:
+                    self._unfinished -= 1
+                    if not self._unfinished:
+                        condition.notify_all()
+
+    def _start(self) -> None:
+        import atexit
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.__class__.__name__}-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.output.abstract_prompt_output_handler import (
+    AbstractPromptOutputHandler,
+)
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.live.live_region import LiveRegion
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class LiveRegionOutputHandler(AbstractPromptOutputHandler):
+    """Output of an io while a LiveRegion runs (installed by `start()`).
+
+    Responses drawn by a slot only refresh the region, spinners get a slot
+    of their own, other interactive responses draw with the region erased,
+    and everything else is printed above the region on the next frame (or
+    by the previous handler right away, when the region is not redrawn).
+    """
+
+    handler: AbstractPromptOutputHandler = public_field(
+        description="The io output before the region started, used while suspended"
+    )
+    region: LiveRegion = public_field(description="The region printed above")
+
+    def erase(
+        self,
+        response: AbstractPromptResponse,
+    ) -> Any:
+        with self.region.suspend():
+            return self.handler.erase(response=response)
+
+    def flush(self) -> Any:
+        if self.region.interactive:
+            self.region.paint()
+        return self.handler.flush()
+
+    def print(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> Any:
+        from wexample_prompt.responses.interactive.abstract_interactive_prompt_response import (
+            AbstractInteractivePromptResponse,
+        )
+        from wexample_prompt.responses.interactive.spinner_prompt_response import (
+            SpinnerPromptResponse,
+        )
+
+        region = self.region
+        if region.get_slot(response) is not None:
+            region.refresh()
+            return None
+
+        if isinstance(response, SpinnerPromptResponse):
+            region.add_spinner(response)
+            return None
+
+        if isinstance(response, AbstractInteractivePromptResponse):
+            with region.suspend():
+                return self.handler.print(response=response, context=context)
+
+        if not region.interactive:
+            # Nothing is redrawn: printed in order with the rest.
+            return self.handler.print(response=response, context=context)
+
+        rendered_response = response.render(context=context)
+        if rendered_response:
+            region.print(rendered_response)
+
+        return rendered_response
+
+    def supports_color(self) -> bool:
+        return self.handler.supports_color()
+
+    def supports_cursor_control(self) -> bool:
+        return self.handler.supports_cursor_control()
+
+    def supports_synchronized_output(self) -> bool:
+        return self.handler.supports_synchronized_output()
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.output.prompt_stdout_output_handler import (
+    PromptStdoutOutputHandler,
+)
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class PromptAsyncioOutputHandler(PromptStdoutOutputHandler):
+    """Stdout handler writing through the event loop without blocking it.
+
+    Once `connect()` has been awaited (the `io.aio` facade does it), the
+    handler writes to its own open file description of the stream (reopened
+    from `/proc/self/fd` or the tty path) in non-blocking mode, so the
+    stream itself and every other writer keep blocking writes. Data the
+    descriptor does not take right away is buffered and written when the
+    loop reports it writable; `drain()` waits for that buffer to go below
+    HIGH_WATER_MARK. Writes from other threads are handed to the loop to
+    stay in order.
+
+    Blocking writes on the loop thread (interactive responses, `flush()`,
+    `close()`) first write out the buffer. Before connecting, when the
+    stream is a regular file (which never blocks) or cannot be reopened,
+    writes go through the stream synchronously. `close()` also runs when
+    the loop shuts down, as `asyncio.run()` does once its coroutine returns.
+    """
+
+    HIGH_WATER_MARK: ClassVar[int] = 64 * 1024
+
+    stream: Any = public_field(
+        default=None,
+        description="Text stream written to; None resolves sys.stdout at write time",
+    )
+    _buffer: bytearray = private_field(
+        factory=bytearray,
+        description="Data waiting for the descriptor to be writable, loop thread only",
+    )
+    _closer: Any = private_field(
+        default=None,
+        description="Task closing the descriptor when its loop cancels it at shutdown",
+    )
+    _fd: int | None = private_field(
+        default=None,
+        description="Non-blocking descriptor on its own file description, None when "
+        "writing directly",
+    )
+    _loop: Any = private_field(
+        default=None, description="The event loop owning the descriptor"
+    )
+    _waiters: list = private_field(
+        factory=list, description="drain() futures waiting for the buffer to shrink"
+    )
+
+    def close(self) -> None:
+        """Write out the buffer and close the non-blocking descriptor."""
+        import os
+
+        closer = self._closer
+        self._closer = None
+        if (
+            closer is not None
+            and closer is not asyncio.current_task(self._loop)
+            and not self._loop.is_closed()
+        ):
+            closer.cancel()
+
+        fd = self._fd
+        if fd is None:
+            return
+
+        if not self._loop.is_closed():
+            self._loop.remove_writer(fd)
+        self._flush_buffer()
+        self._wake_waiters()
+        self._fd = None
+        self._loop = None
+        os.close(fd)
+
+    async def connect(self) -> bool:
+        """Open the non-blocking descriptor on the running loop.
+
+        Returns False when writing stays direct.
+        """
+        import os
+        import stat
+
+        loop = asyncio.get_running_loop()
+        if self._fd is not None:
+            if self._loop is loop:
+                return True
+            self.close()
+
+        stream = self._get_stream()
+        try:
+            fileno = stream.fileno()
+            mode = os.fstat(fileno).st_mode
+        except (AttributeError, OSError, ValueError):
+            return False
+        if os.name != "posix" or not (stat.S_ISFIFO(mode) or stat.S_ISCHR(mode)):
+            return False
+
+        # A dup() would share the non-blocking flag with the stream: open a
+        # new file description of the same pipe or terminal instead.
+        if os.isatty(fileno):
+            path = os.ttyname(fileno)
+        elif os.path.isdir("/proc/self/fd"):
+            path = f"/proc/self/fd/{fileno}"
+        else:
+            return False
+
+        stream.flush()
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+        except OSError:
+            return False
+
+        self._fd = fd
+        self._loop = loop
+        self._closer = loop.create_task(self._close_on_shutdown())
+        return True
+
+    async def drain(self) -> None:
+        """Wait until the buffer is below HIGH_WATER_MARK (no-op when writing directly)."""
+        while self._fd is not None and len(self._buffer) > self.HIGH_WATER_MARK:
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+    def erase(
+        self,
+        response: AbstractPromptResponse,
+    ) -> Any:
+        self.write(self._render_erase(response.rendered_content))
+
+    def erase_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+    ) -> Any:
+        self.write(self._render_erase(rendered))
+
+    def flush(self) -> Any:
+        if self._fd is None:
+            self._get_stream().flush()
+        elif self._on_loop():
+            self._flush_buffer()
+
+    def print(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> Any:
+        from wexample_prompt.responses.interactive.abstract_interactive_prompt_response import (
+            AbstractInteractivePromptResponse,
+        )
+
+        if isinstance(response, AbstractInteractivePromptResponse):
+            # Interactive responses draw and read the terminal themselves,
+            # after what is already buffered.
+            self.flush()
+            return super().print(response=response, context=context)
+
+        rendered_response = response.render(context=context)
+        if rendered_response:
+            self.write(rendered_response + "\n")
+
+        return rendered_response
+
+    def print_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+        context: PromptContext | None = None,
+    ) -> Any:
+        if rendered:
+            self.write(rendered + "\n")
+
+        return rendered
+
+    def supports_color(self) -> bool:
+        from wexample_prompt.helper.terminal import terminal_supports_color
+
+        return terminal_supports_color(self._get_stream())
+
+    def supports_cursor_control(self) -> bool:
+        from wexample_prompt.helper.terminal import terminal_supports_cursor_control
+
+        return terminal_supports_cursor_control(self._get_stream())
+
+    def supports_synchronized_output(self) -> bool:
+        from wexample_prompt.helper.terminal import (
+            terminal_supports_synchronized_output,
+        )
+
+        return terminal_supports_synchronized_output(self._get_stream())
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+
+        loop = self._loop
+        if self._fd is not None:
+            data = self._encode(text)
+            if self._on_loop():
+                self._send(data)
+                return
+            try:
+                # Keep the order of the loop writes: the loop thread sends it.
+                loop.call_soon_threadsafe(self._send, data)
+                return
+            except (AttributeError, RuntimeError):
+                # Closed meanwhile.
+                pass
+
+        self._write_direct(text)
+
+    async def _close_on_shutdown(self) -> None:
+        # Waits until the loop cancels its remaining tasks before closing.
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if self._closer is asyncio.current_task():
+                self.close()
+
+    def _encode(self, text: str) -> bytes:
+        return text.encode(self._get_encoding(), "replace")
+
+    def _flush_buffer(self) -> None:
+        # Blocking write of the buffer, waiting for the descriptor as needed.
+        import os
+        import select
+
+        buffer = self._buffer
+        while buffer:
+            try:
+                del buffer[: os.write(self._fd, buffer)]
+            except BlockingIOError:
+                select.select([], [self._fd], [])
+
+    def _get_encoding(self) -> str:
+        return getattr(self._get_stream(), "encoding", None) or "utf-8"
+
+    def _get_stream(self) -> Any:
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _on_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _on_writable(self) -> None:
+        import os
+
+        buffer = self._buffer
+        try:
+            del buffer[: os.write(self._fd, buffer)]
+        except BlockingIOError:
+            return
+
+        if not buffer:
+            self._loop.remove_writer(self._fd)
+        if len(buffer) <= self.HIGH_WATER_MARK:
+            self._wake_waiters()
+
+    def _send(self, data: bytes) -> None:
+        import os
+
+        if self._fd is None:
+            # Closed since a thread scheduled it.
+            self._write_direct(data.decode(self._get_encoding(), "replace"))
+            return
+
+        buffer = self._buffer
+        if not buffer:
+            try:
+                data = data[os.write(self._fd, data) :]
+            except BlockingIOError:
+                pass
+            if not data:
+                return
+            self._loop.add_writer(self._fd, self._on_writable)
+        buffer.extend(data)
+
+    def _wake_waiters(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _write_direct(self, text: str) -> None:
+        stream = self._get_stream()
+        with self.WRITE_LOCK:
+            stream.write(text)
+            stream.flush()
@@ -77,3 +77,15 @@ class PromptBufferOutputHandler(AbstractPromptOutputHandler):
             self.append_rendered(rendered_response)
 
         return rendered_response
+
+    def print_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+        context: PromptContext | None = None,
+    ) -> Any:
+        self._buffer_responses.append(response)
+        if rendered is not None:
+            self.append_rendered(rendered)
+
+        return rendered
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import io
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.output.prompt_stdout_output_handler import (
+    PromptStdoutOutputHandler,
+)
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+@base_class
+class PromptBufferedStdoutOutputHandler(PromptStdoutOutputHandler):
+    """Stdout handler that batches rendered responses into fewer writes.
+
+    Output is accumulated and written in one `write` + `flush` when the
+    buffer reaches `max_buffer_size` characters, when `flush_interval`
+    seconds have passed since the oldest pending response, before any
+    interactive response or erase (they write cursor-control sequences
+    themselves), on `flush()` and at interpreter exit.
+    """
+
+    DEFAULT_FLUSH_INTERVAL: ClassVar[float] = 0.1
+    DEFAULT_MAX_BUFFER_SIZE: ClassVar[int] = 64 * 1024
+
+    flush_interval: float | None = public_field(
+        default=DEFAULT_FLUSH_INTERVAL,
+        description="Seconds pending output may wait before being written; None waits for "
+        "the size threshold or an explicit flush",
+    )
+    max_buffer_size: int = public_field(
+        default=DEFAULT_MAX_BUFFER_SIZE,
+        description="Number of pending characters that triggers a write",
+    )
+    _atexit_registered: bool = private_field(
+        default=False, description="Whether flush() is registered to run at exit"
+    )
+    _buffer: io.StringIO = private_field(
+        factory=io.StringIO, description="Rendered output waiting to be written"
+    )
+    _lock: Any = private_field(
+        factory=threading.RLock, description="Guards the pending chunks and the timer"
+    )
+    _pending_since: float | None = private_field(
+        default=None, description="Monotonic time of the oldest pending chunk"
+    )
+    _timer: Any = private_field(
+        default=None,
+        description="Daemon timer flushing pending output once flush_interval elapses",
+    )
+
+    @property
+    def pending_size(self) -> int:
+        return self._buffer.tell()
+
+    def erase(
+        self,
+        response: AbstractPromptResponse,
+    ) -> Any:
+        self.flush()
+        return super().erase(response=response)
+
+    def erase_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+    ) -> Any:
+        self.flush()
+        return super().erase_rendered(response=response, rendered=rendered)
+
+    def flush(self) -> Any:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending_since is not None:
+                self._write_stdout(self._buffer.getvalue())
+                self._buffer.seek(0)
+                self._buffer.truncate()
+                self._pending_since = None
+            else:
+                sys.stdout.flush()
+
+    def print(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> Any:
+        from wexample_prompt.responses.interactive.abstract_interactive_prompt_response import (
+            AbstractInteractivePromptResponse,
+        )
+
+        if isinstance(response, AbstractInteractivePromptResponse):
+            # Interactive responses draw and read the terminal themselves.
+            self.flush()
+            return super().print(response=response, context=context)
+
+        rendered_response = response.render(context=context)
+        if rendered_response:
+            self._write(rendered_response + "\n")
+
+        return rendered_response
+
+    def print_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+        context: PromptContext | None = None,
+    ) -> Any:
+        if rendered:
+            self._write(rendered + "\n")
+
+        return rendered
+
+    def _schedule_flush(self) -> None:
+        import atexit
+
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+        if self.flush_interval is not None and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _write(self, text: str) -> None:
+        # Per-line path: no field assignment besides the first chunk of a batch.
+        with self._lock:
+            now = time.monotonic()
+            if self._pending_since is None:
+                self._pending_since = now
+            self._buffer.write(text)
+
+            if self._buffer.tell() >= self.max_buffer_size or (
+                self.flush_interval is not None
+                and now - self._pending_since >= self.flush_interval
+            ):
+                self.flush()
+            else:
+                self._schedule_flush()
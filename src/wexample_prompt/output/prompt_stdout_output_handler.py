@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import shutil
 import sys
-from typing import TYPE_CHECKING, Any
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.decorator.base_class import base_class
 
@@ -19,11 +20,24 @@ if TYPE_CHECKING:
 
 @base_class
 class PromptStdoutOutputHandler(AbstractPromptOutputHandler):
+    # Shared by every handler writing to the process stdout: each rendered
+    # block goes out in one write under it, so threads never tear lines.
+    WRITE_LOCK: ClassVar[Any] = threading.Lock()
+
     def erase(
         self,
         response: AbstractPromptResponse,
     ) -> Any:
-        sys.stdout.write(self._render_erase(response))
+        self._write_stdout(self._render_erase(response.rendered_content))
+
+    def erase_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+    ) -> Any:
+        self._write_stdout(self._render_erase(rendered))
+
+    def flush(self) -> Any:
         sys.stdout.flush()
 
     def print(
@@ -35,16 +49,43 @@ class PromptStdoutOutputHandler(AbstractPromptOutputHandler):
         if rendered_response:
             # Equivalent of print
             # Use stdout directly for consistency with erase()
-            sys.stdout.write(rendered_response + "\n")
-            sys.stdout.flush()
+            self._write_stdout(rendered_response + "\n")
 
         return rendered_response
 
-    def _render_erase(self, response: AbstractPromptResponse) -> str:
+    def print_rendered(
+        self,
+        response: AbstractPromptResponse,
+        rendered: str | None,
+        context: PromptContext | None = None,
+    ) -> Any:
+        if rendered:
+            self._write_stdout(rendered + "\n")
+
+        return rendered
+
+    def supports_color(self) -> bool:
+        from wexample_prompt.helper.terminal import terminal_supports_color
+
+        return terminal_supports_color(sys.stdout)
+
+    def supports_cursor_control(self) -> bool:
+        from wexample_prompt.helper.terminal import terminal_supports_cursor_control
+
+        return terminal_supports_cursor_control(sys.stdout)
+
+    def supports_synchronized_output(self) -> bool:
+        from wexample_prompt.helper.terminal import (
+            terminal_supports_synchronized_output,
+        )
+
+        return terminal_supports_synchronized_output(sys.stdout)
+
+    def _render_erase(self, content: str | None) -> str:
         from wexample_helpers.helper.ansi import ansi_display_width
 
-        content = response.rendered_content
-        if not content:
+        if not content or not self.supports_cursor_control():
+            # Nothing to erase, or piped output which can't be erased.
             return ""
 
         # Compute how many visual rows were used, accounting for wrapping.
@@ -56,3 +97,8 @@ class PromptStdoutOutputHandler(AbstractPromptOutputHandler):
         )
 
         return "\x1b[F" + "\r\x1b[2K\x1b[1A" * (total_rows - 1) + "\r\x1b[2K\r"
+
+    def _write_stdout(self, text: str) -> None:
+        with self.WRITE_LOCK:
+            sys.stdout.write(text)
+            sys.stdout.flush()
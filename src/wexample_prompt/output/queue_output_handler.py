@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.output.abstract_prompt_output_handler import (
+    AbstractPromptOutputHandler,
+)
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+    from wexample_prompt.responses.abstract_prompt_response import (
+        AbstractPromptResponse,
+    )
+
+
+class _PendingChunks(list):
+    """Encoded trace lines waiting to be sent, used as the trace writer stream."""
+
+    write = list.append
+
+
+@base_class
+class QueueOutputHandler(AbstractPromptOutputHandler):
+    """Forward responses to a parent process instead of writing them.
+
+    Meant for the IoManager of a worker process: responses are not rendered
+    but encoded as compact prompt trace records (styled segment texts, see
+    PromptTraceWriter) and sent in batches of up to `batch_size` records, or
+    once `flush_interval` has elapsed, as `(sender, worker, chunk)` tuples
+    on a `multiprocessing` queue (anything with `put()`) or pipe connection
+    (anything with `send()`). A PromptQueueAggregator in the parent renders
+    them through the parent IoManager.
+
+    Pending records are sent on `flush()`, `close()` and when the process
+    exits. A handler inherited through fork starts a new trace of its own.
+    Interactive responses are forwarded as a snapshot of their lines.
+
+    Visibility is decided here, by the context of the worker io: the parent
+    prints every record it receives.
+    """
+
+    DEFAULT_BATCH_SIZE: ClassVar[int] = 256
+    DEFAULT_FLUSH_INTERVAL: ClassVar[float] = 0.05
+
+    batch_size: int = public_field(
+        default=DEFAULT_BATCH_SIZE,
+        description="Number of pending records that triggers a send",
+    )
+    flush_interval: float | None = public_field(
+        default=DEFAULT_FLUSH_INTERVAL,
+        description="Seconds pending records may wait before being sent; None waits "
+        "for a full batch or an explicit flush",
+    )
+    queue: Any = public_field(
+        description="Queue (put) or pipe connection (send) read by the parent aggregator"
+    )
+    worker: str | None = public_field(
+        default=None,
+        description="Name the parent may prefix the worker output with; None uses the pid",
+    )
+    _lock: Any = private_field(
+        factory=threading.RLock, description="Guards the pending records and the timer"
+    )
+    _pending: _PendingChunks = private_field(
+        factory=_PendingChunks, description="Encoded records not sent yet"
+    )
+    _pid: int | None = private_field(
+        default=None, description="Process the trace writer was created in"
+    )
+    _sender: str | None = private_field(
+        default=None,
+        description="Identifies this trace (pid and handler) for the parent decoder",
+    )
+    _timer: Any = private_field(
+        default=None,
+        description="Daemon timer sending pending records once flush_interval elapses",
+    )
+    _writer: PromptTraceWriter | None = private_field(
+        default=None, description="Encodes responses into _pending"
+    )
+
+    def close(self) -> None:
+        """Send pending records and tell the aggregator this trace has ended."""
+        with self._get_lock():
+            if self._writer is None:
+                return
+            self.flush()
+            self._put((self._sender, self._get_worker(), None))
+            self._writer = None
+
+    def erase(
+        self,
+        response: AbstractPromptResponse,
+    ) -> Any:
+        # Forwarded output is append-only: nothing to erase in the parent.
+        return None
+
+    def flush(self) -> Any:
+        with self._get_lock():
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = self._pending
+            if pending:
+                chunk = "".join(pending)
+                pending.clear()
+                self._put((self._sender, self._get_worker(), chunk))
+
+    def print(
+        self,
+        response: AbstractPromptResponse,
+        context: PromptContext | None = None,
+    ) -> Any:
+        verbosity = response.verbosity
+        if (
+            context is not None
+            and context.verbosity is not None
+            and verbosity is not None
+            and verbosity > context.verbosity
+        ):
+            # Hidden by the worker context, as a rendering handler would.
+            return None
+
+        with self._get_lock():
+            writer = self._writer
+            if writer is None:
+                writer = self._start()
+            writer.write(response)
+
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            elif self.flush_interval is not None and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        # Nothing is rendered in this process.
+        return None
+
+    def _get_lock(self) -> Any:
+        if self._pid is not None and self._pid != os.getpid():
+            # Inherited through fork, checked before locking: the lock may be
+            # held by a parent thread, which does not exist here, and the
+            # pending records belong to the parent trace.
+            self._lock = threading.RLock()
+            self._pending = _PendingChunks()
+            self._pid = None
+            self._timer = None
+            self._writer = None
+        return self._lock
+
+    def _get_worker(self) -> str:
+        return self.worker if self.worker is not None else str(self._pid)
+
+    def _put(self, message: tuple) -> None:
+        put = getattr(self.queue, "put", None)
+        if put is None:
+            self.queue.send(message)
+        else:
+            put(message)
+
+    def _start(self) -> PromptTraceWriter:
+        import atexit
+        from multiprocessing import util
+
+        from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+
+        pid = os.getpid()
+        if self._pid != pid:
+            self._pid = pid
+            # multiprocessing children skip atexit; their finalizers run before
+            # the queue feeder thread is flushed (higher priorities run first).
+            atexit.register(self.close)
+            util.Finalize(None, self.close, exitpriority=100)
+
+        self._sender = f"{pid}:{id(self)}"
+        self._timer = None
+        self._writer = PromptTraceWriter(stream=self._pending)
+        return self._writer
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 import attrs
 from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.classes.mixin.has_snake_short_class_name_class_mixin import (
     HasSnakeShortClassNameClassMixin,
 )
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from wexample_helpers.const.types import Kwargs
 
     from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.const.types import LineMessage
     from wexample_prompt.example.abstract_response_example import (
         AbstractResponseExample,
     )
@@ -41,6 +43,22 @@ class AbstractPromptResponse(HasSnakeShortClassNameClassMixin):
         default=None,
         description="The context verbosity, saying which response to render or not",
     )
+    _deferred: Callable[[], AbstractPromptResponse] | None = private_field(
+        default=None,
+        description="Factory building the actual fields on first use, see defer()",
+    )
+    _render_cache: dict = private_field(
+        factory=dict,
+        description="Rendered strings indexed by context fingerprint, valid for _render_cache_state",
+    )
+    _render_cache_state: tuple | None = private_field(
+        default=None,
+        description="(lines, generation, epoch) the cached renders were computed for",
+    )
+    _render_generation: int = private_field(
+        default=0,
+        description="Dirty counter bumped by mark_dirty() on in-place changes",
+    )
     _rendered_content: str | None = None
 
     @classmethod
@@ -81,7 +99,7 @@ class AbstractPromptResponse(HasSnakeShortClassNameClassMixin):
 
         if not parent_kwargs:
             # Keep same context as we don't see a reason to recreate one.
-            return context or PromptContext.create_from_kwargs({})
+            return PromptContext.create_if_none(context=context)
 
         if context:
             kwargs = PromptContext.create_kwargs_from_context(context=context)
@@ -102,30 +120,107 @@ class AbstractPromptResponse(HasSnakeShortClassNameClassMixin):
         """Create a new response with the given lines."""
         return cls(lines=lines, **kwargs)
 
+    @classmethod
+    def _prefix_message(cls, prefix: str, message: LineMessage) -> LineMessage:
+        """Prepend a prefix to a message, keeping lazy (callable) messages lazy."""
+        if callable(message):
+            return lambda: prefix + message()
+        return prefix + message
+
     @property
     def rendered_content(self) -> str | None:
         return self._rendered_content
 
     def clone(self, **overrides) -> AbstractPromptResponse:
         """Clone this response and all its child objects safely."""
+        self.resolve_deferred()
         payload = self._clone_export()
         payload.update(overrides)
         return self.__class__(**payload)
 
+    @property
+    def render_generation(self) -> int:
+        return self._render_generation
+
+    def defer(self, factory: Callable[[], AbstractPromptResponse]) -> None:
+        """Build the actual fields of this response from `factory` on first use.
+
+        Lets a filtered out call keep a lazy message unevaluated: the factory
+        runs only when the response is rendered or cloned.
+        """
+        self._deferred = factory
+
+    def mark_dirty(self) -> None:
+        """Invalidate memoized renders after changing lines or segments in place.
+
+        Assigning a new list to `lines` is detected automatically.
+        """
+        self._render_generation += 1
+
     def render(self, context: PromptContext | None = None) -> str | None:
-        """Render the complete response."""
+        """Render the complete response.
+
+        The output is memoized per context fingerprint while `lines` and the
+        dirty generation stay the same (see RenderCache).
+        """
         from wexample_prompt.common.prompt_context import PromptContext
+        from wexample_prompt.common.render_cache import RenderCache
 
+        self.resolve_deferred()
         context = PromptContext.create_if_none(context=context)
 
         if not self._verbosity_context_allows_display(context=context):
             return None
 
-        self._rendered_content = "\n".join(line.render(context) for line in self.lines)
-        return self._rendered_content
+        cache = RenderCache.shared()
+        if not cache.enabled:
+            self._rendered_content = "\n".join(
+                line.render(context) for line in self.lines
+            )
+            return self._rendered_content
+
+        # Holding `lines` in the state keeps it alive, so a rebuilt list can't
+        # reuse its identity.
+        state = (self.lines, self._render_generation, cache.epoch)
+        cached_state = self._render_cache_state
+        if (
+            cached_state is None
+            or cached_state[0] is not state[0]
+            or cached_state[1:] != state[1:]
+        ):
+            self._render_cache = {}
+            self._render_cache_state = state
+
+        key = context.get_fingerprint()
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            cache.record_miss()
+            rendered = "\n".join(line.render(context) for line in self.lines)
+            if len(self._render_cache) >= cache.max_entries_per_response:
+                self._render_cache.clear()
+            self._render_cache[key] = rendered
+        else:
+            cache.record_hit()
+
+        self._rendered_content = rendered
+        return rendered
 
     def reset(self) -> None:
         self._rendered_content = None
+        self.mark_dirty()
+
+    def resolve_deferred(self) -> None:
+        """Run the factory given to defer(), if any, and take its fields."""
+        factory = self._deferred
+        if factory is None:
+            return
+
+        self._deferred = None
+        built = factory()
+        for name, value in built._clone_export().items():
+            # Keep the emission time of the placeholder.
+            if name != "created_at":
+                setattr(self, name, value)
 
     def _clone_export(
         self,
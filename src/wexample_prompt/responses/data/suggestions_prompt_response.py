@@ -41,7 +41,7 @@ class SuggestionsPromptResponse(AbstractPromptResponse):
             for seg in ml.segments:
                 seg.color = TerminalColor.BLUE
                 if TextStyle.BOLD not in seg.styles:
-                    seg.styles.append(TextStyle.BOLD)
+                    seg.styles = (*seg.styles, TextStyle.BOLD)
             lines.append(ml)
 
         # Suggestions (each on its own line; support multi-line suggestions too)
@@ -56,7 +56,7 @@ class SuggestionsPromptResponse(AbstractPromptResponse):
                 # Add bold to suggestion segments if they don't have color
                 for seg in sline.segments:
                     if seg.color is None and TextStyle.BOLD not in seg.styles:
-                        seg.styles.append(TextStyle.BOLD)
+                        seg.styles = (*seg.styles, TextStyle.BOLD)
 
                 lines.append(
                     PromptResponseLine(segments=[arrow_segment, *sline.segments])
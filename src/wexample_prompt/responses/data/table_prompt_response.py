@@ -113,11 +113,18 @@ class TablePromptResponse(AbstractPromptResponse):
         for i in range(len(widths)):
             cell = str(row[i]) if i < row_len else ""
 
-            # Parse cell content for inline formatting
-            cell_segments = flatten_style_markup(cell, joiner=None)
+            if "@" not in cell and "\n" not in cell:
+                # Plain cell: a single segment, no parsing needed.
+                cell_segments = [PromptResponseSegment(text=cell)] if cell else []
+                cell_text_length = len(_sub("", cell))
+            else:
+                # Parse cell content for inline formatting
+                cell_segments = flatten_style_markup(cell, joiner=None)
 
-            # Calculate actual text length (without markup and ANSI codes)
-            cell_text_length = sum(len(_sub("", seg.text)) for seg in cell_segments)
+                # Calculate actual text length (without markup and ANSI codes)
+                cell_text_length = sum(
+                    len(_sub("", seg.text)) for seg in cell_segments
+                )
             padding = max(0, widths[i] - cell_text_length)
 
             is_last = i == last_idx
@@ -139,8 +146,11 @@ class TablePromptResponse(AbstractPromptResponse):
         from wexample_prompt.common.style_markup_parser import flatten_style_markup
         from wexample_prompt.helper.terminal import terminal_get_visible_width
 
-        # Parse markup to get segments
         _sub = _ANSI_ESCAPE_RE.sub
+        if "@" not in text and "\n" not in text:
+            return terminal_get_visible_width(_sub("", text))
+
+        # Parse markup to get segments
         segments = flatten_style_markup(text, joiner=None)
         # Strip ANSI codes from each segment and sum visible widths (using wcwidth)
         return sum(
@@ -35,10 +35,10 @@ class EchoPromptResponse(AbstractPromptResponse):
         """
         # Handle message parameter
         if "message" in kwargs:
-            kwargs["message"] = prefix + kwargs["message"]
-        elif args and isinstance(args[0], str):
+            kwargs["message"] = cls._prefix_message(prefix, kwargs["message"])
+        elif args and (isinstance(args[0], str) or callable(args[0])):
             # Handle positional message argument
-            args = (prefix + args[0],) + args[1:]
+            args = (cls._prefix_message(prefix, args[0]),) + args[1:]
 
         return args, kwargs
 
@@ -66,8 +66,7 @@ class EchoPromptResponse(AbstractPromptResponse):
     def render(self, context: PromptContext | None = None) -> str | None:
         from wexample_prompt.common.prompt_context import PromptContext
 
-        context = PromptContext.create_if_none(context=context)
-        context.colorized = False
+        context = PromptContext.create_if_none(context=context).clone(colorized=False)
 
         return super().render(
             context=context,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import shutil
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.field import public_field
 from wexample_helpers.decorator.base_class import base_class
@@ -11,21 +11,42 @@ from wexample_helpers.helper.ansi import ansi_display_width
 
 from wexample_prompt.responses.abstract_prompt_response import AbstractPromptResponse
 
+if TYPE_CHECKING:
+    from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+
 
 @base_class
 class AbstractInteractivePromptResponse(AbstractPromptResponse):
     """Base for interactive responses with common terminal helpers."""
 
+    SYNCHRONIZED_UPDATE_BEGIN: ClassVar[str] = "\033[?2026h"
+    SYNCHRONIZED_UPDATE_END: ClassVar[str] = "\033[?2026l"
+
     reset_on_finish: bool = public_field(
         default=False,
         description="If True, clears the prompt block from the terminal after a selection or abort.",
     )
+    synchronized_output: bool = public_field(
+        default=False,
+        description="Wrap each frame in synchronized-update sequences (set from the "
+        "IoManager, which detects terminal support once)",
+    )
     _answer: Any = None
 
+    @staticmethod
+    def _get_partial_clear_sequence(printed_lines: int) -> str:
+        return f"\033[{printed_lines}F\033[J" if printed_lines > 0 else ""
+
     @staticmethod
     def _partial_clear(printed_lines: int) -> None:
         if printed_lines > 0:
-            print(f"\033[{printed_lines}F\033[J", end="", flush=True)
+            print(
+                AbstractInteractivePromptResponse._get_partial_clear_sequence(
+                    printed_lines
+                ),
+                end="",
+                flush=True,
+            )
 
     @staticmethod
     def _read_key() -> str:
@@ -36,18 +57,44 @@ class AbstractInteractivePromptResponse(AbstractPromptResponse):
     def get_answer(self) -> Any:
         return self._answer
 
-    def _print_render(self, context) -> int:
-        """Render the content and return the number of terminal rows consumed.
+    def _commit_frame(self, sequence: str) -> None:
+        """Write a whole frame to stdout in a single os.write, wrapped in
+        synchronized-update sequences when enabled, so it never shows half drawn."""
+        import os
+        import sys
 
-        Counts visual rows by considering terminal width and visible text width
-        (ANSI stripped). This ensures _partial_clear erases the correct height
-        even when lines wrap.
-        """
+        from wexample_prompt.output.prompt_stdout_output_handler import (
+            PromptStdoutOutputHandler,
+        )
+
+        if not sequence:
+            return
+        data = self._synchronize_frame(sequence)
+        with PromptStdoutOutputHandler.WRITE_LOCK:
+            stream = sys.stdout
+            try:
+                fileno = stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                # Captured or in-memory stream.
+                stream.write(data)
+                stream.flush()
+                return
+            # Anything still buffered in the stream goes out before the frame.
+            stream.flush()
+            encoded = data.encode(
+                getattr(stream, "encoding", None) or "utf-8", "replace"
+            )
+            while encoded:
+                encoded = encoded[os.write(fileno, encoded) :]
+
+    def _diff_frame(self, frames: FrameDiffRenderer, context) -> tuple[str, int]:
+        """Render the content; return the sequence updating the previous frame
+        of `frames` into it, and the terminal rows it consumes."""
         rendered = super().render(context=context)
-        if rendered is None:
-            return 0
-        print(rendered, flush=True)
+        sequence = frames.diff(rendered, columns=self._get_frame_columns(context))
+        return sequence, frames.rows
 
+    def _get_frame_columns(self, context) -> int:
         # Determine columns from context or fallback to terminal/env
         try:
             _get_width = getattr(context, "get_width", None)
@@ -56,7 +103,34 @@ class AbstractInteractivePromptResponse(AbstractPromptResponse):
             ) or shutil.get_terminal_size().columns
         except Exception:
             cols = 80
-        cols = max(1, cols)
+        return max(1, cols)
+
+    def _print_frame(self, frames: FrameDiffRenderer, context) -> int:
+        """Like _print_render(), but only rewrite the rows that changed since
+        the previous frame printed through `frames`."""
+        sequence, rows = self._diff_frame(frames, context=context)
+        self._commit_frame(sequence)
+        return rows
+
+    def _print_render(self, context) -> int:
+        """Render the content and return the number of terminal rows consumed."""
+        rendered, rows = self._render_frame(context=context)
+        if rendered is not None:
+            print(rendered, flush=True)
+        return rows
+
+    def _render_frame(self, context) -> tuple[str | None, int]:
+        """Render the content and count the terminal rows it will consume.
+
+        Counts visual rows by considering terminal width and visible text width
+        (ANSI stripped). This ensures _partial_clear erases the correct height
+        even when lines wrap.
+        """
+        rendered = super().render(context=context)
+        if rendered is None:
+            return None, 0
+
+        cols = self._get_frame_columns(context)
 
         rows = 0
         for line in rendered.split("\n"):
@@ -65,4 +139,12 @@ class AbstractInteractivePromptResponse(AbstractPromptResponse):
                 rows += 1
             else:
                 rows += (width + cols - 1) // cols  # ceil(width/cols)
-        return rows
+        return rendered, rows
+
+    def _synchronize_frame(self, sequence: str) -> str:
+        if self.synchronized_output and sequence:
+            return (
+                f"{self.SYNCHRONIZED_UPDATE_BEGIN}{sequence}"
+                f"{self.SYNCHRONIZED_UPDATE_END}"
+            )
+        return sequence
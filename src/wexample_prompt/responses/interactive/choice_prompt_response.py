@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_prompt.const.types import LineMessage
@@ -15,8 +16,11 @@ from wexample_prompt.responses.interactive.abstract_interactive_prompt_response
 
 if TYPE_CHECKING:
     from wexample_prompt.common.choice.choice import Choice
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+    from wexample_prompt.common.choice.choice_filter_result import ChoiceFilterResult
     from wexample_prompt.common.prompt_context import PromptContext
     from wexample_prompt.common.prompt_response_line import PromptResponseLine
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
     from wexample_prompt.example.abstract_response_example import (
         AbstractResponseExample,
     )
@@ -42,6 +46,11 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
         "skips the detail area for that item. Typically used with "
         "PropertiesPromptResponse to show a 'fiche' for the highlighted choice.",
     )
+    filterable: bool = public_field(
+        default=False,
+        description="If True, typed characters filter the choices with a fuzzy match "
+        "instead of q aborting",
+    )
     predefined_answer: Any = public_field(
         default=None,
         description="The answer of the question, in order to make the response non interactive",
@@ -52,6 +61,19 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
     question_lines: list[PromptResponseLine] = public_field(
         description="Rendered question lines"
     )
+    viewport_height: int | None = public_field(
+        default=None,
+        description="Maximum number of choices shown at once, the list scrolling to "
+        "follow the selection; None fits the terminal height, 0 shows every choice",
+    )
+    _choice_lines: dict[tuple[int, bool], PromptResponseLine] = private_field(
+        factory=dict,
+        description="Styled line of each displayed choice, by (index, selected)",
+    )
+    _title_segments: dict[int, list[PromptResponseSegment]] = private_field(
+        factory=dict,
+        description="Title markup of each displayed choice, parsed once",
+    )
 
     @classmethod
     def create_choice(
@@ -65,6 +87,8 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
         predefined_answer: Any = None,
         detail_provider: Any = None,
         verbosity: VerbosityLevel | None = None,
+        viewport_height: int | None = None,
+        filterable: bool = False,
     ) -> ChoicePromptResponse:
         """Factory to create a ChoicePromptResponse."""
         from wexample_prompt.common.choice.choice import Choice
@@ -115,6 +139,8 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
             reset_on_finish=reset_on_finish,
             predefined_answer=predefined_answer,
             detail_provider=detail_provider,
+            viewport_height=viewport_height,
+            filterable=filterable,
         )
 
     @classmethod
@@ -127,23 +153,19 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
 
     def render(self, context: PromptContext | None = None) -> None:
         """Render the prompt and return the selected value."""
+        import threading
+
         import readchar
 
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
         from wexample_prompt.common.prompt_context import PromptContext
         from wexample_prompt.common.prompt_response_line import PromptResponseLine
         from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
-        from wexample_prompt.common.style_markup_parser import flatten_style_markup
         from wexample_prompt.enums.choice import ChoiceValue
         from wexample_prompt.enums.terminal_color import TerminalColor
-        from wexample_prompt.enums.text_style import TextStyle
 
         context = PromptContext.create_if_none(context=context)
 
-        if not self.choices:
-            # Nothing to choose from
-            self._answer = None
-            return
-
         # Resolve index for a target (match by value, title, or integer index)
         def _resolve_index_for(target: Any) -> int:
             if target is None:
@@ -164,13 +186,36 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
             if self.predefined_answer is not None
             else self.default
         )
+        # Keeps the frame on screen so keypresses only rewrite changed rows.
+        frames = FrameDiffRenderer()
         printed_lines = 0  # how many lines we printed last frame
         n_choices = len(self.choices)
+        # Choices may have changed since a previous render.
+        self._choice_lines.clear()
+        self._title_segments.clear()
+        viewport = self._get_viewport_height()
+        top = 0  # first choice of the visible window
         _rkey = readchar.key
 
-        while True:
-            # Clear only our previous render block (not the whole screen)
-            self._partial_clear(printed_lines)
+        # Choices listed, as indices into self.choices; idx is a position in it.
+        visible: Sequence[int] = range(n_choices)
+        total = n_choices  # matches of the filter, including those not listed
+        query = ""  # typed filter
+        # Filter `visible` was computed for, None when the choices changed since.
+        shown_query: str | None = ""
+        loading = True  # choices are still being streamed
+        closed = False  # answered: other threads must not paint anymore
+        # Filter results are painted from the worker thread.
+        paint_lock = threading.RLock()
+        if self.filterable:
+            controls = (
+                "Use ↑/↓ to navigate • Type to filter • Enter to select • Esc to abort"
+            )
+        else:
+            controls = "Use ↑/↓ to navigate • Enter to select • Esc or q to abort"
+
+        def paint() -> None:
+            nonlocal printed_lines, top
 
             # Rebuild lines for this frame (all question lines first)
             # Copy the list to avoid mutating the original across frames
@@ -178,62 +223,50 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
             # accumulate and cause duplicated blocks to be printed.
             self.lines = list(self.question_lines)
 
-            for i, choice in enumerate(self.choices):
-                line = choice.line
-
-                is_selected = i == idx
-                is_abort = choice.value == ChoiceValue.ABORT
-
-                # Prefix: no numbering, use chevron only for non-abort selected.
-                if is_abort:
-                    prefix = "  ⨯ "
-                    prefix_color = TerminalColor.WHITE
-                    prefix_styles = []
-                else:
-                    prefix = "  › " if is_selected else "    "
-                    prefix_color = (
-                        TerminalColor.LIGHT_WHITE
-                        if is_selected
-                        else TerminalColor.RESET
-                    )
-                    prefix_styles = [TextStyle.BOLD] if is_selected else []
-
-                # Title styling
-                title_color = (
-                    TerminalColor.LIGHT_WHITE if is_selected else TerminalColor.RESET
+            if query:
+                status = "…" if query != shown_query else f"({total} matches)"
+                self.lines.append(
+                    self._create_scroll_line(f"  Filter: {query} {status}")
                 )
 
-                # Parse title for inline formatting
-                title_segments = flatten_style_markup(str(choice.title), joiner=None)
-
-                # Apply selection styling to segments that don't have color
-                for seg in title_segments:
-                    if seg.color is None:
-                        seg.color = title_color
-                    if is_selected and TextStyle.BOLD not in seg.styles:
-                        seg.styles.append(TextStyle.BOLD)
-
-                # Prepend the prefix segment in-place to avoid an extra list allocation
-                title_segments.insert(
-                    0,
-                    PromptResponseSegment(
-                        text=prefix,
-                        color=prefix_color,
-                        styles=prefix_styles,
-                    ),
+            # Only the window around the selection is built: the cost of a
+            # frame does not depend on the number of choices.
+            count = len(visible)
+            if 0 < viewport < count:
+                if idx < top:
+                    top = idx
+                elif idx >= top + viewport:
+                    top = idx - viewport + 1
+                bottom = top + viewport
+            else:
+                top = 0
+                bottom = count
+
+            if top > 0:
+                self.lines.append(self._create_scroll_line(f"  ↑ {top} more"))
+            for position in range(top, bottom):
+                self.lines.append(
+                    self._get_choice_line(visible[position], position == idx)
                 )
-                line.segments = title_segments
-
-                self.lines.append(line)
+            if bottom < count:
+                self.lines.append(
+                    self._create_scroll_line(f"  ↓ {count - bottom} more")
+                )
+            if loading:
+                self.lines.append(self._create_scroll_line("  Loading…"))
+            elif not count:
+                self.lines.append(self._create_scroll_line("  No matching choice"))
 
             # Optional detail pane refreshed on every navigation. Provider gets
             # the currently-highlighted value and may return any PromptResponse
             # (typically PropertiesPromptResponse). We render it with the same
             # context as the choice itself — so the sub-response keeps its own
             # cartouche/box when it has one.
-            if self.detail_provider is not None:
+            if self.detail_provider is not None and count:
                 try:
-                    detail_response = self.detail_provider(self.choices[idx].value)
+                    detail_response = self.detail_provider(
+                        self.choices[visible[idx]].value
+                    )
                 except Exception:
                     detail_response = None
                 if detail_response is not None:
@@ -245,7 +278,7 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
             controls_line = PromptResponseLine(
                 segments=[
                     PromptResponseSegment(
-                        text="Use ↑/↓ to navigate • Enter to select • Esc or q to abort",
+                        text=controls,
                         color=TerminalColor.BLACK,
                         styles=[],
                     )
@@ -253,35 +286,261 @@ class ChoicePromptResponse(AbstractInteractivePromptResponse):
             )
             self.lines.append(controls_line)
 
-            # Render and print this frame
-            printed_lines = self._print_render(context=context)
-
-            # If an answer is injected (non-interactive mode), return it as-is
-            if self.predefined_answer is not None:
-                if self.reset_on_finish and printed_lines > 0:
-                    self._partial_clear(printed_lines)
-                self._answer = self.predefined_answer
-                return
-
-            key = self._read_key()
-            if key == _rkey.UP:
-                idx = (idx - 1) % n_choices
-            elif key == _rkey.DOWN:
-                idx = (idx + 1) % n_choices
-            elif key in (_rkey.ENTER, "\r", "\n"):
-                selected = self.choices[idx]
-                if selected.value == ChoiceValue.ABORT:
+            # Render this frame, printing only the rows that changed
+            printed_lines = self._print_frame(frames, context=context)
+
+        def show(result: ChoiceFilterResult) -> None:
+            nonlocal idx, shown_query, top, total, visible
+
+            visible = result.indices
+            total = result.total
+            shown_query = result.query
+            idx = 0
+            top = 0
+
+        def on_result(result: ChoiceFilterResult) -> None:
+            with paint_lock:
+                # A result for an older query may finish after a newer one was
+                # typed, or after the current one was matched for a keypress.
+                if not closed and result.query == query and result.query != shown_query:
+                    show(result)
+                    paint()
+
+        def create_filter() -> ChoiceFilter | None:
+            if not self.filterable:
+                return None
+
+            from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+            return ChoiceFilter(
+                titles=[choice.title for choice in self.choices], on_result=on_result
+            )
+
+        choice_filter = create_filter()
+
+        def set_choices(choices: list[Choice], complete: bool) -> None:
+            nonlocal choice_filter, idx, loading, n_choices, shown_query, total
+            nonlocal visible
+
+            # Choices kept from the previous list keep the selection on them.
+            positions = {id(choice): index for index, choice in enumerate(choices)}
+            with paint_lock:
+                if closed:
+                    return
+                previous = self.choices
+                selected = previous[visible[idx]] if len(visible) else None
+                self.choices = choices
+                n_choices = len(choices)
+                self._choice_lines.clear()
+                self._title_segments.clear()
+                loading = not complete
+                if choice_filter is not None:
+                    choice_filter.close()
+                    choice_filter = create_filter()
+
+                if query.strip():
+                    # Listed matches stay until the filter catches up.
+                    visible = [
+                        positions[id(previous[index])]
+                        for index in visible
+                        if id(previous[index]) in positions
+                    ]
+                    shown_query = None
+                    choice_filter.submit(query)
+                else:
+                    visible = range(n_choices)
+                    total = n_choices
+
+                index = positions.get(id(selected))
+                idx = visible.index(index) if index in visible else 0
+                paint()
+
+        navigation_keys = (
+            _rkey.UP,
+            _rkey.DOWN,
+            _rkey.PAGE_UP,
+            _rkey.PAGE_DOWN,
+            _rkey.HOME,
+            _rkey.END,
+            _rkey.ENTER,
+            "\r",
+            "\n",
+        )
+
+        def apply_filter() -> None:
+            if query.strip():
+                # Matched off the keyboard loop: typing stays responsive.
+                choice_filter.submit(query)
+            else:
+                show(choice_filter.match(query))
+
+        stop_stream = None
+        try:
+            stop_stream = self._stream_choices(update=set_choices)
+            if stop_stream is None:
+                loading = False
+                if not self.choices:
+                    # Nothing to choose from
+                    self._answer = None
+                    return
+
+            while True:
+                with paint_lock:
+                    paint()
+
+                # If an answer is injected (non-interactive mode), return it as-is
+                if self.predefined_answer is not None:
                     if self.reset_on_finish and printed_lines > 0:
                         self._partial_clear(printed_lines)
-                    self._answer = None
+                    self._answer = self.predefined_answer
                     return
-                if self.reset_on_finish and printed_lines > 0:
-                    self._partial_clear(printed_lines)
-                self._answer = selected.value
-                return
-            elif key in (_rkey.ESC, "q", "Q"):
-                # Quick abort with ESC or q/Q
-                if self.reset_on_finish and printed_lines > 0:
-                    self._partial_clear(printed_lines)
-                self._answer = None
-                return
+
+                key = self._read_key()
+                with paint_lock:
+                    if key in navigation_keys and query != shown_query:
+                        # Move among the matches of what was typed.
+                        show(choice_filter.match(query))
+                    count = len(visible)
+                    if key == _rkey.UP:
+                        if count:
+                            idx = (idx - 1) % count
+                    elif key == _rkey.DOWN:
+                        if count:
+                            idx = (idx + 1) % count
+                    elif key == _rkey.PAGE_UP:
+                        idx = max(0, idx - (viewport or count))
+                    elif key == _rkey.PAGE_DOWN:
+                        idx = max(0, min(count - 1, idx + (viewport or count)))
+                    elif key == _rkey.HOME:
+                        idx = 0
+                    elif key == _rkey.END:
+                        idx = max(0, count - 1)
+                    elif key in (_rkey.ENTER, "\r", "\n"):
+                        if not visible:
+                            continue
+                        selected = self.choices[visible[idx]]
+                        if selected.value == ChoiceValue.ABORT:
+                            if self.reset_on_finish and printed_lines > 0:
+                                self._partial_clear(printed_lines)
+                            self._answer = None
+                            return
+                        if self.reset_on_finish and printed_lines > 0:
+                            self._partial_clear(printed_lines)
+                        self._answer = selected.value
+                        return
+                    elif key == _rkey.ESC and query:
+                        query = ""
+                        apply_filter()
+                    elif key == _rkey.ESC or (
+                        choice_filter is None and key in ("q", "Q")
+                    ):
+                        # Quick abort with ESC or q/Q
+                        if self.reset_on_finish and printed_lines > 0:
+                            self._partial_clear(printed_lines)
+                        self._answer = None
+                        return
+                    elif choice_filter is not None and key in (_rkey.BACKSPACE, "\b"):
+                        if query:
+                            query = query[:-1]
+                            apply_filter()
+                    elif (
+                        choice_filter is not None
+                        and len(key) == 1
+                        and key.isprintable()
+                    ):
+                        query += key
+                        apply_filter()
+        finally:
+            with paint_lock:
+                closed = True
+            if stop_stream is not None:
+                stop_stream()
+            if choice_filter is not None:
+                choice_filter.close()
+
+    @staticmethod
+    def _create_scroll_line(text: str) -> PromptResponseLine:
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.enums.terminal_color import TerminalColor
+
+        return PromptResponseLine(
+            segments=[PromptResponseSegment(text=text, color=TerminalColor.BLACK)]
+        )
+
+    def _get_choice_line(self, index: int, is_selected: bool) -> PromptResponseLine:
+        """Return the line of a choice, built on its first display and reused."""
+        line = self._choice_lines.get((index, is_selected))
+        if line is not None:
+            return line
+
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.common.style_markup_parser import flatten_style_markup
+        from wexample_prompt.enums.choice import ChoiceValue
+        from wexample_prompt.enums.terminal_color import TerminalColor
+        from wexample_prompt.enums.text_style import TextStyle
+
+        choice = self.choices[index]
+
+        # Prefix: no numbering, use chevron only for non-abort selected.
+        if choice.value == ChoiceValue.ABORT:
+            prefix = "  ⨯ "
+            prefix_color = TerminalColor.WHITE
+            prefix_styles = ()
+        else:
+            prefix = "  › " if is_selected else "    "
+            prefix_color = (
+                TerminalColor.LIGHT_WHITE if is_selected else TerminalColor.RESET
+            )
+            prefix_styles = (TextStyle.BOLD,) if is_selected else ()
+
+        # Title markup is parsed once, then styled for each selection state.
+        title_segments = self._title_segments.get(index)
+        if title_segments is None:
+            title_segments = flatten_style_markup(str(choice.title), joiner=None)
+            self._title_segments[index] = title_segments
+
+        title_color = TerminalColor.LIGHT_WHITE if is_selected else TerminalColor.RESET
+        segments = [
+            PromptResponseSegment(text=prefix, color=prefix_color, styles=prefix_styles)
+        ]
+        for segment in title_segments:
+            styles = segment.styles
+            if is_selected and TextStyle.BOLD not in styles:
+                styles = (*styles, TextStyle.BOLD)
+            segments.append(
+                PromptResponseSegment(
+                    text=segment.text,
+                    color=title_color if segment.color is None else segment.color,
+                    styles=styles,
+                )
+            )
+
+        line = self._choice_lines[(index, is_selected)] = PromptResponseLine(
+            segments=segments
+        )
+        return line
+
+    def _get_viewport_height(self) -> int:
+        if self.viewport_height is not None:
+            return self.viewport_height
+
+        import shutil
+
+        # Keep the question, both scroll indicators, the footer and the row
+        # of the cursor on screen.
+        rows = shutil.get_terminal_size().lines - len(self.question_lines) - 4
+        return max(1, rows)
+
+    def _stream_choices(
+        self, update: Callable[[list[Choice], bool], None]
+    ) -> Callable[[], None] | None:
+        """Start feeding the choices of a list too slow to build up front.
+
+        `update(choices, complete)` replaces the choices from any thread and
+        repaints, the selection staying on the same Choice object. Returns
+        the callable stopping the feed once answered, or None when `choices`
+        is already complete.
+        """
+        return None
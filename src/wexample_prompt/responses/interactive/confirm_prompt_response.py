@@ -41,7 +41,9 @@ class ConfirmPromptResponse(AbstractInteractivePromptResponse):
         "y": ("continue", "Continue"),
         "n": ("cancel", "Cancel"),
     }
-    _OK_VALUES: ClassVar[frozenset] = frozenset({True, 1, "yes", "yes_all", "ok", "continue"})
+    _OK_VALUES: ClassVar[frozenset] = frozenset(
+        {True, 1, "yes", "yes_all", "ok", "continue"}
+    )
     allow_abort: bool = public_field(
         default=True, description="ESC/q aborts and returns None when allowed."
     )
@@ -119,16 +121,17 @@ class ConfirmPromptResponse(AbstractInteractivePromptResponse):
         return self._answer in self._OK_VALUES
 
     def render(self, context: PromptContext | None = None) -> None:
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
         from wexample_prompt.common.prompt_context import PromptContext
 
         context = PromptContext.create_if_none(context=context)
 
+        frames = FrameDiffRenderer()
         printed = 0
         # render once per frame until a valid key or injected answer
         while True:
-            self._partial_clear(printed)
             self._build_lines(context=context)
-            printed = self._print_render(context=context)
+            printed = self._print_frame(frames, context=context)
 
             if self.predefined_answer is not None:
                 if self.reset_on_finish and printed > 0:
@@ -243,7 +246,7 @@ class ConfirmPromptResponse(AbstractInteractivePromptResponse):
                 segs.append(PromptResponseSegment(text=" ", color=TerminalColor.RESET))
             # The question text itself
             for original in segments_for_line:
-                styles = list(original.styles)
+                styles = original.styles
                 color = original.color
                 if color is None:
                     color = TerminalColor.LIGHT_WHITE
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_prompt.enums.choice import FilePickerMode
@@ -15,12 +17,25 @@ from wexample_prompt.responses.interactive.choice_prompt_response import (
 )
 
 if TYPE_CHECKING:
+    from wexample_prompt.common.choice.choice import Choice
+    from wexample_prompt.common.file_picker.directory_listing import DirectoryListing
+    from wexample_prompt.common.prompt_context import PromptContext
     from wexample_prompt.const.types import LineMessage
 
 
 @base_class
 class FilePickerPromptResponse(ChoicePromptResponse):
-    """Response for displaying a file picker interface."""
+    """Response for displaying a file picker interface.
+
+    The directory is read through the shared DirectoryListingCache. When it
+    is not cached, entries are listed as they are read, the first screenful
+    showing before the end of a large directory. Once listed, the first
+    subdirectories are prefetched so a picker opened on one of them next
+    finds it cached.
+    """
+
+    # Subdirectories prefetched after listing, the first ones displayed.
+    PREFETCH_LIMIT: ClassVar[int] = 16
 
     abort_option: bool | str | None = public_field(
         default=None,
@@ -37,6 +52,14 @@ class FilePickerPromptResponse(ChoicePromptResponse):
         default=FilePickerMode.BOTH,
         description="Filter entries: files, dirs, or both (default). Affects visibility, not just selection.",
     )
+    _entry_choices: dict[Any, Choice] = private_field(
+        factory=dict,
+        description="Choice of each listed entry, by (name, title), reused when the "
+        "listing grows",
+    )
+    _listing: DirectoryListing | None = private_field(
+        default=None, description="Complete listing of base_dir, once read"
+    )
 
     @classmethod
     def create_file_picker(
@@ -49,58 +72,33 @@ class FilePickerPromptResponse(ChoicePromptResponse):
         reset_on_finish: bool = False,
         predefined_answer: Any = None,
         verbosity: VerbosityLevel | None = None,
+        filterable: bool = False,
     ) -> FilePickerPromptResponse:
-        base = base_dir or os.getcwd()
-
-        # Build mapping with ".." first, then folders (with icon), then files
-        dirs: dict[str, str] = {}
-        files: dict[str, str] = {}
-        include_dirs = mode in (FilePickerMode.BOTH, FilePickerMode.DIRS)
-        include_files = mode in (FilePickerMode.BOTH, FilePickerMode.FILES)
-        try:
-            for element in os.listdir(base):
-                full_path = os.path.join(base, element)
-                if os.path.isdir(full_path):
-                    if include_dirs:
-                        dirs[element] = f"📁 {element}"
-                else:
-                    if include_files:
-                        files[element] = element
-        except Exception:
-            pass
-
-        merged: dict[str, str] = {}
-        if allow_parent_selection:
-            merged[".."] = ".."
-        for name in sorted(dirs, key=str.casefold):
-            merged[name] = dirs[name]
-        for name in sorted(files, key=str.casefold):
-            merged[name] = files[name]
-
-        # Build parent Choice response using mapping (key=value, value=title)
-        parent_response = ChoicePromptResponse.create_choice(
-            question=question,
-            choices=merged,
-            default=None,
-            abort=abort,
-            verbosity=verbosity,
-            reset_on_finish=reset_on_finish,
-            predefined_answer=predefined_answer,
+        """Create the picker; `choices` are the entries of a cached `base_dir`.
+
+        When the directory is not cached yet, it is listed while rendering:
+        until then `choices` only holds ".." and the abort option.
+        """
+        from wexample_prompt.common.file_picker.directory_listing_cache import (
+            DirectoryListingCache,
         )
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
 
-        return cls(
-            # Do not copy lines; ChoicePromptResponse.ask rebuilds lines each frame
-            choices=parent_response.choices,
-            default=parent_response.default,
-            question=parent_response.question,
-            question_lines=parent_response.question_lines,
-            base_dir=base,
+        response = cls(
+            question_lines=PromptResponseLine.create_from_string(question),
+            question=question,
+            base_dir=base_dir or os.getcwd(),
             mode=mode,
             abort_option=abort,
+            allow_parent_selection=allow_parent_selection,
             verbosity=verbosity,
             reset_on_finish=reset_on_finish,
             predefined_answer=predefined_answer,
+            filterable=filterable,
         )
+        response._listing = DirectoryListingCache.shared().get(response.base_dir)
+        response._set_listing_choices()
+        return response
 
     @classmethod
     def get_example_class(cls) -> type:
@@ -109,3 +107,110 @@ class FilePickerPromptResponse(ChoicePromptResponse):
         )
 
         return FilePickerExample
+
+    def render(self, context: PromptContext | None = None) -> None:
+        from wexample_prompt.common.file_picker.directory_listing_cache import (
+            DirectoryListingCache,
+        )
+
+        cache = DirectoryListingCache.shared()
+        self._listing = cache.get(self.base_dir)
+        if self._listing is None and self.predefined_answer is not None:
+            # Not interactive: nobody to show a partial listing to.
+            self._listing = cache.read(self.base_dir)
+
+        self._set_listing_choices()
+        super().render(context=context)
+
+    def _create_choices(self, dirs: list[str], files: list[str]) -> list[Choice]:
+        """Build ".." first, then folders (with icon), then files, then abort."""
+        from wexample_prompt.common.choice.choice import Choice
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.enums.choice import ChoiceValue
+
+        entry_choices = self._entry_choices
+
+        def get_choice(value: Any, title: str) -> Choice:
+            choice = entry_choices.get((value, title))
+            if choice is None:
+                choice = entry_choices[(value, title)] = Choice(
+                    value=value,
+                    title=title,
+                    line=PromptResponseLine(segments=[]),
+                )
+            return choice
+
+        choices = []
+        if self.allow_parent_selection:
+            choices.append(get_choice("..", ".."))
+        if self.mode in (FilePickerMode.BOTH, FilePickerMode.DIRS):
+            for name in sorted(dirs, key=str.casefold):
+                choices.append(get_choice(name, f"📁 {name}"))
+        if self.mode in (FilePickerMode.BOTH, FilePickerMode.FILES):
+            for name in sorted(files, key=str.casefold):
+                choices.append(get_choice(name, name))
+
+        # Add abort option if requested.
+        if self.abort_option is not False:
+            choices.append(
+                get_choice(
+                    ChoiceValue.ABORT,
+                    str(
+                        self.abort_option if self.abort_option is not None else "Abort"
+                    ),
+                )
+            )
+        return choices
+
+    def _prefetch(self, listing: DirectoryListing) -> None:
+        from wexample_prompt.common.file_picker.directory_listing_cache import (
+            DirectoryListingCache,
+        )
+
+        if self.mode == FilePickerMode.FILES:
+            return
+        names = sorted(listing.dirs, key=str.casefold)[: self.PREFETCH_LIMIT]
+        DirectoryListingCache.shared().prefetch(
+            os.path.join(listing.path, name) for name in names
+        )
+
+    def _set_listing_choices(self) -> None:
+        listing = self._listing
+        if listing is not None:
+            self.choices = self._create_choices(listing.dirs, listing.files)
+        else:
+            self.choices = self._create_choices([], [])
+
+    def _stream_choices(
+        self, update: Callable[[list[Choice], bool], None]
+    ) -> Callable[[], None] | None:
+        if self._listing is not None:
+            if self.predefined_answer is None:
+                self._prefetch(self._listing)
+            return None
+
+        import threading
+
+        from wexample_prompt.common.file_picker.directory_listing_cache import (
+            DirectoryListingCache,
+        )
+
+        stopped = threading.Event()
+
+        def on_batch(dirs: list[str], files: list[str]) -> None:
+            update(self._create_choices(dirs, files), False)
+
+        def run() -> None:
+            listing = DirectoryListingCache.shared().read(
+                self.base_dir, on_batch=on_batch, cancelled=stopped.is_set
+            )
+            if listing is None or stopped.is_set():
+                return
+            self._listing = listing
+            update(self._create_choices(listing.dirs, listing.files), True)
+            self._prefetch(listing)
+
+        threading.Thread(
+            target=run, name=f"{self.__class__.__name__}-listing", daemon=True
+        ).start()
+        return stopped.set
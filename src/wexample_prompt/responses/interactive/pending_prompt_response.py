@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, ClassVar
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.field import public_field
 from wexample_helpers.decorator.base_class import base_class
@@ -13,6 +13,7 @@ from wexample_prompt.responses.interactive.abstract_interactive_prompt_response
 
 if TYPE_CHECKING:
     from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
     from wexample_prompt.example.abstract_response_example import (
         AbstractResponseExample,
     )
@@ -59,6 +60,7 @@ class PendingPromptResponse(AbstractInteractivePromptResponse):
         max_lines: int = 5,
         output_color: TerminalColor | None = TerminalColor.LIGHT_BLACK,
         reset_on_finish: bool = False,
+        verbosity: VerbosityLevel | None = None,
     ) -> PendingPromptResponse:
         return cls(
             callback=callback,
@@ -67,6 +69,7 @@ class PendingPromptResponse(AbstractInteractivePromptResponse):
             max_lines=max_lines,
             output_color=output_color,
             reset_on_finish=reset_on_finish,
+            verbosity=verbosity,
         )
 
     @classmethod
@@ -80,54 +83,97 @@ class PendingPromptResponse(AbstractInteractivePromptResponse):
     def render(self, context: PromptContext | None = None) -> str | None:
         import time
 
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
         from wexample_prompt.common.prompt_context import PromptContext
-        from wexample_prompt.common.prompt_response_line import PromptResponseLine
-        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
-        from wexample_prompt.common.spinner_pool import SpinnerPool
 
         context = PromptContext.create_if_none(context=context)
+        frames = FrameDiffRenderer()
         printed_lines = 0
 
-        # Hoist repeated attribute lookups and shared-pool call out of the loop.
+        # Hoist repeated attribute lookups out of the loop.
         _callback = self.callback
-        _label = self.label
-        _max_lines = self.max_lines
-        _output_color = self.output_color
         _interval = self.interval
-        _spinner_key = self.SPINNER_KEY
-        _spinner_pool = SpinnerPool.shared()
+        # The callback stays on this thread; only the redraw cadence follows
+        # the shared frame clock.
+        _get_frame_delay = FrameScheduler.shared().get_frame_delay
 
         while True:
             is_ready, output_lines = _callback()
+            self._update_lines(output_lines)
 
-            spinner_frame = _spinner_pool.next(key=_spinner_key)
-            self.lines = [
-                PromptResponseLine(
-                    segments=[
-                        PromptResponseSegment(text=f"{spinner_frame} {_label}")
-                    ]
-                )
-            ]
-            for raw_line in output_lines[-_max_lines:]:
-                stripped = raw_line.rstrip()
-                if stripped:
-                    self.lines.append(
-                        PromptResponseLine(
-                            segments=[
-                                PromptResponseSegment(
-                                    text=f"  {stripped}",
-                                    color=_output_color,
-                                )
-                            ]
-                        )
-                    )
-
-            self._partial_clear(printed_lines)
-            printed_lines = self._print_render(context=context)
+            printed_lines = self._print_frame(frames, context=context)
 
             if is_ready:
                 if self.reset_on_finish:
                     self._partial_clear(printed_lines)
                 return None
 
-            time.sleep(_interval)
+            time.sleep(_get_frame_delay(_interval))
+
+    async def render_async(
+        self,
+        write: Callable[[str], Awaitable[Any]],
+        context: PromptContext | None = None,
+    ) -> None:
+        """Event-loop version of render(): frames go through `write` and the
+        wait between polls is an `asyncio.sleep`, so many pending responses can
+        share one loop. The callback may be a coroutine function.
+        """
+        import asyncio
+        import inspect
+
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
+        from wexample_prompt.common.prompt_context import PromptContext
+
+        context = PromptContext.create_if_none(context=context)
+        frames = FrameDiffRenderer()
+        printed_lines = 0
+        scheduler = FrameScheduler.shared()
+
+        while True:
+            result = self.callback()
+            if inspect.isawaitable(result):
+                result = await result
+            is_ready, output_lines = result
+            self._update_lines(output_lines)
+
+            sequence, printed_lines = self._diff_frame(frames, context=context)
+            if sequence:
+                await write(self._synchronize_frame(sequence))
+
+            if is_ready:
+                if self.reset_on_finish and printed_lines > 0:
+                    await write(self._get_partial_clear_sequence(printed_lines))
+                return None
+
+            await asyncio.sleep(scheduler.get_frame_delay(self.interval))
+
+    def _update_lines(self, output_lines: list[str]) -> None:
+        """Rebuild the spinner header and the trailing output lines."""
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+        from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+        from wexample_prompt.common.spinner_pool import SpinnerPool
+
+        _output_color = self.output_color
+        spinner_frame = SpinnerPool.shared().next(key=self.SPINNER_KEY)
+        lines = [
+            PromptResponseLine(
+                segments=[PromptResponseSegment(text=f"{spinner_frame} {self.label}")]
+            )
+        ]
+        for raw_line in output_lines[-self.max_lines :]:
+            stripped = raw_line.rstrip()
+            if stripped:
+                lines.append(
+                    PromptResponseLine(
+                        segments=[
+                            PromptResponseSegment(
+                                text=f"  {stripped}",
+                                color=_output_color,
+                            )
+                        ]
+                    )
+                )
+        self.lines = lines
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from wexample_helpers.classes.field import public_field
@@ -57,6 +57,8 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
         default=False,
         description="If True, clears printed block when finishing (close).",
     )
+    _async_loop: Any = None
+    _async_tick_event: Any = None
     _closed: bool = False
     _io_buffer: PromptBufferOutputHandler | None = None
     _reload_requested: bool = False
@@ -100,24 +102,15 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
         self._reload_requested = True
 
     def render(self, context: PromptContext | None = None) -> str | None:
-        import threading
         import time
 
-        from wexample_prompt.common.io_manager import IoManager
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
         from wexample_prompt.common.prompt_context import PromptContext
-        from wexample_prompt.output.prompt_buffer_output_handler import (
-            PromptBufferOutputHandler,
-        )
-
-        # Wait first rendering to build nested io manager.
-        if self._io_buffer is None:
-            self._io_buffer = PromptBufferOutputHandler()
-            self.io = IoManager(output=self._io_buffer)
-        if self._tick_event is None:
-            self._tick_event = threading.Event()
 
+        self._prepare_render()
         context = PromptContext.create_if_none(context=context)
 
+        frames = FrameDiffRenderer()
         printed_lines = 0
         # First frame: let the callback populate content
         try:
@@ -137,19 +130,17 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
         # bound-method creation and attribute lookups at ~20 Hz).
         _monotonic = time.monotonic
         _partial_clear = self._partial_clear
-        _print_render = self._print_render
+        _print_frame = self._print_frame
         _render_buffer = self._render_buffer
         _io_buffer = self._io_buffer
         _callback = self.callback
         _tick_event = self._tick_event
 
         while True:
-            # Clear previous frame area
-            _partial_clear(printed_lines)
             _io_buffer.clear()
 
-            # Render and print current lines
-            printed_lines = _print_render(context=context)
+            # Render current lines, rewriting only the rows that changed
+            printed_lines = _print_frame(frames, context=context)
             last_draw = _monotonic()
 
             if self._closed:
@@ -180,6 +171,80 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
 
             _render_buffer()
 
+    async def render_async(
+        self,
+        write: Callable[[str], Awaitable[Any]],
+        context: PromptContext | None = None,
+    ) -> None:
+        """Event-loop version of render(): frames go through `write`, waits are
+        `asyncio.sleep` / an `asyncio.Event` set by request_refresh(), so many
+        screens can share one loop. The callback may be a coroutine function.
+        """
+        import asyncio
+        import inspect
+        import time
+
+        from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+        from wexample_prompt.common.prompt_context import PromptContext
+
+        self._prepare_render()
+        context = PromptContext.create_if_none(context=context)
+        tick_event = asyncio.Event()
+        if self._tick_event.is_set():
+            # A refresh was requested before the loop started.
+            tick_event.set()
+        self._async_tick_event = tick_event
+        self._async_loop = asyncio.get_running_loop()
+
+        async def run_callback() -> None:
+            self._reload_requested = False
+            try:
+                result = self.callback(self)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._closed = True
+                raise e
+
+        try:
+            await run_callback()
+            self._render_buffer()
+
+            frames = FrameDiffRenderer()
+            while True:
+                self._io_buffer.clear()
+                sequence, printed_lines = self._diff_frame(frames, context=context)
+                if sequence:
+                    await write(self._synchronize_frame(sequence))
+                last_draw = time.monotonic()
+
+                if self._closed:
+                    if self.reset_on_finish and printed_lines > 0:
+                        await write(self._get_partial_clear_sequence(printed_lines))
+                    return None
+
+                await run_callback()
+
+                # Same pacing as render(): anti-flicker gap, then a push event
+                # or poll_interval, whichever comes first.
+                if not self._reload_requested and not self._closed:
+                    gap = self.min_refresh_interval - (time.monotonic() - last_draw)
+                    if gap > 0:
+                        await asyncio.sleep(gap)
+                    try:
+                        await asyncio.wait_for(
+                            tick_event.wait(), timeout=self.poll_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    tick_event.clear()
+                    self._tick_event.clear()
+
+                self._render_buffer()
+        finally:
+            self._async_loop = None
+            self._async_tick_event = None
+
     def request_refresh(self) -> None:
         """Thread-safe wake-up: forces the render loop to redraw on next tick.
 
@@ -195,6 +260,29 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
             self._tick_event = threading.Event()
         self._tick_event.set()
 
+        loop, tick_event = self._async_loop, self._async_tick_event
+        if loop is not None and tick_event is not None:
+            try:
+                loop.call_soon_threadsafe(tick_event.set)
+            except RuntimeError:
+                # The loop closed in between.
+                pass
+
+    def _prepare_render(self) -> None:
+        import threading
+
+        from wexample_prompt.common.io_manager import IoManager
+        from wexample_prompt.output.prompt_buffer_output_handler import (
+            PromptBufferOutputHandler,
+        )
+
+        # Wait first rendering to build nested io manager.
+        if self._io_buffer is None:
+            self._io_buffer = PromptBufferOutputHandler()
+            self.io = IoManager(output=self._io_buffer)
+        if self._tick_event is None:
+            self._tick_event = threading.Event()
+
     def _render_buffer(self) -> None:
         from wexample_prompt.common.prompt_response_line import PromptResponseLine
 
@@ -207,3 +295,5 @@ class ScreenPromptResponse(WithIoMethods, AbstractInteractivePromptResponse):
             if raw_line is not None
             for line in PromptResponseLine.create_from_string(raw_line)
         )
+        # Lines grew in place: renders memoized for the previous frame are stale.
+        self.mark_dirty()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import sys
 import threading
-import time
 from typing import TYPE_CHECKING
 
 from wexample_helpers.classes.field import public_field
@@ -15,6 +14,8 @@ from wexample_prompt.responses.interactive.abstract_interactive_prompt_response
 )
 
 if TYPE_CHECKING:
+    from wexample_prompt.common.frame_subscription import FrameSubscription
+    from wexample_prompt.common.live.live_slot import LiveSlot
     from wexample_prompt.common.prompt_context import PromptContext
     from wexample_prompt.example.abstract_response_example import (
         AbstractResponseExample,
@@ -42,6 +43,7 @@ class SpinnerPromptResponse(AbstractInteractivePromptResponse):
         worker.join()
         spinner.stop()
     """
+
     interval: float = public_field(
         default=0.1,
         description="Seconds between spinner frame advances.",
@@ -50,8 +52,14 @@ class SpinnerPromptResponse(AbstractInteractivePromptResponse):
         default="Thinking…",
         description="Text shown next to the spinning glyph.",
     )
+    # Whether stdout is a terminal the spinner line can be redrawn on; piped
+    # output only gets the logged lines.
+    _cursor_control: bool = False
+    # Slot animating this spinner when printed while a LiveRegion runs.
+    _live_slot: LiveSlot | None = None
     # Class-level sentinel: lets log()/stop() use direct attr access before render().
     _running: bool = False
+    _subscription: FrameSubscription | None = None
 
     @classmethod
     def create_spinner(
@@ -72,17 +80,23 @@ class SpinnerPromptResponse(AbstractInteractivePromptResponse):
     # ─── handle API ──────────────────────────────────────────────────────
     def log(self, line: str) -> None:
         """Print ``line`` as a persistent row above the spinner."""
+        if self._live_slot is not None:
+            self._live_slot.region.print(line)
+            return
         if not self._running:
             return
         with self._lock:
-            sys.stdout.write(f"\r\x1b[2K{line}\n")
-            sys.stdout.flush()
-            self._draw()
+            # One write: the row, then the spinner redrawn below it.
+            clear = "\r\x1b[2K" if self._cursor_control else ""
+            self._write(f"{clear}{line}\n{self._get_frame_text()}")
 
     def render(self, context: PromptContext | None = None) -> None:
-        """Start the spinner thread; return immediately so the caller can act."""
+        """Start animating on the frame scheduler; return immediately so the
+        caller can act."""
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
         from wexample_prompt.common.prompt_context import PromptContext
         from wexample_prompt.common.spinner_pool import Spinner
+        from wexample_prompt.helper.terminal import terminal_supports_cursor_control
 
         context = PromptContext.create_if_none(context=context)
         if not self._verbosity_context_allows_display(context=context):
@@ -93,46 +107,58 @@ class SpinnerPromptResponse(AbstractInteractivePromptResponse):
         self._spinner_inst = Spinner(interval=self.interval)
         self._lock = threading.Lock()
         self._running = True
-        self._thread = threading.Thread(target=self._spin_loop, daemon=True)
+        self._cursor_control = terminal_supports_cursor_control(sys.stdout)
+        if not self._cursor_control:
+            return None
 
         self._draw()
-        self._thread.start()
+        # No thread of its own: the shared scheduler calls _tick() once per
+        # interval, in the same frames as every other live widget.
+        self._subscription = FrameScheduler.shared().subscribe(
+            self._tick, animated=True, interval=self.interval
+        )
         return None
 
     def stop(self) -> None:
         """Stop the spinner and erase its line."""
+        if self._live_slot is not None:
+            self._live_slot.remove()
+            return
         if not self._running:
             return
-        self._running = False
-        if self._thread is not None:
-            self._thread.join(timeout=max(self.interval * 2, 0.2))
         with self._lock:
-            sys.stdout.write("\r\x1b[2K")
-            sys.stdout.flush()
+            self._running = False
+            if not self._cursor_control:
+                return
+            self._subscription.cancel()
+            self._write("\r\x1b[2K")
 
     def _draw(self) -> None:
-        if not self._running:
-            return
-        frame = self._spinner_inst.next()
-        sys.stdout.write(f"\r\x1b[2K{frame} {self.label}")
-        sys.stdout.flush()
+        self._write(self._get_frame_text())
+
+    def _get_frame_text(self) -> str:
+        from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+        if not self._running or not self._cursor_control:
+            return ""
+        frame = self._spinner_inst.next(now=FrameScheduler.shared().clock)
+        return f"\r\x1b[2K{frame} {self.label}"
 
     # ─── internals ───────────────────────────────────────────────────────
-    def _spin_loop(self) -> None:
-        # Cache frequently-accessed names as locals to reduce per-tick attr lookups.
-        _interval = self.interval
-        _lock = self._lock
-        _sleep = time.sleep
-        _next = self._spinner_inst.next  # bound method — avoids two attr lookups per tick
-        _label = self.label              # immutable during spinner lifetime
-        _write = sys.stdout.write
-        _flush = sys.stdout.flush
-
-        while self._running:
-            _sleep(_interval)
-            if not self._running:
-                break
-            with _lock:
-                if self._running:
-                    _write(f"\r\x1b[2K{_next()} {_label}")
-                    _flush()
+    def _tick(self) -> None:
+        with self._lock:
+            self._draw()
+
+    @staticmethod
+    def _write(text: str) -> None:
+        # Under the stdout lock, so rows printed by other threads through the
+        # io never land in the middle of the spinner line.
+        from wexample_prompt.output.prompt_stdout_output_handler import (
+            PromptStdoutOutputHandler,
+        )
+
+        if not text:
+            return
+        with PromptStdoutOutputHandler.WRITE_LOCK:
+            sys.stdout.write(text)
+            sys.stdout.flush()
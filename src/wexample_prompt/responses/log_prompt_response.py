@@ -35,10 +35,10 @@ class LogPromptResponse(AbstractPromptResponse):
         """
         # Handle message parameter
         if (msg := kwargs.get("message")) is not None:
-            kwargs["message"] = prefix + msg
-        elif args and isinstance(args[0], str):
+            kwargs["message"] = cls._prefix_message(prefix, msg)
+        elif args and (isinstance(args[0], str) or callable(args[0])):
             # Handle positional message argument
-            args = (prefix + args[0], *args[1:])
+            args = (cls._prefix_message(prefix, args[0]), *args[1:])
 
         return args, kwargs
 
@@ -43,10 +43,10 @@ class AbstractMessageResponse(AbstractPromptResponse):
 
         # Handle message parameter
         if "message" in kwargs:
-            kwargs["message"] = final_prefix + kwargs["message"]
-        elif args and isinstance(args[0], str):
+            kwargs["message"] = cls._prefix_message(final_prefix, kwargs["message"])
+        elif args and (isinstance(args[0], str) or callable(args[0])):
             # Handle positional message argument
-            args = (final_prefix + args[0], *args[1:])
+            args = (cls._prefix_message(final_prefix, args[0]), *args[1:])
 
         return args, kwargs
 
@@ -34,6 +34,9 @@ class ErrorPromptResponse(AbstractMessageResponse):
 
         from wexample_prompt.enums.terminal_color import TerminalColor
 
+        if callable(message):
+            message = message()
+
         # Build content: if there's an exception, create a red header line (symbol + message)
         # and append the formatted trace as raw lines (no added color) so its own formatting stays intact.
         if exception is not None:
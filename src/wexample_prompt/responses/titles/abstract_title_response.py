@@ -77,6 +77,9 @@ class AbstractTitleResponse(AbstractMessageResponse):
         from wexample_prompt.common.prompt_response_line import PromptResponseLine
         from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
 
+        if callable(text):
+            text = text()
+
         # Extract context prefix if provided (added by apply_prefix_to_kwargs)
         _context_prefix = kwargs.pop("_context_prefix", None)
 
@@ -129,6 +132,7 @@ class AbstractTitleResponse(AbstractMessageResponse):
         from wexample_prompt.common.prompt_context import PromptContext
         from wexample_prompt.helper.terminal import terminal_get_visible_width
 
+        self.resolve_deferred()
         context = PromptContext.create_if_none(context=context)
 
         # Prefer provided context, else defer to super to resolve any defaulting
@@ -160,6 +164,8 @@ class AbstractTitleResponse(AbstractMessageResponse):
         else:
             fill_text = ""
 
-        self.fill_segment.text = fill_text
+        if self.fill_segment.text != fill_text:
+            self.fill_segment.text = fill_text
+            self.mark_dirty()
 
         return super().render(context=context)
@@ -132,7 +132,9 @@ class SeparatorPromptResponse(AbstractMessageResponse):
             if self.lines:
                 self.lines[0].segments.insert(0, separator_segment)
         character = self.character or self.DEFAULT_CHARACTER
-        separator_segment.text = length * character
+        if separator_segment.text != length * character:
+            separator_segment.text = length * character
+            self.mark_dirty()
 
         return super().render(
             context=context,
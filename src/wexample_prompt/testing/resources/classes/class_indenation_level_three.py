@@ -36,8 +36,7 @@ class ClassIndentationLevelThree(WithIoMethods, BaseClass):
             colorized=False,
         )
 
-        io_context = self.create_io_context()
-        io_context.width = 100
+        io_context = self.create_io_context(width=100)
 
         self.separator(
             label="Text width management",
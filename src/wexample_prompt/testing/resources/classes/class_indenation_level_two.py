@@ -26,11 +26,12 @@ class ClassIndentationLevelTwo(WithIoMethods):
         level_three.print_deep_log_three()
 
         self.separator("Try class level three in quiet mode")
-        io_context.verbosity = VerbosityLevel.QUIET
+        quiet_context = io_context.clone(verbosity=VerbosityLevel.QUIET)
+        # Hidden: a quiet context only shows critical responses.
+        self.log(message="test deep log two (quiet)", context=quiet_context)
 
         level_three = ClassIndentationLevelThree(parent_io_handler=self)
 
         level_three.print_deep_log_three()
 
-        io_context.verbosity = VerbosityLevel.DEFAULT
-        self.separator("Quiet end")
+        self.separator("Quiet end", context=io_context)
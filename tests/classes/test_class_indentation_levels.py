@@ -16,6 +16,24 @@ class TestIoManager(AbstractPromptTest):
 
         assert level_one is not None
 
+    def test_quiet_context_hides_logs(self) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+        from wexample_prompt.output.prompt_buffer_output_handler import (
+            PromptBufferOutputHandler,
+        )
+        from wexample_prompt.testing.resources.classes.class_indenation_level_one import (
+            ClassIndentationLevelOne,
+        )
+
+        output = PromptBufferOutputHandler()
+        level_one = ClassIndentationLevelOne(io=IoManager(output=output))
+        level_one.print_deep_log_one()
+
+        rendered = "\n".join(output.flush())
+        assert "test deep log two" in rendered
+        assert "test deep log two (quiet)" not in rendered
+        assert "Quiet end" in rendered
+
     def test_nested_context_indentation_values(self) -> None:
         from wexample_prompt.testing.resources.classes.class_indenation_level_one import (
             ClassIndentationLevelOne,
@@ -0,0 +1,240 @@
+"""Tests for the asyncio facade (io.aio)."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def test_message_methods_are_awaitable() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.messages.info_prompt_response import (
+        InfoPromptResponse,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+
+    response = asyncio.run(io.aio.info("from the loop"))
+
+    assert isinstance(response, InfoPromptResponse)
+    assert "from the loop" in io.output.rendered_str
+
+
+def test_asyncio_handler_is_used_within_async_with_only() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_asyncio_output_handler import (
+        PromptAsyncioOutputHandler,
+    )
+
+    io = IoManager()
+    output = io.output
+    assert io.aio.io is io
+    assert io.output is output
+
+    async def main():
+        async with io.aio as aio:
+            assert aio is io.aio
+            return isinstance(io.output, PromptAsyncioOutputHandler)
+
+    assert asyncio.run(main())
+    assert io.output is output
+
+
+def test_pending_widgets_share_one_loop(capsys) -> None:
+    from wexample_prompt.common.io_manager import IoManager
+
+    io = IoManager()
+    polls = {"a": 0, "b": 0}
+
+    def make_callback(key: str):
+        async def callback():
+            polls[key] += 1
+            await asyncio.sleep(0)
+            return polls[key] >= 3, [f"{key} poll {polls[key]}"]
+
+        return callback
+
+    async def main():
+        await asyncio.gather(
+            io.aio.pending(callback=make_callback("a"), label="A", interval=0.01),
+            io.aio.pending(callback=make_callback("b"), label="B", interval=0.01),
+        )
+
+    asyncio.run(main())
+
+    out = capsys.readouterr().out
+    assert polls == {"a": 3, "b": 3}
+    assert "a poll 3" in out and "b poll 3" in out
+
+
+def test_screen_refresh_is_event_driven() -> None:
+    import threading
+    import time
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+    frames = []
+
+    def callback(screen) -> None:
+        # A poll interval this long would time the test out without the push.
+        screen.poll_interval = 30
+        screen.min_refresh_interval = 0
+        frames.append(time.monotonic())
+        screen.print(f"frame {len(frames)}")
+        if len(frames) == 3:
+            screen.close()
+        elif len(frames) == 2:
+            threading.Timer(0.01, screen.request_refresh).start()
+
+    async def main():
+        return await io.aio.screen(callback=callback)
+
+    start = time.monotonic()
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    assert len(frames) == 3
+    assert time.monotonic() - start < 5
+
+
+def test_asyncio_handler_writes_through_pipe_transport() -> None:
+    import os
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_asyncio_output_handler import (
+        PromptAsyncioOutputHandler,
+    )
+
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w")
+    handler = PromptAsyncioOutputHandler(stream=stream)
+    io = IoManager(output=handler, colorized=False)
+
+    async def main():
+        await io.aio.log("through the transport")
+        connected = handler._fd is not None
+        # The stream keeps its own, blocking, file description.
+        assert os.get_blocking(write_fd)
+        await io.aio.close()
+        return connected
+
+    try:
+        assert asyncio.run(main())
+        assert os.get_blocking(write_fd)
+        stream.close()
+        data = os.read(read_fd, 4096).decode()
+    finally:
+        os.close(read_fd)
+
+    assert "through the transport" in data
+
+
+def test_loop_shutdown_closes_transport() -> None:
+    import os
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_asyncio_output_handler import (
+        PromptAsyncioOutputHandler,
+    )
+
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w")
+    handler = PromptAsyncioOutputHandler(stream=stream)
+    io = IoManager(output=handler, colorized=False)
+
+    async def main():
+        await io.aio.info("not closed explicitly")
+        return handler._fd is not None
+
+    try:
+        assert asyncio.run(main())
+        assert handler._fd is None
+        stream.close()
+        data = os.read(read_fd, 4096).decode()
+    finally:
+        os.close(read_fd)
+
+    assert "not closed explicitly" in data
+
+
+def test_asyncio_handler_keeps_order_and_blocking_stream_when_pipe_is_full() -> None:
+    import os
+    import threading
+
+    from wexample_prompt.output.prompt_asyncio_output_handler import (
+        PromptAsyncioOutputHandler,
+    )
+
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w")
+    handler = PromptAsyncioOutputHandler(stream=stream)
+    chunks = []
+
+    def read_all() -> None:
+        while data := os.read(read_fd, 65536):
+            chunks.append(data)
+
+    async def main():
+        await handler.connect()
+        # More than the pipe holds, with nobody reading yet: buffered.
+        handler.write("a" * 300_000)
+        assert handler._buffer
+        thread = threading.Thread(target=handler.write, args=("from thread\n",))
+        thread.start()
+        thread.join()
+        reader.start()
+        await handler.drain()
+        await asyncio.sleep(0.05)
+        # Blocking writes first write out what the loop still holds.
+        handler.flush()
+        stream.write("direct\n")
+        stream.flush()
+        handler.close()
+
+    reader = threading.Thread(target=read_all)
+    try:
+        asyncio.run(main())
+        assert os.get_blocking(write_fd)
+    finally:
+        stream.close()
+        reader.join()
+        os.close(read_fd)
+
+    data = b"".join(chunks).decode()
+    assert data == "a" * 300_000 + "from thread\n" + "direct\n"
+
+
+def test_live_widgets_follow_verbosity() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+    calls = []
+
+    def callback(*args):
+        calls.append(args)
+        return True, []
+
+    async def main():
+        pending = await io.aio.pending(
+            callback=callback, verbosity=VerbosityLevel.MAXIMUM
+        )
+        await io.aio.screen(
+            callback=callback,
+            context=PromptContext(verbosity=VerbosityLevel.QUIET),
+        )
+        return pending
+
+    pending = asyncio.run(main())
+
+    assert pending.verbosity == VerbosityLevel.MAXIMUM
+    assert calls == []
@@ -0,0 +1,96 @@
+"""Tests for ChoiceFilter."""
+
+from __future__ import annotations
+
+
+def test_matches_are_ranked() -> None:
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    titles = [
+        "docs/readme.md",
+        "src/prompt/render.py",
+        "src/prompt/io_manager.py",
+        "tests/test_render.py",
+        "scripts/release.sh",
+    ]
+    result = ChoiceFilter(titles=titles).match("render")
+
+    # Contiguous matches first, those starting a word before the others,
+    # then scattered matches ("readme" has r-e-n-d-e-r in order, spread out).
+    assert [titles[index] for index in result.indices] == [
+        "src/prompt/render.py",
+        "tests/test_render.py",
+    ]
+    assert result.total == 2
+
+    result = ChoiceFilter(titles=titles).match("rdme")
+    assert [titles[index] for index in result.indices] == ["docs/readme.md"]
+
+    result = ChoiceFilter(titles=titles).match("")
+    assert list(result.indices) == list(range(len(titles)))
+
+
+def test_limit_keeps_the_best_matches() -> None:
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    titles = [f"item {index:04}" for index in range(2000)]
+    result = ChoiceFilter(titles=titles, limit=3).match("item 1")
+
+    # Every title with a "1" matches, the contiguous matches rank first.
+    assert result.total == sum("1" in f"{index:04}" for index in range(2000))
+    assert [titles[index] for index in result.indices] == [
+        "item 1000",
+        "item 1001",
+        "item 1002",
+    ]
+
+
+def test_titles_are_folded() -> None:
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    titles = ["@color:red{Crème} brûlée", "Creme fraiche", "Cake"]
+    result = ChoiceFilter(titles=titles).match("CREME")
+
+    assert sorted(result.indices) == [0, 1]
+    # Markup is not searchable.
+    assert ChoiceFilter(titles=titles).match("red").total == 0
+
+
+def test_extended_query_only_scans_previous_matches() -> None:
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    choice_filter = ChoiceFilter(titles=["alpha", "beta", "gamma", "delta"])
+    assert choice_filter.match("be").indices == [1]
+
+    # Titles excluded by "be" are never looked at for "bet".
+    choice_filter._keys[3] = "bet"
+    assert choice_filter.match("bet").indices == [1]
+    # A query not extending the previous one scans everything.
+    assert choice_filter.match("et").indices == [3, 1]
+
+
+def test_submitted_queries_are_matched_on_a_worker() -> None:
+    import threading
+
+    from wexample_prompt.common.choice.choice_filter import ChoiceFilter
+
+    results = []
+    received = threading.Event()
+
+    def on_result(result) -> None:
+        results.append(result)
+        received.set()
+
+    titles = [f"entry {index}" for index in range(100_000)]
+    choice_filter = ChoiceFilter(titles=titles, on_result=on_result)
+    for query in ["e", "en", "ent", "entry 99999"]:
+        choice_filter.submit(query)
+    assert received.wait(10)
+    thread = choice_filter._thread
+    choice_filter.close()
+    thread.join(5)
+
+    # Superseded queries are dropped, only the last one is reported.
+    assert [result.query for result in results] == ["entry 99999"]
+    assert results[0].indices == [99999]
+    assert not thread.is_alive()
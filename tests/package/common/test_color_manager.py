@@ -17,7 +17,7 @@ def test_build_prefix_with_color_and_styles() -> None:
         color=TerminalColor.RED, styles=[TextStyle.BOLD, TextStyle.UNDERLINE]
     )
     assert prefix.startswith(str(TerminalColor.RED))
-    # Contains bold and underline codes (order of join preserved)
+    # Contains bold and underline codes
     assert "\033[1m" in prefix
     assert "\033[4m" in prefix
     # No reset in prefix
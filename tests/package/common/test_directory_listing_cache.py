@@ -0,0 +1,72 @@
+"""Tests for DirectoryListingCache."""
+
+from __future__ import annotations
+
+
+def test_listing_is_cached_until_the_directory_changes(tmp_path) -> None:
+    import os
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "file.txt").write_text("")
+    # Changed long ago: the listing can be cached.
+    os.utime(tmp_path, ns=(0, 1_000_000_000))
+
+    cache = DirectoryListingCache()
+    listing = cache.read(str(tmp_path))
+    assert listing.dirs == ["folder"]
+    assert listing.files == ["file.txt"]
+    assert cache.get(str(tmp_path)) is listing
+
+    (tmp_path / "other.txt").write_text("")
+    assert cache.get(str(tmp_path)) is None
+    # Changed just now: read again each time until it settles.
+    assert sorted(cache.read(str(tmp_path)).files) == ["file.txt", "other.txt"]
+    assert cache.get(str(tmp_path)) is None
+
+
+def test_entries_are_reported_in_batches(tmp_path) -> None:
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+
+    for index in range(1000):
+        (tmp_path / f"file_{index}").write_text("")
+    cache = DirectoryListingCache()
+    batches = []
+
+    listing = cache.read(
+        str(tmp_path), on_batch=lambda dirs, files: batches.append(len(files))
+    )
+    assert batches == [256, 512]
+    assert len(listing.files) == 1000
+
+    assert cache.read(str(tmp_path), cancelled=lambda: True) is None
+    assert cache.read(str(tmp_path / "missing")).files == []
+
+
+def test_directories_are_prefetched_in_the_background(tmp_path) -> None:
+    import os
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"folder_{index}"
+        path.mkdir()
+        (path / "file.txt").write_text("")
+        os.utime(path, ns=(0, 1_000_000_000))
+        paths.append(str(path))
+
+    cache = DirectoryListingCache()
+    cache.prefetch(paths)
+    thread = cache._thread
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert all(cache.get(path).files == ["file.txt"] for path in paths)
@@ -0,0 +1,121 @@
+"""Tests for FrameDiffRenderer."""
+
+from __future__ import annotations
+
+import re
+
+_SEQUENCE = re.compile(r"\x1b\[(\d*)([EFJK])")
+
+
+def test_frames_are_reproduced_on_screen() -> None:
+    from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+
+    frames = FrameDiffRenderer()
+    screen = _Screen(columns=10)
+    screen.feed("shell output\n")
+    for frame in [
+        "title\n  one\n› two\n  three",
+        "title\n› one\n  two\n  three",
+        "title\n› one\n  two\n  three\n  four",
+        "a line wrapping on three rows\n› one",
+        "a line wrapping on three ROWS\n  one",
+        "title",
+        None,
+        "back",
+    ]:
+        screen.feed(frames.diff(frame, columns=10))
+        expected = [] if frame is None else frame.split("\n")
+        assert screen.text(start=2) == _wrap(expected, columns=10)
+        assert screen.rows[:2] == ["shell outp", "ut"]
+
+    screen.feed(frames.clear())
+    assert screen.text(start=2) == []
+
+
+def test_unchanged_rows_are_not_written() -> None:
+    from wexample_prompt.common.frame_diff_renderer import FrameDiffRenderer
+
+    choices = [f"choice number {index}" for index in range(20)]
+
+    def frame(selected: int) -> str:
+        return "\n".join(
+            ("› " if index == selected else "  ") + choice
+            for index, choice in enumerate(choices)
+        )
+
+    frames = FrameDiffRenderer()
+    first = frames.diff(frame(0), columns=80)
+    assert first == frame(0) + "\n"
+
+    update = frames.diff(frame(1), columns=80)
+    # Only the two rows whose selection marker changed are rewritten.
+    assert update == (
+        "\x1b[20F\x1b[K  choice number 0\x1b[1E\x1b[K› choice number 1\x1b[19E"
+    )
+    assert frames.diff(frame(1), columns=80) == ""
+    assert frames.frame_count == 3
+    assert frames.bytes_written == len(first) + len(update)
+
+
+def _wrap(lines: list[str], columns: int) -> list[str]:
+    rows = []
+    for line in lines:
+        rows.extend(
+            line[start : start + columns] for start in range(0, len(line), columns)
+        )
+        if not line:
+            rows.append("")
+    return rows
+
+
+class _Screen:
+    """Minimal terminal: wraps at `columns`, knows the sequences the renderer emits."""
+
+    def __init__(self, columns: int) -> None:
+        self.columns = columns
+        self.rows = [""]
+        self.row = 0
+        self.column = 0
+
+    def feed(self, data: str) -> None:
+        position = 0
+        for match in _SEQUENCE.finditer(data):
+            self._write(data[position : match.start()])
+            self._control(int(match.group(1) or 0), match.group(2))
+            position = match.end()
+        self._write(data[position:])
+
+    def text(self, start: int) -> list[str]:
+        rows = self.rows[start:]
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def _control(self, count: int, command: str) -> None:
+        if command in "EF":
+            self.row += count if command == "E" else -count
+            self.column = 0
+        elif command == "K":
+            self.rows[self.row] = self.rows[self.row][: self.column]
+        else:
+            self.rows[self.row] = self.rows[self.row][: self.column]
+            del self.rows[self.row + 1 :]
+
+    def _write(self, text: str) -> None:
+        for char in text:
+            if char == "\n":
+                self.row += 1
+                self.column = 0
+            elif char == "\r":
+                self.column = 0
+            else:
+                if self.column == self.columns:
+                    self.row += 1
+                    self.column = 0
+                while len(self.rows) <= self.row:
+                    self.rows.append("")
+                row = self.rows[self.row].ljust(self.column)
+                self.rows[self.row] = row[: self.column] + char + row[self.column + 1 :]
+                self.column += 1
+            while len(self.rows) <= self.row:
+                self.rows.append("")
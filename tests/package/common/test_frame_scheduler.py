@@ -0,0 +1,134 @@
+"""Tests for FrameScheduler."""
+
+from __future__ import annotations
+
+
+def test_updates_between_frames_are_coalesced() -> None:
+    import threading
+
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler(fps=20)
+    drawn = threading.Event()
+    calls = []
+
+    def callback() -> None:
+        calls.append(True)
+        drawn.set()
+
+    subscription = scheduler.subscribe(callback, interval=10)
+    for _ in range(1000):
+        subscription.mark_dirty()
+    assert drawn.wait(5)
+
+    # Dirty again, but the next frame is only due after the interval.
+    for _ in range(1000):
+        subscription.mark_dirty()
+    subscription.cancel()
+
+    assert calls == [True]
+    assert scheduler.subscription_count == 0
+
+
+def test_animated_subscriptions_share_one_thread() -> None:
+    import threading
+    import time
+
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler(fps=100)
+    counts = [0] * 16
+    threads_before = threading.active_count()
+
+    def tick(index: int) -> None:
+        counts[index] += 1
+
+    subscriptions = [
+        scheduler.subscribe(lambda index=index: tick(index), animated=True)
+        for index in range(16)
+    ]
+    assert threading.active_count() == threads_before + 1
+    deadline = time.monotonic() + 5
+    while min(counts) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert min(counts) >= 3
+
+    thread = scheduler._thread
+    for subscription in subscriptions:
+        subscription.cancel()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert scheduler._thread is None
+
+
+def test_clock_is_snapped_to_frames() -> None:
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler(fps=4)
+    remainder = scheduler.clock % 0.25
+    assert min(remainder, 0.25 - remainder) < 1e-6
+
+
+def test_frame_delay_ends_on_a_frame_boundary() -> None:
+    import time
+
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler(fps=4)
+    delay = scheduler.get_frame_delay(0.3)
+    due = time.monotonic() + delay
+
+    assert 0.3 - 0.01 <= delay <= 0.3 + 0.25
+    remainder = due % 0.25
+    assert min(remainder, 0.25 - remainder) < 0.01
+
+
+def test_pending_callback_runs_on_the_caller_thread(capsys) -> None:
+    import threading
+
+    from wexample_prompt.common.frame_scheduler import FrameScheduler
+    from wexample_prompt.common.io_manager import IoManager
+
+    threads = []
+
+    def callback():
+        threads.append(threading.current_thread())
+        return len(threads) == 3, []
+
+    IoManager().pending(callback=callback, interval=0.01)
+
+    assert threads == [threading.current_thread()] * 3
+    # Pending responses don't subscribe: the scheduler thread is not started.
+    assert FrameScheduler.shared().subscription_count == 0
+
+
+def test_spinner_writes_under_the_stdout_lock(monkeypatch) -> None:
+    import io
+    import sys
+
+    from wexample_prompt.output.prompt_stdout_output_handler import (
+        PromptStdoutOutputHandler,
+    )
+    from wexample_prompt.responses.interactive.spinner_prompt_response import (
+        SpinnerPromptResponse,
+    )
+
+    locked = []
+
+    class _Stream(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+        def write(self, text: str) -> int:
+            locked.append(PromptStdoutOutputHandler.WRITE_LOCK.locked())
+            return super().write(text)
+
+    monkeypatch.setenv("TERM", "xterm")
+    monkeypatch.setattr(sys, "stdout", _Stream())
+    spinner = SpinnerPromptResponse.create_spinner(label="working", interval=10)
+    spinner.render()
+    spinner.log("event")
+    spinner.stop()
+
+    assert locked and all(locked)
+    assert "event\n" in sys.stdout.getvalue()
@@ -0,0 +1,94 @@
+"""Concurrent workers sharing one IoManager (concurrent mode)."""
+
+from __future__ import annotations
+
+THREAD_COUNT = 32
+MESSAGE_COUNT = 100_000
+
+
+def test_concurrent_recorders_are_isolated_per_task() -> None:
+    import asyncio
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler(), concurrent=True)
+
+    async def worker(name: str) -> list[str]:
+        buf = io.push_recorder()
+        for index in range(3):
+            io.log(f"{name}-{index}")
+            await asyncio.sleep(0)
+        assert io.pop_recorder() is buf
+        return [_text(response) for response in buf]
+
+    async def main() -> list[list[str]]:
+        outer = io.push_recorder()
+        io.log("outer")
+        captures = await asyncio.gather(worker("a"), worker("b"))
+        io.pop_recorder()
+        captures.append([_text(response) for response in outer])
+        return captures
+
+    assert asyncio.run(main()) == [
+        ["a-0", "a-1", "a-2"],
+        ["b-0", "b-1", "b-2"],
+        ["outer"],
+    ]
+
+
+def test_concurrent_threads_write_whole_lines_and_capture_their_own(
+    tmp_path, monkeypatch
+) -> None:
+    import re
+    import sys
+    import threading
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    io = IoManager(colorized=False, concurrent=True)
+    per_thread = MESSAGE_COUNT // THREAD_COUNT
+    captures: dict[int, list[str]] = {}
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    def worker(thread_index: int) -> None:
+        barrier.wait()
+        buf = io.push_recorder()
+        for index in range(per_thread):
+            io.log(f"worker {thread_index} message {index}")
+        io.pop_recorder()
+        captures[thread_index] = [_text(response) for response in buf]
+
+    with open(tmp_path / "stdout.txt", "w", encoding="utf-8") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        threads = [
+            threading.Thread(target=worker, args=(index,))
+            for index in range(THREAD_COUNT)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        monkeypatch.undo()
+
+    pattern = re.compile(r"worker (\d+) message (\d+)")
+    received: dict[int, list[int]] = {index: [] for index in range(THREAD_COUNT)}
+    lines = (tmp_path / "stdout.txt").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == per_thread * THREAD_COUNT
+    for line in lines:
+        match = pattern.fullmatch(line)
+        assert match is not None, f"Torn line: {line!r}"
+        received[int(match.group(1))].append(int(match.group(2)))
+
+    for thread_index in range(THREAD_COUNT):
+        expected = list(range(per_thread))
+        assert received[thread_index] == expected
+        assert captures[thread_index] == [
+            f"worker {thread_index} message {index}" for index in expected
+        ]
+
+
+def _text(response) -> str:
+    return "".join(segment.text for segment in response.lines[0].segments)
@@ -0,0 +1,100 @@
+"""Tests for IoManager.create_context interning."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+
+
+def test_identical_inputs_share_one_context() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    io = _make_io()
+
+    assert io.create_context() is io.create_context()
+    assert io.create_context(PromptContext(colorized=False)) is io.create_context(
+        PromptContext(colorized=False)
+    )
+    assert io.create_context(PromptContext(colorized=False)) is not io.create_context()
+
+
+def test_indentation_and_verbosity_changes_invalidate() -> None:
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+    io = _make_io()
+    before = io.create_context()
+
+    io.indentation_up()
+    indented = io.create_context()
+    assert indented is not before
+    assert indented.indentation == 1
+
+    io.indentation_down()
+    io.default_context_verbosity = VerbosityLevel.QUIET
+    assert io.create_context().verbosity is VerbosityLevel.QUIET
+
+
+def test_sigwinch_invalidates(monkeypatch) -> None:
+    import os
+    import shutil
+
+    io = _make_io()
+    monkeypatch.setattr(
+        shutil, "get_terminal_size", lambda: os.terminal_size((100, 30))
+    )
+    assert io.create_context().width == 100
+
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda: os.terminal_size((60, 30)))
+    io._on_sigwinch(None, None)
+    assert io.create_context().width == 60
+
+
+def test_interning_can_be_disabled() -> None:
+    io = _make_io()
+    io.intern_contexts = False
+
+    assert io.create_context() is not io.create_context()
+    assert io.create_context() == io.create_context()
+
+
+def test_piped_stdout_disables_colors(monkeypatch) -> None:
+    import io
+    import sys
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+    io_manager = IoManager()
+    response = io_manager.info("Hello @color:red{World}")
+
+    assert io_manager.colorized is False
+    assert io_manager.create_context().colorized is False
+    assert "\x1b[" not in sys.stdout.getvalue()
+    assert "World" in response.rendered_content
+
+
+def test_force_color_keeps_colors_when_piped(monkeypatch) -> None:
+    import io
+    import sys
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+    IoManager().info("Hello @color:red{World}")
+
+    assert "\x1b[" in sys.stdout.getvalue()
+
+
+def _make_io() -> IoManager:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    return IoManager(output=PromptBufferOutputHandler())
@@ -0,0 +1,125 @@
+"""Tests for IoManager.is_enabled() and lazy messages."""
+
+from __future__ import annotations
+
+
+def test_is_enabled_follows_response_and_context_verbosity() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+    io = IoManager()
+
+    assert io.is_enabled()
+    assert io.is_enabled(VerbosityLevel.DEFAULT)
+    assert not io.is_enabled(VerbosityLevel.QUIET)
+    assert not io.is_enabled(VerbosityLevel.MAXIMUM)
+    assert io.is_enabled(
+        VerbosityLevel.MAXIMUM,
+        context=PromptContext(verbosity=VerbosityLevel.MAXIMUM),
+    )
+
+    io.default_context_verbosity = VerbosityLevel.HIGH
+    assert io.is_enabled(VerbosityLevel.HIGH)
+
+
+def test_recorder_enables_everything() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+    io = IoManager()
+    io.push_recorder()
+    try:
+        assert io.is_enabled(VerbosityLevel.QUIET)
+        assert io.is_enabled(VerbosityLevel.MAXIMUM)
+    finally:
+        io.pop_recorder()
+
+
+def test_filtered_response_is_returned_but_not_written() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.messages.debug_prompt_response import (
+        DebugPromptResponse,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+
+    response = io.debug("filtered", verbosity=VerbosityLevel.MAXIMUM)
+    framed = io.info("framed", verbosity=VerbosityLevel.MAXIMUM, frame=True)
+
+    assert isinstance(response, DebugPromptResponse)
+    assert framed is not None
+    assert io.output.rendered == []
+    assert response.rendered_content is None
+
+    io.debug(lambda: "lazy state")
+    assert "lazy state" in io.output.rendered_str
+
+
+def test_lazy_messages_work_with_prefix_and_titles() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.messages.info_prompt_response import (
+        InfoPromptResponse,
+    )
+
+    io = IoManager(output=PromptBufferOutputHandler())
+
+    _, kwargs = InfoPromptResponse.apply_prefix_to_kwargs(
+        "[child] ", (), {"message": lambda: "lazy"}
+    )
+    io.info(**kwargs)
+    io.title(lambda: "Lazy title")
+    io.error(lambda: "lazy error")
+
+    rendered = io.output.rendered_str
+    assert "[child]" in rendered and "lazy" in rendered
+    assert "Lazy title" in rendered
+    assert "lazy error" in rendered
+
+
+def test_filtered_lazy_message_is_not_evaluated() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+    from wexample_prompt.responses.messages.debug_prompt_response import (
+        DebugPromptResponse,
+    )
+    from wexample_prompt.responses.titles.title_prompt_response import (
+        TitlePromptResponse,
+    )
+
+    calls = []
+
+    def expensive() -> str:
+        calls.append(True)
+        return "expensive state"
+
+    io = IoManager(output=PromptBufferOutputHandler())
+    quiet = PromptContext(verbosity=VerbosityLevel.QUIET)
+
+    debug = io.debug(expensive, context=quiet)
+    log = io.log(expensive, verbosity=VerbosityLevel.QUIET)
+    title = io.title(expensive, verbosity=VerbosityLevel.MAXIMUM)
+
+    assert calls == []
+    assert io.output.rendered == []
+    assert isinstance(debug, DebugPromptResponse)
+    assert isinstance(log, LogPromptResponse)
+    assert isinstance(title, TitlePromptResponse)
+
+    # Rendering the returned response later still shows the message.
+    verbose = PromptContext(verbosity=VerbosityLevel.MAXIMUM, colorized=False)
+    assert "expensive state" in debug.render(context=verbose)
+    assert "expensive state" in title.render(context=verbose)
+    assert len(calls) == 2
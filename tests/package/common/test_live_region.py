@@ -0,0 +1,100 @@
+"""Tests for LiveRegion."""
+
+from __future__ import annotations
+
+
+def test_updates_are_coalesced_into_frames() -> None:
+    import io as text_io
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    stream = text_io.StringIO()
+    io = IoManager(colorized=False)
+    handler = io.output
+    with io.live_region(stream=stream, interactive=True, frame_interval=10) as region:
+        assert io.output is not handler
+        bars = [region.progress(total=50, label=f"bar {index}") for index in range(4)]
+        # Draw the bars now rather than waiting for the scheduler thread.
+        region.paint()
+        for _ in range(50):
+            for bar in bars:
+                assert bar.get_handle().advance(1) is None
+        io.log("above the bars")
+
+    assert io.output is handler
+    # 200 updates, but the scheduler waits frame_interval between frames.
+    assert region.frame_count <= 2
+
+    output = stream.getvalue()
+    last_frame = output[output.rindex("\x1b[J") + len("\x1b[J") :]
+    lines = last_frame.splitlines()
+    assert lines[0] == "above the bars"
+    assert [line.split(" ")[:2] for line in lines[1:]] == [
+        ["bar", str(index)] for index in range(4)
+    ]
+    assert all(line.endswith("50/50") for line in lines[1:])
+
+
+def test_spinners_get_a_slot_and_log_above() -> None:
+    import io as text_io
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    stream = text_io.StringIO()
+    io = IoManager(colorized=False)
+    with io.live_region(stream=stream, interactive=True, frame_interval=10) as region:
+        spinner = io.spinner(label="Thinking")
+        assert region.get_slot(spinner) is not None
+        assert region.slots[0].animated
+        spinner.log("tool call")
+        region.paint()
+        assert "Thinking" in stream.getvalue().splitlines()[-1]
+        spinner.stop()
+
+    assert region.slots == []
+    output = stream.getvalue()
+    assert "tool call\n" in output
+    # The last frame erases the spinner row and draws nothing.
+    assert output.endswith("Thinking\n\x1b[1F\x1b[J")
+
+
+def test_non_interactive_output_goes_through_the_io_handler() -> None:
+    import io as text_io
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    stream = text_io.StringIO()
+    buffer = PromptBufferOutputHandler()
+    io = IoManager(output=buffer, colorized=False)
+    with io.live_region(stream=stream) as region:
+        line = region.leader_line("Migrating", width=20)
+        io.log("first")
+        line.get_handle().success()
+        io.log("second")
+
+    assert region.frame_count == 0
+    assert stream.getvalue() == ""
+    assert buffer.rendered == ["first", "second", "Migrating ........ ✓"]
+
+
+def test_buffered_output_is_flushed_before_painting(capsys) -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffered_stdout_output_handler import (
+        PromptBufferedStdoutOutputHandler,
+    )
+
+    io = IoManager(
+        output=PromptBufferedStdoutOutputHandler(flush_interval=None),
+        colorized=False,
+    )
+    io.log("before the region")
+    with io.live_region(interactive=True, frame_interval=10) as region:
+        region.progress(total=1, label="bar")
+        region.paint()
+        output = capsys.readouterr().out
+        assert 0 <= output.find("before the region") < output.index("bar")
+
+    io.output.flush()
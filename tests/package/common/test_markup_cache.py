@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    from wexample_prompt.common.markup_cache import MarkupCache
+
+    MarkupCache.reset_shared()
+    yield MarkupCache.shared()
+    MarkupCache.reset_shared()
+
+
+def test_repeated_markup_hits_cache(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+
+    parse_style_markup("Hello @color:red{World}")
+    parse_style_markup("Hello @color:red{World}")
+
+    stats = fresh_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] == 1
+
+
+def test_cached_result_matches_fresh_parse(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    text = "@color:blue+bold{Outer @color:yellow{Inner}\nNext}"
+    first = parse_style_markup(text)
+    second = parse_style_markup(text)
+
+    def dump(lines):
+        return [[(s.text, s.color, list(s.styles)) for s in line] for line in lines]
+
+    assert dump(first) == dump(second)
+    assert second[0][1].color is TerminalColor.YELLOW
+    assert TextStyle.BOLD in second[1][0].styles
+
+
+def test_cached_copies_are_independent(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.text_style import TextStyle
+
+    first = parse_style_markup("@red{alert}")
+    first[0].insert(0, PromptResponseSegment(text="! "))
+    first[0][1].styles = (*first[0][1].styles, TextStyle.BOLD)
+
+    second = parse_style_markup("@red{alert}")
+    assert [s.text for s in second[0]] == ["alert"]
+    assert second[0][0].styles == ()
+
+
+def test_key_includes_default_color_and_styles(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    plain = parse_style_markup("a @bold{b}")
+    colored = parse_style_markup("a @bold{b}", default_color=TerminalColor.RED)
+    styled = parse_style_markup("a @bold{b}", base_styles=[TextStyle.ITALIC])
+
+    assert plain[0][0].color is None
+    assert colored[0][0].color is TerminalColor.RED
+    assert styled[0][0].styles == (TextStyle.ITALIC,)
+    assert fresh_cache.stats()["misses"] == 3
+
+
+def test_time_directive_is_never_cached(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+
+    parse_style_markup("now: @time{}")
+    parse_style_markup("at @time:%Y{0}")
+
+    assert fresh_cache.stats()["size"] == 0
+    assert fresh_cache.stats()["hits"] == 0
+
+
+def test_eviction_respects_max_size(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+
+    fresh_cache.max_size = 2
+    parse_style_markup("@red{1}")
+    parse_style_markup("@red{2}")
+    parse_style_markup("@red{1}")  # refresh 1, so 2 is the LRU entry
+    parse_style_markup("@red{3}")
+
+    stats = fresh_cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+    parse_style_markup("@red{1}")
+    assert fresh_cache.stats()["hits"] == 2
+
+
+def test_disabled_cache_stores_nothing(fresh_cache) -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+
+    fresh_cache.enabled = False
+    parse_style_markup("@red{x}")
+    parse_style_markup("@red{x}")
+
+    assert fresh_cache.stats()["size"] == 0
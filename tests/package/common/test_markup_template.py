@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+
+
+def _dump(lines) -> list:
+    return [[(s.text, s.color, list(s.styles)) for s in line] for line in lines]
+
+
+def test_bind_returns_formatted_string() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+
+    template = MarkupTemplate(skeleton="@color:cyan{%s} processed @bold{%d} rows")
+    bound = template.bind("users", 42)
+
+    assert bound == "@color:cyan{users} processed @bold{42} rows"
+    assert template % ("users", 42) == bound
+    assert template.slots_count == 2
+
+
+def test_fill_matches_full_parse() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+    from wexample_prompt.common.style_markup_parser import (
+        _parse_style_markup_uncached,
+        parse_style_markup,
+    )
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    template = MarkupTemplate(
+        skeleton="Job %s: @color:cyan+bold{%s}\n@red{%.1f%%} done"
+    )
+    bound = template.bind("#3", "import", 12.345)
+
+    filled = parse_style_markup(bound, default_color=TerminalColor.BLUE)
+    reference = _parse_style_markup_uncached(str(bound), TerminalColor.BLUE, ())
+
+    assert _dump(filled) == _dump(reference)
+    assert filled[1][0].text == "12.3%"
+    assert filled[1][0].color is TerminalColor.RED
+
+
+@pytest.mark.parametrize(
+    ("skeleton", "values"),
+    [
+        ("@%s{hi}", ("red",)),
+        ("@bo%s{hi}", ("ld",)),
+        ("@bold{%s} rows", ("",)),
+        ("x @color:cyan{%s} y %d", ("", 3)),
+        ("a\n%s\nb", ("",)),
+        ("@bold{a\n%s}\nb", ("",)),
+        ("@bold{%s}%s", ("", "")),
+        ("Job %s: @color:cyan+bold{%s}", ("#3", "import")),
+    ],
+)
+def test_fill_matches_parsing_the_bound_string(skeleton: str, values: tuple) -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+    from wexample_prompt.common.style_markup_parser import flatten_style_markup
+
+    bound = MarkupTemplate(skeleton=skeleton).bind(*values)
+
+    assert _dump([flatten_style_markup(bound)]) == _dump(
+        [flatten_style_markup(str(bound))]
+    )
+
+
+def test_values_with_markup_characters_fall_back_to_parser() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    template = MarkupTemplate(skeleton="value: %s")
+    lines = parse_style_markup(template.bind("@red{x}\nnext"))
+
+    assert len(lines) == 2
+    assert lines[0][1].color is TerminalColor.RED
+    assert lines[1][0].text == "next"
+
+
+def test_directive_params_are_not_placeholders() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+
+    template = MarkupTemplate(skeleton="@time:%Y-%m-%d{0} %s")
+
+    assert template.slots_count == 1
+    assert template.bind("x") == "@time:%Y-%m-%d{0} x"
+
+
+def test_wrong_values_count_raises() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+
+    with pytest.raises(TypeError):
+        MarkupTemplate(skeleton="%s and %s").bind("only one")
+
+
+def test_io_methods_accept_bound_template() -> None:
+    from wexample_prompt.common.markup_template import MarkupTemplate
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    io = _make_io()
+    plain = PromptContext(colorized=False)
+    template = MarkupTemplate(skeleton="@color:cyan{%s} processed @bold{%d} rows")
+
+    info = io.info(template.bind("users", 3))
+    log = io.log(template % ("orders", 7))
+
+    assert "users processed 3 rows" in info.render(plain)
+    assert "orders processed 7 rows" in log.render(plain)
+    assert info.lines[0].segments[1].color is TerminalColor.CYAN
+
+
+def _make_io() -> IoManager:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    return IoManager(output=PromptBufferOutputHandler())
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_context_is_immutable_and_clonable() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    context = PromptContext(width=80, colorized=True)
+
+    with pytest.raises(AttributeError):
+        context.colorized = False
+
+    plain = context.clone(colorized=False)
+    assert plain.colorized is False
+    assert plain.width == 80
+    assert context.colorized is True
+
+
+def test_equal_contexts_share_hash() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    first = PromptContext(width=80, indentation=2)
+    second = PromptContext(width=80, indentation=2)
+    first.render_indentation()
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second, PromptContext(width=40)}) == 2
+
+
+def test_values_are_resolved_through_parents() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.enums.indentation_style import IndentationStyle
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    parent = PromptContext(
+        indentation_character="│",
+        indentation_style=IndentationStyle.VERTICAL,
+        indentation_text_color=TerminalColor.BLUE,
+    )
+    child = PromptContext(
+        parent_context=parent,
+        indentation=None,
+        indentation_character=None,
+        indentation_style=None,
+        colorized=False,
+    )
+
+    assert child.get_indentation() == 1
+    assert child.get_indentation_character() == "│"
+    assert child.get_indentation_text_color() is TerminalColor.BLUE
+    assert child.render_indentation() == "│ "
+    assert child.get_indentation_visible_width() == 2
+
+
+def test_content_width_excludes_indentation() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    assert PromptContext(width=40, indentation=3).get_content_width() == 34
+    assert PromptContext().get_content_width() is None
+
+
+def test_framed_and_nested_responses_are_not_colorized() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.messages.info_prompt_response import (
+        InfoPromptResponse,
+    )
+
+    output = PromptBufferOutputHandler()
+    io = IoManager(output=output, colorized=False)
+
+    io.info("boxed", frame="T")
+    io.frame(
+        responses=[InfoPromptResponse.create_info("nested")],
+        title="Outer",
+    )
+
+    rendered = output.rendered_str
+    assert "boxed" in rendered and "nested" in rendered
+    assert "\x1b" not in rendered
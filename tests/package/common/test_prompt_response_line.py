@@ -98,6 +98,23 @@ class TestPromptResponseLine:
         line = PromptResponseLine(segments=segments)
         assert line.render(context=PromptContext()) == "Hello World"
 
+    def test_plain_render_matches_segment_render(self) -> None:
+        from wexample_prompt.common.prompt_context import PromptContext
+        from wexample_prompt.common.prompt_response_line import PromptResponseLine
+
+        line = PromptResponseLine.create_from_string("Hello @color:red+bold{World} !")[
+            0
+        ]
+
+        for context in (
+            PromptContext(colorized=False, indentation=1),
+            PromptContext(colorized=False, formatting=True),
+        ):
+            assert line.render(context) == context.render_indentation() + "".join(
+                seg.render(context, 10**9)[0] for seg in line.segments
+            )
+        assert line.render(PromptContext(colorized=False)) == "Hello World !"
+
     def test_wrapping_is_per_line_not_across_lines(self) -> None:
         """Wrapping width must reset for each logical line produced by create_from_string."""
         from wexample_prompt.common.prompt_context import PromptContext
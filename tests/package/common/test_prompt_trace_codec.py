@@ -0,0 +1,151 @@
+"""Tests for the prompt trace writer, reader and replayer."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+
+def test_round_trip_keeps_type_time_verbosity_and_styles() -> None:
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+
+    responses = _record_responses()
+    responses[1].verbosity = VerbosityLevel.MAXIMUM
+
+    stream = io.StringIO()
+    assert PromptTraceWriter(stream=stream).write_all(responses) == len(responses)
+
+    stream.seek(0)
+    decoded = list(PromptTraceReader(stream=stream))
+
+    assert len(decoded) == len(responses)
+    for original, record in zip(responses, decoded):
+        assert record.response_type == original.__class__.__name__
+        assert record.created_at == original.created_at
+        assert record.verbosity == original.verbosity
+        assert record.lines == original.lines
+    assert decoded[1].verbosity == VerbosityLevel.MAXIMUM
+
+
+def test_styles_are_written_once() -> None:
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+
+    stream = io.StringIO()
+    PromptTraceWriter(stream=stream).write_all(_record_responses() * 3)
+
+    rows = stream.getvalue().splitlines()
+    style_rows = [row for row in rows if row.startswith('["s"')]
+    assert len(style_rows) == len(set(style_rows))
+    assert rows[0] == '{"format":"prompt-trace","version":1}'
+
+
+def test_replay_matches_original_render_at_any_width() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.common.prompt_trace_replayer import PromptTraceReplayer
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    responses = _record_responses()
+    stream = io.StringIO()
+    PromptTraceWriter(stream=stream).write_all(responses)
+
+    for width in (20, 120):
+        stream.seek(0)
+        output = PromptBufferOutputHandler()
+        replayer = PromptTraceReplayer(output=output, width=width, colorized=True)
+
+        assert replayer.replay(PromptTraceReader(stream=stream)) == len(responses)
+
+        context = PromptContext(width=width, colorized=True, formatting=True)
+        # Log responses render their lines as they are.
+        assert output.rendered[0] == responses[0].render(context=context)
+        assert output.rendered[2] == responses[2].render(context=context)
+
+    # Lines are wrapped for the replay width.
+    output = PromptBufferOutputHandler()
+    PromptTraceReplayer(output=output, width=20).replay(
+        [LogPromptResponse.create_log("x" * 150)]
+    )
+    assert len(output.rendered[0].split("\n")) == 8
+
+
+def test_compacted_records_can_be_written_and_replayed() -> None:
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.common.prompt_trace_replayer import PromptTraceReplayer
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+    from wexample_prompt.common.recorded_response import RecordedResponse
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    record = RecordedResponse(
+        response_type="InfoPromptResponse", text="first\n@not-markup", created_at=1.0
+    )
+    stream = io.StringIO()
+    PromptTraceWriter(stream=stream).write(record)
+    stream.seek(0)
+
+    (decoded,) = list(PromptTraceReader(stream=stream))
+    assert decoded.text == "first\n@not-markup"
+    assert decoded.response_type == "InfoPromptResponse"
+
+    output = PromptBufferOutputHandler()
+    PromptTraceReplayer(output=output, width=80, colorized=False).replay([decoded])
+    assert output.rendered == ["first\n@not-markup"]
+
+
+def test_frames_and_properties_are_written_as_rendered() -> None:
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+    from wexample_prompt.common.prompt_trace_writer import PromptTraceWriter
+
+    io_manager = _make_io()
+    io_manager.push_recorder()
+    io_manager.info("boxed", frame="Framed")
+    io_manager.frame(text="inside", title="Box")
+    io_manager.properties(properties={"name": "value"}, title="Props")
+    io_manager.title("Heading")
+    responses = io_manager.pop_recorder()
+
+    stream = io.StringIO()
+    PromptTraceWriter(stream=stream).write_all(responses)
+    stream.seek(0)
+    texts = [record.render() for record in PromptTraceReader(stream=stream)]
+
+    assert "boxed" in texts[0] and "Framed" in texts[0] and "╭" in texts[0]
+    assert "inside" in texts[1] and "Box" in texts[1] and "╰" in texts[1]
+    assert "name" in texts[2] and "value" in texts[2] and "Props" in texts[2]
+    # The title fill is built by render(), not stored in the lines.
+    assert "Heading" in texts[3] and "⫻" * 3 in texts[3]
+    assert all("\x1b" not in text for text in texts)
+
+
+def test_unknown_header_is_rejected() -> None:
+    from wexample_prompt.common.prompt_trace_reader import PromptTraceReader
+
+    with pytest.raises(ValueError):
+        list(PromptTraceReader(stream=['{"format":"other","version":9}\n']))
+
+
+def _make_io():
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    return IoManager(output=PromptBufferOutputHandler())
+
+
+def _record_responses() -> list:
+    io_manager = _make_io()
+    io_manager.push_recorder()
+    io_manager.log("plain @color:red+bold{styled} text")
+    io_manager.success("done")
+    io_manager.log(["first line", "@color:cyan{second} line, long enough to wrap"])
+    return io_manager.pop_recorder()
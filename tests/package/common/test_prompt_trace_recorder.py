@@ -89,10 +89,107 @@ def test_recorder_stack_isolates_nested_buffers() -> None:
     assert all("inner" not in t for t in outer_texts)
 
 
-def _make_io() -> IoManager:
+def test_bounded_recorder_compacts_oldest_entries() -> None:
+    from wexample_prompt.common.prompt_recorder import PromptRecorder
+    from wexample_prompt.common.recorded_response import RecordedResponse
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    io = _make_io(recorder_max_entries=3)
+
+    buf = io.push_recorder()
+    for index in range(10):
+        io.print_response(
+            response=LogPromptResponse.create_log(message=f"line {index}")
+        )
+    captured = io.pop_recorder()
+
+    assert captured is buf
+    assert isinstance(captured, PromptRecorder)
+    assert len(captured) == 10
+    assert captured.compacted_count == 7
+
+    entries = list(captured)
+    assert all(isinstance(entry, RecordedResponse) for entry in entries[:7])
+    assert all(isinstance(entry, LogPromptResponse) for entry in entries[7:])
+    assert entries[0].response_type == "LogPromptResponse"
+    assert entries[0].created_at is not None
+    assert [entry.render() for entry in entries[:2]] == ["line 0", "line 1"]
+    assert "line 9" in entries[-1].render()
+
+
+def test_bounded_recorder_respects_byte_ceiling() -> None:
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    io = _make_io(recorder_max_bytes=5_000)
+
+    io.push_recorder()
+    for index in range(100):
+        io.print_response(response=LogPromptResponse.create_log(message="x" * 200))
+    captured = io.pop_recorder()
+
+    assert len(captured) == 100
+    assert 0 < len(captured) - captured.compacted_count < 100
+    assert captured._live_bytes <= 5_000
+
+
+def test_bounded_recorder_spills_to_jsonl(tmp_path) -> None:
+    import json
+    import os
+
+    from wexample_prompt.common.prompt_recorder import PromptRecorder
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    recorder = PromptRecorder(max_entries=2, spill=True, spill_dir=str(tmp_path))
+    for index in range(6):
+        response = LogPromptResponse.create_log(message=f"spilled {index}")
+        response.created_at = float(index)
+        recorder.append(response)
+
+    texts = [entry.render() for entry in recorder]
+    assert texts[:4] == [f"spilled {i}" for i in range(4)]
+    assert "spilled 5" in texts[-1]
+    assert [entry.created_at for entry in recorder] == [float(i) for i in range(6)]
+    assert recorder._compacted == []
+
+    path = recorder.spill_path
+    with open(path, encoding="utf-8") as spilled:
+        rows = [json.loads(line) for line in spilled]
+    assert [row["text"] for row in rows] == [f"spilled {i}" for i in range(4)]
+
+    recorder.close()
+    assert not os.path.exists(path)
+    assert len(recorder) == 2
+
+
+def test_compacted_frames_and_properties_keep_their_output(tmp_path) -> None:
+    from wexample_prompt.common.prompt_recorder import PromptRecorder
+    from wexample_prompt.responses.data.properties_prompt_response import (
+        PropertiesPromptResponse,
+    )
+    from wexample_prompt.responses.frame_prompt_response import (
+        FramePromptResponse,
+    )
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    for spill in (False, True):
+        recorder = PromptRecorder(max_entries=1, spill=spill, spill_dir=str(tmp_path))
+        recorder.append(FramePromptResponse.create_frame(text="boxed", title="Box"))
+        recorder.append(
+            PropertiesPromptResponse.create_properties(properties={"name": "value"})
+        )
+        recorder.append(LogPromptResponse.create_log(message="last"))
+
+        frame, properties = [entry.render() for entry in list(recorder)[:2]]
+        assert "boxed" in frame and "Box" in frame and "╰" in frame
+        assert "name" in properties and "value" in properties
+        assert "\x1b" not in frame + properties
+        recorder.close()
+
+
+def _make_io(**kwargs) -> IoManager:
     from wexample_prompt.common.io_manager import IoManager
     from wexample_prompt.output.prompt_buffer_output_handler import (
         PromptBufferOutputHandler,
     )
 
-    return IoManager(output=PromptBufferOutputHandler())
+    return IoManager(output=PromptBufferOutputHandler(), **kwargs)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    from wexample_prompt.common.render_cache import RenderCache
+
+    RenderCache.reset_shared()
+    yield RenderCache.shared()
+    RenderCache.reset_shared()
+
+
+def _make_response(text: str = "Hello @color:red{World}"):
+    from wexample_prompt.responses.messages.info_prompt_response import (
+        InfoPromptResponse,
+    )
+
+    return InfoPromptResponse.create_info(message=text)
+
+
+def test_same_context_rerender_hits_cache(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    response = _make_response()
+    first = response.render(PromptContext(width=80))
+    second = response.render(PromptContext(width=80))
+
+    assert first == second
+    assert fresh_cache.stats()["misses"] == 1
+    assert fresh_cache.stats()["hits"] == 1
+
+
+def test_context_change_renders_again(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    response = _make_response()
+    colored = response.render(PromptContext(width=80))
+    plain = response.render(PromptContext(width=80, colorized=False))
+    indented = response.render(PromptContext(width=80, indentation=2))
+
+    assert "\033[" in colored
+    assert "\033[" not in plain
+    assert indented.startswith("    ")
+    assert fresh_cache.stats()["misses"] == 3
+
+
+def test_mark_dirty_and_new_lines_invalidate(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_response_line import PromptResponseLine
+
+    context = PromptContext(width=80, colorized=False)
+    response = _make_response("before")
+    assert "before" in response.render(context)
+
+    response.lines[0].segments[-1].text = "after"
+    response.mark_dirty()
+    assert "after" in response.render(context)
+
+    response.lines = PromptResponseLine.create_from_string("replaced")
+    assert response.render(context) == "replaced"
+    assert fresh_cache.stats()["hits"] == 0
+
+
+def test_disabled_cache_always_renders(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+
+    fresh_cache.enabled = False
+    response = _make_response()
+    response.render(PromptContext())
+    response.render(PromptContext())
+
+    assert fresh_cache.stats()["hits"] == 0
+    assert fresh_cache.stats()["misses"] == 0
+
+
+def test_title_fill_follows_width(fresh_cache) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.titles.title_prompt_response import (
+        TitlePromptResponse,
+    )
+
+    response = TitlePromptResponse.create_title(text="Section")
+    narrow = response.render(PromptContext(width=30, colorized=False))
+    wide = response.render(PromptContext(width=60, colorized=False))
+
+    assert len(narrow) == 30
+    assert len(wide) == 60
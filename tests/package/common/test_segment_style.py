@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_same_combination_returns_same_instance() -> None:
+    from wexample_prompt.common.segment_style import SegmentStyle
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    first = SegmentStyle.get(TerminalColor.RED, None, [TextStyle.BOLD, TextStyle.DIM])
+    second = SegmentStyle.get(TerminalColor.RED, None, (TextStyle.DIM, TextStyle.BOLD))
+
+    assert first is second
+    assert first.styles == (TextStyle.BOLD, TextStyle.DIM)
+    assert first.has_style(TextStyle.DIM)
+    assert not first.has_style(TextStyle.ITALIC)
+    assert SegmentStyle.get() is SegmentStyle.get(None, None, [])
+    assert SegmentStyle.get().prefix == ""
+
+
+def test_style_is_immutable() -> None:
+    from wexample_prompt.common.segment_style import SegmentStyle
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    style = SegmentStyle.get(TerminalColor.BLUE)
+
+    with pytest.raises(AttributeError):
+        style.color = TerminalColor.RED
+    with pytest.raises(AttributeError):
+        del style.prefix
+
+
+def test_prefix_matches_color_manager() -> None:
+    from wexample_prompt.common.color_manager import ColorManager
+    from wexample_prompt.common.segment_style import SegmentStyle
+    from wexample_prompt.enums.terminal_bg_color import TerminalBgColor
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    style = SegmentStyle.get(
+        TerminalColor.GREEN, TerminalBgColor.BLACK, [TextStyle.UNDERLINE]
+    )
+
+    assert style.prefix == (
+        str(TerminalColor.GREEN) + str(TerminalBgColor.BLACK) + "\033[4m"
+    )
+    assert style.prefix == ColorManager.build_prefix(
+        color=TerminalColor.GREEN,
+        bg=TerminalBgColor.BLACK,
+        styles=[TextStyle.UNDERLINE],
+    )
+
+
+def test_segments_share_styles() -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.text_style import TextStyle
+
+    lines = parse_style_markup("@red+bold{a}\n@red+bold{b}")
+    first, second = lines[0][0], lines[1][0]
+
+    assert first.style is second.style
+    assert first.styles == (TextStyle.BOLD,)
+
+    _, remainder = first.render(PromptContext(colorized=True), 0)
+    assert remainder.styles is first.styles
+
+
+def test_segment_styles_are_converted_to_tuple() -> None:
+    from wexample_prompt.common.prompt_response_segment import PromptResponseSegment
+    from wexample_prompt.enums.text_style import TextStyle
+
+    segment = PromptResponseSegment(text="x", styles=[TextStyle.BOLD])
+    assert segment.styles == (TextStyle.BOLD,)
+
+    segment.styles = [TextStyle.ITALIC]
+    assert segment.styles == (TextStyle.ITALIC,)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+_EDGE_CASES = [
+    "",
+    "plain text",
+    "a\n\nb\n",
+    "Hello @color:red{World}",
+    "@color:blue+bold{Outer @color:yellow+underline{Inner}\nNext}",
+    "@red{a {b} c} {d} }e{",
+    "@red{unclosed @blue{x}",
+    "ok @green{x} then @red{broken",
+    "@path:short{/tmp/a/b.txt} and @path{@red{x}}",
+    "@time:%Y{0}",
+    "@@red{x} @🔵+bold{emoji} @color:{x}",
+    "@red{\n}\n@blue{}",
+]
+
+
+@pytest.mark.parametrize("text", _EDGE_CASES)
+def test_tokenizer_matches_regex_engine(text: str) -> None:
+    from wexample_prompt.common.style_markup_parser import (
+        _parse_with_regex,
+        _parse_with_tokenizer,
+    )
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    def dump(lines) -> list:
+        return [[(s.text, s.color, list(s.styles)) for s in line] for line in lines]
+
+    for default_color, base_styles in (
+        (None, ()),
+        (TerminalColor.RED, (TextStyle.DIM,)),
+    ):
+        assert dump(_parse_with_tokenizer(text, default_color, base_styles)) == dump(
+            _parse_with_regex(text, default_color, base_styles)
+        )
+
+
+def test_tokenizer_handles_deep_nesting() -> None:
+    from wexample_prompt.common.style_markup_parser import parse_style_markup
+    from wexample_prompt.enums.terminal_color import TerminalColor
+
+    depth = 5000
+    text = "@red{" * depth + "deep" + "}" * depth
+
+    lines = parse_style_markup(text)
+
+    assert len(lines) == 1
+    assert lines[0][0].text == "deep"
+    assert lines[0][0].color is TerminalColor.RED
+
+
+def test_engine_is_selectable() -> None:
+    from wexample_prompt.common.style_markup_parser import (
+        get_style_markup_engine,
+        parse_style_markup,
+        set_style_markup_engine,
+    )
+    from wexample_prompt.enums.style_markup_engine import StyleMarkupEngine
+
+    previous = set_style_markup_engine(StyleMarkupEngine.REGEX)
+    try:
+        assert get_style_markup_engine() is StyleMarkupEngine.REGEX
+        assert parse_style_markup("a\nb")[1][0].text == "b"
+    finally:
+        set_style_markup_engine(previous)
+
+    assert get_style_markup_engine() is StyleMarkupEngine.TOKENIZER
+
+
+@pytest.mark.parametrize("text", ["", "plain", "a\n\nb\n", "\n", "x\ny", "{braces}"])
+def test_plain_text_fast_path_matches_parser(text: str) -> None:
+    from wexample_prompt.common.style_markup_parser import (
+        _parse_with_tokenizer,
+        flatten_style_markup,
+        is_plain_text,
+        parse_plain_text,
+    )
+    from wexample_prompt.enums.terminal_color import TerminalColor
+    from wexample_prompt.enums.text_style import TextStyle
+
+    def dump(lines) -> list:
+        return [[(s.text, s.color, list(s.styles)) for s in line] for line in lines]
+
+    assert is_plain_text(text)
+    assert dump(parse_plain_text(text, TerminalColor.RED, [TextStyle.BOLD])) == dump(
+        _parse_with_tokenizer(text, TerminalColor.RED, [TextStyle.BOLD])
+    )
+    if "\n" not in text:
+        assert [s.text for s in flatten_style_markup(text)] == ([text] if text else [])
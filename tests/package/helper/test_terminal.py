@@ -34,7 +34,59 @@ def test_terminal_get_visible_width_never_negative() -> None:
     assert terminal_get_visible_width("\x01\x02") >= 0
 
 
+def test_terminal_supports_synchronized_output_needs_a_known_terminal(
+    monkeypatch,
+) -> None:
+    import io
+
+    from wexample_prompt.helper.terminal import (
+        terminal_supports_synchronized_output,
+    )
+
+    class FakeTty(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+    for name in ("KITTY_WINDOW_ID", "TERM_PROGRAM"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TERM", "xterm-256color")
+    assert terminal_supports_synchronized_output(FakeTty()) is False
+
+    monkeypatch.setenv("TERM", "xterm-kitty")
+    assert terminal_supports_synchronized_output(FakeTty()) is True
+    assert terminal_supports_synchronized_output(io.StringIO()) is False
+
+    monkeypatch.setenv("TERM", "xterm-256color")
+    monkeypatch.setenv("TERM_PROGRAM", "WezTerm")
+    assert terminal_supports_synchronized_output(FakeTty()) is True
+
+
 def test_terminal_strip_sequences_removes_csi() -> None:
     from wexample_prompt.helper.terminal import terminal_strip_sequences
 
     assert terminal_strip_sequences(f"{CSI_RED}hello{CSI_RESET}") == "hello"
+
+
+def test_terminal_supports_color_honours_env(monkeypatch) -> None:
+    import io
+
+    from wexample_prompt.helper.terminal import terminal_supports_color
+
+    class FakeTty(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.setenv("TERM", "xterm")
+    assert terminal_supports_color(FakeTty()) is True
+    assert terminal_supports_color(io.StringIO()) is False
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert terminal_supports_color(FakeTty()) is False
+
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    assert terminal_supports_color(io.StringIO()) is True
+
+    monkeypatch.setenv("FORCE_COLOR", "0")
+    assert terminal_supports_color(FakeTty()) is False
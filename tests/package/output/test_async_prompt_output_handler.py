@@ -0,0 +1,242 @@
+"""Tests for AsyncPromptOutputHandler."""
+
+from __future__ import annotations
+
+import threading
+
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_prompt.output.prompt_buffer_output_handler import (
+    PromptBufferOutputHandler,
+)
+
+_GATE = threading.Event()
+
+
+@base_class
+class _GatedBufferOutputHandler(PromptBufferOutputHandler):
+    """Buffer handler whose writes wait for the test to open the gate."""
+
+    def erase_rendered(self, response, rendered):
+        self.append_rendered(f"<erase {rendered}>")
+
+    def print_rendered(self, response, rendered, context=None):
+        _GATE.wait(timeout=5)
+        return super().print_rendered(
+            response=response, rendered=rendered, context=context
+        )
+
+
+def test_writes_happen_in_order_on_writer_thread() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    buffer = PromptBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(handler=buffer)
+    io = IoManager(output=handler)
+
+    rendered = [io.log(f"line {index}").render() for index in range(50)]
+
+    assert handler.drain(timeout=5)
+    assert buffer.rendered == rendered
+    assert handler.dropped_count == 0
+    handler.close()
+
+
+def test_print_returns_before_slow_write() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    _GATE.clear()
+    buffer = _GatedBufferOutputHandler()
+    io = IoManager(output=AsyncPromptOutputHandler(handler=buffer))
+
+    io.log("waiting")
+    assert buffer.rendered == []
+
+    _GATE.set()
+    io.output.drain(timeout=5)
+    assert "waiting" in buffer.rendered_str
+
+
+def test_drop_newest_counts_discarded_responses() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    _GATE.clear()
+    buffer = _GatedBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(
+        handler=buffer, max_queue_size=2, policy="drop_newest"
+    )
+    io = IoManager(output=handler)
+
+    io.log("first")
+    # Wait for the writer to pick the first item so the queue holds the next ones.
+    while handler.pending_count and len(handler._queue):
+        pass
+    for index in range(5):
+        io.log(f"queued {index}")
+
+    assert handler.dropped_count == 3
+    _GATE.set()
+    handler.drain(timeout=5)
+    assert buffer.rendered_str.count("queued") == 2
+    assert "queued 0" in buffer.rendered_str
+    assert "queued 4" not in buffer.rendered_str
+
+
+def test_drop_oldest_keeps_latest_responses() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    _GATE.clear()
+    buffer = _GatedBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(
+        handler=buffer, max_queue_size=2, policy="drop_oldest"
+    )
+    io = IoManager(output=handler)
+
+    io.log("first")
+    while handler.pending_count and len(handler._queue):
+        pass
+    for index in range(5):
+        io.log(f"queued {index}")
+
+    assert handler.dropped_count == 3
+    _GATE.set()
+    handler.drain(timeout=5)
+    assert "queued 0" not in buffer.rendered_str
+    assert "queued 3" in buffer.rendered_str
+    assert "queued 4" in buffer.rendered_str
+
+
+def test_close_drains_and_writes_synchronously_afterwards() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    buffer = PromptBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(handler=buffer)
+    io = IoManager(output=handler)
+
+    io.log("before close")
+    handler.drain(timeout=5)
+    assert "before close" in buffer.rendered_str
+
+    handler.close()
+    assert not handler._thread.is_alive()
+
+    io.log("after close")
+    assert "after close" in buffer.rendered_str
+
+
+def test_writer_writes_the_text_rendered_by_the_caller() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_response_line import PromptResponseLine
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    _GATE.clear()
+    buffer = _GatedBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(handler=buffer)
+    io = IoManager(output=handler)
+
+    response = io.log("as printed")
+    # Changed after printing, before the writer gets to it.
+    response.lines.append(PromptResponseLine.create_from_string("changed")[0])
+    response.mark_dirty()
+
+    _GATE.set()
+    handler.drain(timeout=5)
+    assert "as printed" in buffer.rendered_str
+    assert "changed" not in buffer.rendered_str
+    handler.close()
+
+
+def test_drop_oldest_keeps_queued_erases() -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    _GATE.clear()
+    buffer = _GatedBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(
+        handler=buffer, max_queue_size=2, policy="drop_oldest"
+    )
+    io = IoManager(output=handler)
+
+    io.log("first")
+    while handler.pending_count and len(handler._queue):
+        pass
+    erased = io.log("erased")
+    io.erase_response(erased)
+    for index in range(3):
+        io.log(f"queued {index}")
+
+    _GATE.set()
+    handler.drain(timeout=5)
+    assert "<erase " in buffer.rendered_str
+    assert "queued 2" in buffer.rendered_str
+    handler.close()
+
+
+def test_close_unregisters_exit_hook(monkeypatch) -> None:
+    import atexit
+
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+    handler = AsyncPromptOutputHandler(handler=PromptBufferOutputHandler())
+    handler.erase(response=_make_response())
+    assert registered == [handler.close]
+
+    handler.close()
+    assert registered == []
+
+
+def test_failed_writes_are_counted() -> None:
+    from wexample_prompt.output.async_prompt_output_handler import (
+        AsyncPromptOutputHandler,
+    )
+
+    @base_class
+    class _FailingBufferOutputHandler(PromptBufferOutputHandler):
+        def print_rendered(self, response, rendered, context=None):
+            if "fail" in rendered:
+                raise OSError("write failed")
+            return super().print_rendered(
+                response=response, rendered=rendered, context=context
+            )
+
+    buffer = _FailingBufferOutputHandler()
+    handler = AsyncPromptOutputHandler(handler=buffer)
+    handler.print(response=_make_response("fail"))
+    handler.print(response=_make_response("after"))
+
+    assert handler.drain(timeout=5)
+    assert handler.error_count == 1
+    assert isinstance(handler.last_error, OSError)
+    assert "after" in buffer.rendered_str
+    handler.close()
+
+
+def _make_response(message: str = "response"):
+    from wexample_prompt.responses.log_prompt_response import LogPromptResponse
+
+    return LogPromptResponse.create_log(message)
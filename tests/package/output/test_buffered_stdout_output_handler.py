@@ -0,0 +1,63 @@
+"""Tests for PromptBufferedStdoutOutputHandler."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+
+
+def test_output_is_batched_until_flush(capsys) -> None:
+    io = _make_io(flush_interval=None)
+
+    io.info("first")
+    io.info("second")
+    assert capsys.readouterr().out == ""
+
+    io.flush()
+    out = capsys.readouterr().out
+    assert out.index("first") < out.index("second")
+    assert io.output.pending_size == 0
+
+
+def test_size_threshold_triggers_write(capsys) -> None:
+    io = _make_io(flush_interval=None, max_buffer_size=30)
+
+    io.log("short")
+    assert capsys.readouterr().out == ""
+
+    io.log("a line long enough to cross the threshold")
+    assert "short" in capsys.readouterr().out
+
+
+def test_time_threshold_triggers_write(capsys) -> None:
+    import time
+
+    io = _make_io(flush_interval=0.01)
+
+    io.log("delayed")
+    time.sleep(0.2)
+
+    assert "delayed" in capsys.readouterr().out
+
+
+def test_erase_flushes_before_cursor_control(capsys, monkeypatch) -> None:
+    # Cursor control is only written to terminals.
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    io = _make_io(flush_interval=None)
+
+    response = io.log("to erase")
+    io.erase_response(response)
+
+    out = capsys.readouterr().out
+    assert out.index("to erase") < out.index("\x1b[F")
+
+
+def _make_io(**kwargs) -> IoManager:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.prompt_buffered_stdout_output_handler import (
+        PromptBufferedStdoutOutputHandler,
+    )
+
+    return IoManager(output=PromptBufferedStdoutOutputHandler(**kwargs))
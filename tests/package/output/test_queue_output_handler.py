@@ -0,0 +1,225 @@
+"""Tests for QueueOutputHandler and PromptQueueAggregator."""
+
+from __future__ import annotations
+
+
+def test_records_are_batched_and_rendered_by_the_parent() -> None:
+    import queue
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    handler = QueueOutputHandler(
+        queue=channel, worker="w1", batch_size=4, flush_interval=None
+    )
+    worker_io = IoManager(output=handler)
+    for index in range(10):
+        assert worker_io.log(f"line {index}") is not None
+    assert channel.qsize() == 2
+    handler.flush()
+    assert channel.qsize() == 3
+
+    buffer = PromptBufferOutputHandler()
+    aggregator = PromptQueueAggregator(
+        io=IoManager(output=buffer, colorized=False), queue=channel, prefix=True
+    )
+    printed = 0
+    while not channel.empty():
+        printed += aggregator.dispatch(channel.get())
+
+    assert printed == 10
+    assert buffer.rendered == [f"[w1] line {index}" for index in range(10)]
+
+
+def test_styles_survive_the_round_trip() -> None:
+    import queue
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    handler = QueueOutputHandler(queue=channel, flush_interval=None)
+    worker_io = IoManager(output=handler)
+    sent = [worker_io.success("done"), worker_io.warning("careful")]
+    handler.close()
+
+    buffer = PromptBufferOutputHandler()
+    aggregator = PromptQueueAggregator(
+        io=IoManager(output=buffer, colorized=True), queue=channel
+    )
+    # stop() flushes the parent io, which empties the buffer handler.
+    rendered = buffer.rendered
+    with aggregator:
+        pass
+
+    context = PromptContext(colorized=True, width=aggregator.io.terminal_width)
+    assert rendered == [response.render(context=context) for response in sent]
+    assert aggregator._readers == {}
+
+
+def test_worker_processes_forward_through_a_multiprocessing_queue() -> None:
+    import multiprocessing
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+
+    channel = multiprocessing.Queue()
+    buffer = PromptBufferOutputHandler()
+    aggregator = PromptQueueAggregator(
+        io=IoManager(output=buffer, colorized=False), queue=channel, prefix=True
+    )
+    rendered = buffer.rendered
+
+    with aggregator:
+        processes = [
+            multiprocessing.Process(target=_emit, args=(channel, f"p{index}", 500))
+            for index in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+    for index in range(3):
+        prefix = f"[p{index}] "
+        assert [line for line in rendered if line.startswith(prefix)] == [
+            f"{prefix}message {number}" for number in range(500)
+        ]
+    assert len(rendered) == 1500
+    assert aggregator._readers == {}
+
+
+def _emit(channel, worker: str, count: int) -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    io = IoManager(output=QueueOutputHandler(queue=channel, worker=worker))
+    for number in range(count):
+        io.log(f"message {number}")
+
+
+def test_framed_output_and_worker_verbosity_are_forwarded() -> None:
+    import queue
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    handler = QueueOutputHandler(queue=channel, flush_interval=None)
+    worker_io = IoManager(output=handler, default_context_verbosity=VerbosityLevel.HIGH)
+    worker_io.info("boxed", frame="Framed")
+    worker_io.frame(text="inside", title="Box")
+    worker_io.properties(properties={"name": "value"})
+    worker_io.debug("verbose", verbosity=VerbosityLevel.HIGH)
+    worker_io.debug("too verbose", verbosity=VerbosityLevel.MAXIMUM)
+    handler.close()
+
+    buffer = PromptBufferOutputHandler()
+    aggregator = PromptQueueAggregator(
+        io=IoManager(output=buffer, colorized=False), queue=channel
+    )
+    printed = 0
+    while not channel.empty():
+        printed += aggregator.dispatch(channel.get())
+
+    rendered = buffer.rendered
+    assert printed == 4
+    assert len(rendered) == 4
+    assert all(text.strip() for text in rendered)
+    assert "boxed" in rendered[0] and "Framed" in rendered[0] and "╰" in rendered[0]
+    assert "inside" in rendered[1] and "Box" in rendered[1]
+    assert "name" in rendered[2] and "value" in rendered[2]
+    assert "verbose" in rendered[3]
+
+
+def test_failed_batches_are_counted() -> None:
+    import queue
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.common.prompt_queue_aggregator import PromptQueueAggregator
+    from wexample_prompt.output.prompt_buffer_output_handler import (
+        PromptBufferOutputHandler,
+    )
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    io = IoManager(output=PromptBufferOutputHandler())
+    # stop() flushes the buffer: the recorder keeps what was printed.
+    recorded = io.push_recorder()
+    with PromptQueueAggregator(io=io, queue=channel) as aggregator:
+        channel.put(("sender", "worker", '{"not": "a trace"'))
+        handler = QueueOutputHandler(queue=channel, flush_interval=None)
+        IoManager(output=handler).log("after the malformed batch")
+        handler.close()
+
+    assert aggregator.error_count == 1
+    assert aggregator.last_error is not None
+    assert [response.lines[0].segments[0].text for response in recorded] == [
+        "after the malformed batch"
+    ]
+
+
+def test_handler_inherited_through_fork_does_not_wait_for_the_parent_lock() -> None:
+    import os
+    import queue
+    import threading
+
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.output.queue_output_handler import QueueOutputHandler
+
+    channel = queue.SimpleQueue()
+    handler = QueueOutputHandler(queue=channel, worker="w1", flush_interval=None)
+    worker_io = IoManager(output=handler)
+    worker_io.log("parent line")
+
+    # As after a fork while a parent thread held the lock: that thread is
+    # gone, and the pending record belongs to the parent.
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock() -> None:
+        with handler._lock:
+            locked.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_lock, daemon=True)
+    holder.start()
+    locked.wait()
+    handler._pid = os.getpid() + 1
+
+    try:
+        printer = threading.Thread(
+            target=lambda: worker_io.log("child line"), daemon=True
+        )
+        printer.start()
+        printer.join(timeout=5)
+        assert not printer.is_alive()
+        handler.flush()
+    finally:
+        release.set()
+        holder.join()
+
+    sender, worker, chunk = channel.get_nowait()
+    assert sender == f"{os.getpid()}:{id(handler)}"
+    assert "child line" in chunk
+    assert "parent line" not in chunk
+    assert channel.empty()
@@ -17,3 +17,26 @@ class TestLogPromptResponse(AbstractPromptTest):
         assert isinstance(self._io.output, PromptStdoutOutputHandler)
 
         assert isinstance(self._io.echo("Test output handler").rendered_content, str)
+
+
+def test_piped_output_has_no_cursor_control(capsys, monkeypatch) -> None:
+    from wexample_prompt.common.io_manager import IoManager
+    from wexample_prompt.responses.interactive.spinner_prompt_response import (
+        SpinnerPromptResponse,
+    )
+
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    io = IoManager()
+
+    response = io.log("to erase")
+    io.erase_response(response)
+    handle = io.leader_line("step").get_handle()
+    handle.success()
+    spinner = SpinnerPromptResponse.create_spinner(label="working")
+    spinner.render()
+    spinner.log("event")
+    spinner.stop()
+
+    out = capsys.readouterr().out
+    assert "\x1b" not in out and "\r" not in out
+    assert "to erase" in out and "event" in out
@@ -116,3 +116,98 @@ class TestChoicePromptResponse(AbstractPromptResponseTest):
         )
 
         return ChoicePromptResponse
+
+
+def test_frame_is_committed_in_one_synchronized_write(monkeypatch) -> None:
+    import os
+    import sys
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    read_fd, write_fd = os.pipe()
+    stream = open(write_fd, "w", encoding="utf-8")
+    writes = []
+    os_write = os.write
+
+    def write(fd: int, data: bytes) -> int:
+        writes.append(data)
+        return os_write(fd, data)
+
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(os, "write", write)
+    io = IoManager(synchronized_output=True)
+    io.choice(question="Pick", choices=["One", "Two"], predefined_answer="Two")
+    monkeypatch.undo()
+    stream.close()
+    with open(read_fd, encoding="utf-8") as reader:
+        data = reader.read()
+
+    assert len(writes) == 1
+    assert data.startswith("\x1b[?2026h")
+    assert data.endswith("\x1b[?2026l")
+    assert "Pick" in data
+
+
+def test_only_the_window_around_the_selection_is_built(capsys) -> None:
+    import readchar
+
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.interactive.choice_prompt_response import (
+        ChoicePromptResponse,
+    )
+
+    response = ChoicePromptResponse.create_choice(
+        question="Pick one",
+        choices=[f"choice {index}" for index in range(10_000)],
+        viewport_height=5,
+    )
+    keys = iter([readchar.key.DOWN] * 7 + [readchar.key.ENTER])
+    response._read_key = lambda: next(keys)
+    response.render(context=PromptContext(colorized=False))
+    capsys.readouterr()
+
+    assert response.get_answer() == "choice 7"
+    lines = [line.rstrip() for line in response.rendered_content.split("\n")]
+    assert lines[1:8] == [
+        "  ↑ 3 more",
+        "    choice 3",
+        "    choice 4",
+        "    choice 5",
+        "    choice 6",
+        "  › choice 7",
+        "  ↓ 9993 more",
+    ]
+    # Titles are parsed once, and only for the choices that were displayed.
+    assert sorted(response._title_segments) == list(range(8))
+
+
+def test_typed_characters_filter_the_choices(capsys) -> None:
+    import readchar
+
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.interactive.choice_prompt_response import (
+        ChoicePromptResponse,
+    )
+
+    def pick(keys: list[str]) -> ChoicePromptResponse:
+        response = ChoicePromptResponse.create_choice(
+            question="Pick a fruit",
+            choices=["apple", "banana", "mango", "quince"],
+            filterable=True,
+        )
+        typed = iter(keys)
+        response._read_key = lambda: next(typed)
+        response.render(context=PromptContext(colorized=False))
+        capsys.readouterr()
+        return response
+
+    # "q" is typed into the filter instead of aborting.
+    assert pick(["q", "u", readchar.key.ENTER]).get_answer() == "quince"
+    # The shortest title comes first, navigation moves among the matches.
+    response = pick(["a", "n", readchar.key.DOWN, readchar.key.ENTER])
+    assert response.get_answer() == "banana"
+    assert "Filter: an (2 matches)" in response.rendered_content
+    assert "apple" not in response.rendered_content
+    # Backspace widens the filter again, Esc clears it then aborts.
+    keys = ["x", readchar.key.BACKSPACE, "z", readchar.key.ESC, readchar.key.ESC]
+    assert pick(keys).get_answer() is None
@@ -25,23 +25,24 @@ class TestFilePickerPromptResponse(AbstractPromptResponseTest):
         return 3  # question + parent + abort
 
     def test_lists_dirs_and_files_separately_then_merges(self) -> None:
-        from unittest import mock
+        import os
+        import tempfile
 
         from wexample_prompt.responses.interactive.file_picker_prompt_response import (
             FilePickerPromptResponse,
         )
 
-        with mock.patch(
-            "os.listdir", return_value=["dir1", "file1", "dir2", "file2"]
-        ), mock.patch(
-            "os.path.isdir", side_effect=lambda p: p.endswith(("dir1", "dir2"))
-        ):
+        with tempfile.TemporaryDirectory() as base_dir:
+            for name in ["dir1", "dir2"]:
+                os.mkdir(os.path.join(base_dir, name))
+            for name in ["file1", "file2"]:
+                open(os.path.join(base_dir, name), "w").close()
             response = FilePickerPromptResponse.create_file_picker(
-                base_dir="/tmp/base",
+                base_dir=base_dir,
                 question=self._test_message,
                 predefined_answer="dir1",
             )
-        response.render()
+            response.render()
         # dirs should be present (with a leading space label per implementation)
         self._assert_contains_text(response.rendered_content, " dir1")
         self._assert_contains_text(response.rendered_content, " dir2")
@@ -97,3 +98,102 @@ class TestFilePickerPromptResponse(AbstractPromptResponseTest):
         )
 
         return FilePickerPromptResponse
+
+
+def test_directories_are_listed_with_scandir(tmp_path, monkeypatch) -> None:
+    import os
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.interactive.file_picker_prompt_response import (
+        FilePickerPromptResponse,
+    )
+
+    for name in ["beta", "Alpha"]:
+        (tmp_path / name).mkdir()
+    for name in ["b.txt", "A.txt"]:
+        (tmp_path / name).write_text("")
+
+    def isdir(path: str) -> bool:
+        raise AssertionError("entry types come from scandir")
+
+    monkeypatch.setattr(os.path, "isdir", isdir)
+    monkeypatch.setattr(DirectoryListingCache, "_shared_instance", None)
+    response = FilePickerPromptResponse.create_file_picker(
+        base_dir=str(tmp_path), predefined_answer="Alpha", abort=False
+    )
+    response.render(context=PromptContext(colorized=False))
+
+    lines = [line.strip() for line in response.rendered_content.split("\n")]
+    assert lines[1:5] == ["› 📁 Alpha", "📁 beta", "A.txt", "b.txt"]
+
+
+def test_entries_are_listed_while_the_prompt_is_shown(tmp_path, monkeypatch) -> None:
+    import time
+
+    import readchar
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.interactive.file_picker_prompt_response import (
+        FilePickerPromptResponse,
+    )
+
+    for index in range(2000):
+        (tmp_path / f"file_{index:04}").write_text("")
+    monkeypatch.setattr(DirectoryListingCache, "_shared_instance", None)
+    response = FilePickerPromptResponse.create_file_picker(
+        base_dir=str(tmp_path), abort=False
+    )
+    frames = []
+    keys = iter([readchar.key.END, readchar.key.ENTER])
+
+    def read_key() -> str:
+        # Wait for the listing to complete before navigating.
+        deadline = time.monotonic() + 5
+        while "Loading…" in response.rendered_content:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        frames.append(response.rendered_content)
+        return next(keys)
+
+    response._read_key = read_key
+    response.render(context=PromptContext(colorized=False))
+
+    assert response.get_answer() == "file_1999"
+    assert len(response.choices) == 2000
+    assert "↓ " in frames[0]
+
+
+def test_choices_before_rendering(tmp_path, monkeypatch) -> None:
+    import os
+
+    from wexample_prompt.common.file_picker.directory_listing_cache import (
+        DirectoryListingCache,
+    )
+    from wexample_prompt.responses.interactive.file_picker_prompt_response import (
+        FilePickerPromptResponse,
+    )
+
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "file.txt").write_text("")
+    # Freshly modified directories are not cached.
+    os.utime(tmp_path, ns=(0, 1_000_000_000))
+    monkeypatch.setattr(DirectoryListingCache, "_shared_instance", None)
+
+    # Not cached: listed when rendering, only the abort option until then.
+    response = FilePickerPromptResponse.create_file_picker(base_dir=str(tmp_path))
+    assert [choice.title for choice in response.choices] == ["Abort"]
+
+    # Cached: the entries are there right away.
+    DirectoryListingCache.shared().read(str(tmp_path))
+    response = FilePickerPromptResponse.create_file_picker(base_dir=str(tmp_path))
+    assert [choice.title for choice in response.choices] == [
+        "📁 folder",
+        "file.txt",
+        "Abort",
+    ]
@@ -160,3 +160,28 @@ class TestScreenPromptResponse(AbstractPromptResponseTest):
         )
 
         return ScreenPromptResponse
+
+
+def test_frames_accumulate_without_clear(capsys) -> None:
+    from wexample_prompt.common.prompt_context import PromptContext
+    from wexample_prompt.responses.interactive.screen_prompt_response import (
+        ScreenPromptResponse,
+    )
+
+    ticks = {"n": 0}
+
+    def _cb(resp: ScreenPromptResponse) -> None:
+        ticks["n"] += 1
+        resp.print(f"tick {ticks['n']}")
+        if ticks["n"] < 3:
+            resp.reload()
+        else:
+            resp.close()
+
+    response = ScreenPromptResponse.create_screen(callback=_cb, height=5)
+    response.render(context=PromptContext(colorized=False))
+    capsys.readouterr()
+
+    # Lines printed by each frame stay on screen, the render cache follows.
+    lines = [line.strip() for line in response.rendered_content.split("\n")]
+    assert [line for line in lines if line] == ["tick 1", "tick 2", "tick 3"]